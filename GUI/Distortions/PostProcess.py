@@ -0,0 +1,532 @@
+import re
+import time
+from pathlib import Path
+import numpy as np
+import moderngl
+
+SHADER_DIR = Path(__file__).parent
+COMPOSITE_DIR = SHADER_DIR.parent / "ThreeDee" / "shaders"
+
+# Post-processing stages in the order they are applied: (name, fragment shader path)
+STAGES = [
+    ("composite", COMPOSITE_DIR / "composite.frag"),
+    ("distortion", SHADER_DIR / "distortion.frag"),
+    ("lighting", SHADER_DIR / "lighting.frag"),
+    ("barrel", SHADER_DIR / "barrel.frag"),
+]
+VERTEX_SHADER = SHADER_DIR / "distortion.vert"
+SCROLL_LAYER_SHADER = SHADER_DIR / "scroll_layer.frag"
+COMPOSITE_VERTEX_SHADER = COMPOSITE_DIR / "composite.vert"
+
+# Fullscreen quad (x, y, u, v) drawn as a triangle strip
+QUAD_VERTICES = np.array([
+    -1.0,  1.0, 0.0, 1.0,
+    -1.0, -1.0, 0.0, 0.0,
+     1.0,  1.0, 1.0, 1.0,
+     1.0, -1.0, 1.0, 0.0
+], dtype='f4')
+
+
+def create_standalone_context():
+    """Offscreen moderngl context, falls back to EGL when there is no X display"""
+    try:
+        return moderngl.create_standalone_context()
+    except Exception:
+        return moderngl.create_standalone_context(backend='egl')
+
+
+def _read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def _split_functions(source):
+    """Split GLSL source into (top-level text, {function name: function text})"""
+    functions = {}
+    rest = []
+    pos = 0
+    header = re.compile(r'^[ \t]*(\w+)\s+(\w+)\s*\(([^)]*)\)\s*\{', re.M)
+    while True:
+        match = header.search(source, pos)
+        if match is None:
+            rest.append(source[pos:])
+            break
+        rest.append(source[pos:match.start()])
+        # Find the matching closing brace
+        depth = 0
+        end = match.end() - 1
+        for end in range(match.end() - 1, len(source)):
+            if source[end] == '{':
+                depth += 1
+            elif source[end] == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+        functions[match.group(2)] = source[match.start():end + 1]
+        pos = end + 1
+    return "".join(rest), functions
+
+
+def build_fused_shader(stages):
+    """
+    Generate one fragment shader that runs the given post-processing stages in a single pass.
+
+    Every stage's main() is turned into a function `vec4 <name>_stage(vec2 uv)`. Where a stage
+    samples the previous pass (`texture(tex, p)`) it calls the previous stage's function at p
+    instead, so the intermediate framebuffers are never written. Helper functions get a stage
+    prefix and uniforms with the same name are shared (e.g. `time`).
+
+    Args:
+        stages: Names from STAGES to include, in any order (pipeline order is kept)
+
+    Returns:
+        Fragment shader source (use with distortion.vert)
+    """
+    enabled = [(name, path) for name, path in STAGES if name in stages]
+    if not enabled:
+        raise ValueError("At least one post-processing stage must be enabled")
+
+    uniforms = {}  # name -> declaration
+    bodies = []
+    previous = None
+
+    if enabled[0][0] != "composite":
+        # No composite pass, first stage samples the GUI texture directly
+        uniforms["tex"] = "uniform sampler2D tex;"
+        bodies.append("vec4 source_stage(vec2 p) {\n    return texture(tex, p);\n}")
+        previous = "source_stage"
+
+    for name, path in enabled:
+        source = _read(path)
+        source = re.sub(r'^\s*#version.*$', '', source, flags=re.M)
+
+        # Interface declarations are replaced by function parameters / return values
+        input_var = re.search(r'^\s*in\s+vec2\s+(\w+)\s*;', source, re.M).group(1)
+        output_var = re.search(r'^\s*out\s+vec4\s+(\w+)\s*;', source, re.M).group(1)
+        source = re.sub(r'^\s*(in|out)\s+\w+\s+\w+\s*;.*$', '', source, flags=re.M)
+
+        # Collect uniforms, the previous pass texture is not needed anymore
+        for match in re.finditer(r'^\s*uniform\s+(\w+)\s+(\w+)\s*;.*$', source, re.M):
+            u_type, u_name = match.group(1), match.group(2)
+            if u_name == "tex" and u_type == "sampler2D":
+                continue
+            uniforms.setdefault(u_name, f"uniform {u_type} {u_name};")
+        source = re.sub(r'^\s*uniform\s+\w+\s+\w+\s*;.*$', '', source, flags=re.M)
+
+        # Sampling the previous pass becomes a call of the previous stage
+        if previous is not None:
+            source = re.sub(r'\btexture\s*\(\s*tex\s*,', f'{previous}(', source)
+
+        _, functions = _split_functions(source)
+        for func_name in functions:
+            if func_name != "main":
+                source = re.sub(rf'\b{func_name}\s*\(', f'{name}_{func_name}(', source)
+        _, functions = _split_functions(source)
+
+        for func_name, func in functions.items():
+            if func_name == "main":
+                func = re.sub(r'void\s+main\s*\(\s*\)\s*\{',
+                              f'vec4 {name}_stage(vec2 {input_var}) {{\n    vec4 {output_var} = vec4(0.0);',
+                              func, count=1)
+                func = re.sub(r'\breturn\s*;', f'return {output_var};', func)
+                func = func[:func.rfind('}')] + f"    return {output_var};\n}}"
+            bodies.append(func)
+        previous = f"{name}_stage"
+
+    return "\n".join([
+        "#version 330",
+        "// Generated by GUI/Distortions/PostProcess.py from: " + ", ".join(n for n, _ in enabled),
+        *uniforms.values(),
+        "in vec2 uv;",
+        "out vec4 fragColor;",
+        *bodies,
+        f"void main() {{\n    fragColor = {previous}(uv);\n}}",
+        "",
+    ])
+
+
+def _blit(ctx, target, texture, framebuffers):
+    """Copy a texture into a framebuffer without a shader pass (framebuffers caches the source fbo)"""
+    if texture.glo not in framebuffers:
+        framebuffers[texture.glo] = ctx.framebuffer(color_attachments=[texture])
+    ctx.copy_framebuffer(target, framebuffers[texture.glo])
+
+
+class ScrollLayer:
+    def __init__(self, ctx, vbo):
+        """
+        Draws the content texture of a GPU scrolled table (ScrollingTableVertical) into the
+        GUI texture before post-processing, so scrolling only moves a uv offset.
+
+        Only the table rect is drawn, blended under the GUI that is already in the texture
+        (ONE_MINUS_DST_ALPHA, DST_ALPHA): the GUI is transparent where the table left a hole
+        for its content and anything drawn over the table stays on top.
+
+        :param ctx: ModernGL context
+        :param vbo: Fullscreen quad buffer (QUAD_VERTICES)
+        """
+        self.ctx = ctx
+        self.program = ctx.program(vertex_shader=_read(VERTEX_SHADER), fragment_shader=_read(SCROLL_LAYER_SHADER))
+        self.program['tex_scroll'] = 0
+        self.vao = ctx.simple_vertex_array(self.program, vbo, 'in_vert', 'in_uv')
+        self._framebuffers = {}  # GUI texture glo -> framebuffer drawing into it
+
+    def draw(self, tex_gui, tex_scroll, uniforms):
+        """
+        :param tex_gui: GUI texture (uploaded bottom row first)
+        :param tex_scroll: Table content texture
+        :param uniforms: Needs scroll_rect (x, y, width, height in GUI pixels, top-left origin),
+            scroll_uv and scroll_bg (see ScrollingTableVertical.scroll_uniforms)
+        """
+        if tex_gui.glo not in self._framebuffers:
+            self._framebuffers[tex_gui.glo] = self.ctx.framebuffer(color_attachments=[tex_gui])
+        x, y, width, height = uniforms['scroll_rect']
+        self._framebuffers[tex_gui.glo].use()
+        self.ctx.viewport = (x, tex_gui.size[1] - y - height, width, height)
+        tex_scroll.use(0)
+        _set_uniforms(self.program, uniforms)
+        self.ctx.enable(moderngl.BLEND)
+        self.ctx.blend_func = moderngl.ONE_MINUS_DST_ALPHA, moderngl.DST_ALPHA, moderngl.ONE, moderngl.ONE
+        self.vao.render(moderngl.TRIANGLE_STRIP)
+        self.ctx.blend_func = moderngl.DEFAULT_BLENDING
+        self.ctx.disable(moderngl.BLEND)
+
+
+def _set_uniforms(program, uniforms):
+    """Write uniform values the program actually uses (unused ones are optimised out)"""
+    for name, value in uniforms.items():
+        if name in program:
+            program[name].value = value
+
+
+# Quality tiers, best first: pass name -> (enabled, resolution scale).
+# The composite pass always runs, it combines the GUI and 3D inputs.
+QUALITY_TIERS = [
+    ("high", {"composite": (True, 1.0), "distortion": (True, 1.0), "lighting": (True, 1.0), "barrel": (True, 1.0)}),
+    ("medium", {"composite": (True, 1.0), "distortion": (True, 0.5), "lighting": (True, 1.0), "barrel": (True, 1.0)}),
+    ("low", {"composite": (True, 1.0), "distortion": (True, 0.5), "lighting": (True, 0.5), "barrel": (False, 1.0)}),
+    ("minimal", {"composite": (True, 1.0), "distortion": (False, 1.0), "lighting": (False, 1.0), "barrel": (False, 1.0)}),
+]
+
+
+class PostProcessPipeline:
+    def __init__(self, ctx, size, tier="high", budget_ms=None, auto_tier=True, window=30, timing=True):
+        """
+        Configurable version of the original chain: composite -> distortion -> lighting -> barrel,
+        each pass rendering a fullscreen quad into its own framebuffer.
+
+        Passes can be disabled or run at a reduced resolution (the next pass samples the
+        smaller texture with linear filtering, i.e. it gets upscaled). The last enabled pass
+        always draws at full size into the target.
+
+        Every pass is measured with a GL timer query. Queries are double buffered and read one
+        frame late, so reading them doesn't wait for the GPU. With auto_tier, the pipeline drops
+        to the next cheaper tier when the average GPU time over `window` frames exceeds budget_ms.
+        It never climbs back up on its own, use set_tier() for that.
+
+        :param ctx: ModernGL context
+        :param size: (width, height) of the output
+        :param tier: Starting tier name from QUALITY_TIERS
+        :param budget_ms: GPU time per frame allowed for post-processing (None disables auto tiers)
+        :param auto_tier: Drop tiers automatically when over budget
+        :param window: Number of measured frames averaged before deciding on a tier change
+        :param timing: Measure passes with timer queries
+        """
+        self.ctx = ctx
+        self.size = size
+        self.budget_ms = budget_ms
+        self.auto_tier = auto_tier
+        self.window = window
+        self.vbo = ctx.buffer(QUAD_VERTICES.tobytes())
+
+        vertex_shader = _read(VERTEX_SHADER)
+        self.programs = {}
+        self.vaos = {}
+        for name, path in STAGES:
+            vert = _read(COMPOSITE_VERTEX_SHADER) if name == "composite" else vertex_shader
+            self.programs[name] = ctx.program(vertex_shader=vert, fragment_shader=_read(path))
+            self.vaos[name] = ctx.simple_vertex_array(self.programs[name], self.vbo, 'in_vert', 'in_uv')
+        self.programs["composite"]['tex_gui'] = 0
+        self.programs["composite"]['tex_3d'] = 1
+        self.scroll_layer = ScrollLayer(ctx, self.vbo)
+
+        # Per pass: {"enabled", "scale", "texture", "framebuffer"} (texture created on demand)
+        self.passes = {name: {"enabled": True, "scale": 1.0, "texture": None, "framebuffer": None}
+                       for name, _ in STAGES}
+
+        # Timer queries, two sets used on alternate frames
+        self.timing = timing
+        self.queries = [{}, {}]
+        if timing:
+            try:
+                self.queries = [{name: ctx.query(time=True) for name, _ in STAGES} for _ in range(2)]
+            except Exception as e:
+                print(f"GPU timer queries not available: {e}")
+                self.timing = False
+        self._frame = 0
+        self._pending = None  # (query set, pass names) rendered last frame
+        self.last_timings = {}  # pass name -> ms of the last measured frame
+        self.samples = []  # total GPU ms of recent frames
+        self.tier_changes = []  # (frame, old tier, new tier, average ms)
+        self._blit_sources = {}
+
+        self.set_tier(tier)
+
+    # === Configuration ===
+    def set_pass(self, name, enabled=None, scale=None):
+        """
+        Change one pass.
+
+        :param name: Pass name from STAGES
+        :param enabled: Run the pass (composite can't be disabled)
+        :param scale: Resolution factor of the pass output, e.g. 0.5 for half-res
+        """
+        if name not in self.passes:
+            raise ValueError(f"Unknown post-processing pass: {name}")
+        config = self.passes[name]
+        if enabled is not None:
+            if name == "composite" and not enabled:
+                raise ValueError("The composite pass can't be disabled")
+            config["enabled"] = enabled
+        if scale is not None and scale != config["scale"]:
+            if not 0.0 < scale <= 1.0:
+                raise ValueError(f"Pass scale must be in (0, 1], got {scale}")
+            config["scale"] = scale
+            if config["texture"] is not None:
+                config["framebuffer"].release()
+                config["texture"].release()
+                config["texture"] = config["framebuffer"] = None
+
+    def set_tier(self, tier):
+        """Apply a tier from QUALITY_TIERS by name"""
+        tiers = dict(QUALITY_TIERS)
+        if tier not in tiers:
+            raise ValueError(f"Unknown quality tier: {tier}")
+        for name, (enabled, scale) in tiers[tier].items():
+            self.set_pass(name, enabled=enabled, scale=scale)
+        self.tier = tier
+        self.samples.clear()
+        # Ignore the frame still in flight and the first one with new framebuffers
+        self._skip = 2
+
+    def _output(self, name):
+        """Framebuffer, texture and size of an intermediate pass"""
+        config = self.passes[name]
+        size = (max(1, int(self.size[0] * config["scale"])), max(1, int(self.size[1] * config["scale"])))
+        if config["texture"] is None:
+            config["texture"] = self.ctx.texture(size, 3)
+            config["texture"].repeat_x = False
+            config["texture"].repeat_y = False
+            config["framebuffer"] = self.ctx.framebuffer(color_attachments=[config["texture"]])
+        return config["framebuffer"], config["texture"], size
+
+    # === Rendering ===
+    def render(self, target, tex_gui, tex_3d, uniforms, tex_scroll=None):
+        """
+        Run the enabled passes, the last one draws into target.
+
+        :param target: Framebuffer receiving the final image (e.g. ctx.screen)
+        :param tex_gui: Texture with the pygame GUI surface (uploaded bottom row first)
+        :param tex_3d: Texture with the 3D framebuffer, None if nothing 3D is on screen
+            (the composite pass is skipped and the next pass samples tex_gui directly)
+        :param uniforms: Dict of uniform name -> value shared by all passes
+        :param tex_scroll: Content texture of a GPU scrolled table, drawn into tex_gui first (see ScrollLayer)
+        """
+        if tex_scroll is not None:
+            self.scroll_layer.draw(tex_gui, tex_scroll, uniforms)
+        enabled = [name for name, _ in STAGES if self.passes[name]["enabled"]]
+        if tex_3d is None:
+            enabled.remove("composite")
+            if not enabled:
+                # Nothing to process, copy the GUI straight into the target
+                _blit(self.ctx, target, tex_gui, self._blit_sources)
+
+        queries = self.queries[self._frame % 2]
+        previous = tex_gui
+        for i, name in enumerate(enabled):
+            if i == len(enabled) - 1:
+                output, size = target, self.size
+            else:
+                output, texture, size = self._output(name)
+            output.use()
+            self.ctx.viewport = (0, 0, size[0], size[1])
+            if name == "composite":
+                tex_gui.use(0)
+                tex_3d.use(1)
+            else:
+                previous.use(0)
+            _set_uniforms(self.programs[name], uniforms)
+            if self.timing:
+                with queries[name]:
+                    self.vaos[name].render(moderngl.TRIANGLE_STRIP)
+            else:
+                self.vaos[name].render(moderngl.TRIANGLE_STRIP)
+            if i < len(enabled) - 1:
+                previous = texture
+
+        if self.timing:
+            # Read last frame's queries, this frame's are still in flight
+            if self._pending is not None:
+                self._collect(*self._pending)
+            else:
+                self.last_timings = {}
+            self._pending = (queries, enabled) if enabled else None
+        self._frame += 1
+
+    def _collect(self, queries, names):
+        self.last_timings = {name: queries[name].elapsed / 1e6 for name in names}
+        if self._skip > 0:
+            self._skip -= 1
+            return
+        self.samples.append(sum(self.last_timings.values()))
+        if len(self.samples) > self.window:
+            self.samples.pop(0)
+        if self.auto_tier and self.budget_ms is not None and len(self.samples) == self.window:
+            average = sum(self.samples) / len(self.samples)
+            if average > self.budget_ms:
+                self.drop_tier(average)
+
+    def drop_tier(self, average_ms=None):
+        """Switch to the next cheaper tier. Returns False if already at the cheapest one"""
+        names = [name for name, _ in QUALITY_TIERS]
+        index = names.index(self.tier)
+        if index == len(names) - 1:
+            return False
+        self.tier_changes.append((self._frame, self.tier, names[index + 1], average_ms))
+        self.set_tier(names[index + 1])
+        return True
+
+    # === Reporting ===
+    def gpu_time(self):
+        """Average GPU time in ms per frame over the recent window"""
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    def format_report(self):
+        """Human readable GPU timings and tier changes"""
+        if not self.timing:
+            return f"Post-processing tier: {self.tier} (no GPU timing)"
+        passes = ", ".join(f"{name} {ms:.2f} ms" for name, ms in self.last_timings.items())
+        lines = [f"Post-processing tier: {self.tier}, GPU {self.gpu_time():.2f} ms ({passes})"]
+        for frame, old, new, average in self.tier_changes:
+            lines.append(f"  frame {frame}: {old} -> {new} (average {average:.2f} ms)")
+        return "\n".join(lines)
+
+
+class FusedPostProcess:
+    def __init__(self, ctx, size, composite=True, distortion=True, lighting=True, barrel=True):
+        """
+        Single-pass version of PostProcessPipeline (at the "high" tier). The shader is generated by
+        build_fused_shader() from the same .frag files, so both paths stay in sync.
+        Stages can be toggled; one program is compiled (and cached) per combination.
+
+        :param ctx: ModernGL context
+        :param size: (width, height) of the output
+        """
+        self.ctx = ctx
+        self.size = size
+        self.vbo = ctx.buffer(QUAD_VERTICES.tobytes())
+        self.vertex_shader = _read(VERTEX_SHADER)
+        self._cache = {}  # stage tuple -> (program, vao)
+        self._blit_sources = {}
+        self.scroll_layer = ScrollLayer(ctx, self.vbo)
+        self.set_stages(composite=composite, distortion=distortion, lighting=lighting, barrel=barrel)
+
+    def set_stages(self, **toggles):
+        """Enable/disable stages by name, e.g. set_stages(distortion=False)"""
+        current = getattr(self, 'stages', tuple(name for name, _ in STAGES))
+        enabled = {name: name in current for name, _ in STAGES}
+        for name, value in toggles.items():
+            if name not in enabled:
+                raise ValueError(f"Unknown post-processing stage: {name}")
+            enabled[name] = value
+        self.stages = tuple(name for name, _ in STAGES if enabled[name])
+        if self.stages:
+            self._get_program(self.stages)  # compile now rather than on the next frame
+
+    def _get_program(self, stages):
+        """Compile (once) the fused program for a stage tuple"""
+        if stages not in self._cache:
+            program = self.ctx.program(
+                vertex_shader=self.vertex_shader,
+                fragment_shader=build_fused_shader(stages)
+            )
+            vao = self.ctx.simple_vertex_array(program, self.vbo, 'in_vert', 'in_uv')
+            self._cache[stages] = (program, vao)
+        return self._cache[stages]
+
+    def render(self, target, tex_gui, tex_3d, uniforms, tex_scroll=None):
+        """Same interface as PostProcessPipeline.render"""
+        if tex_scroll is not None:
+            self.scroll_layer.draw(tex_gui, tex_scroll, uniforms)
+        stages = self.stages
+        if tex_3d is None:
+            stages = tuple(name for name in stages if name != "composite")
+        if not stages:
+            _blit(self.ctx, target, tex_gui, self._blit_sources)
+            return
+        program, vao = self._get_program(stages)
+
+        target.use()
+        self.ctx.viewport = (0, 0, self.size[0], self.size[1])
+        tex_gui.use(0)
+        if "composite" in stages:
+            tex_3d.use(1)
+            _set_uniforms(program, {'tex_gui': 0, 'tex_3d': 1})
+        else:
+            _set_uniforms(program, {'tex': 0})
+        _set_uniforms(program, uniforms)
+        vao.render(moderngl.TRIANGLE_STRIP)
+
+
+def benchmark(ctx, size=(800, 480), frames=200):
+    """
+    Compare time per frame of the multi-pass and the fused path (plus every quality tier).
+    gpu_ms comes from GL timer queries, wall_ms is measured around the whole
+    run with ctx.finish() (some drivers report timer queries poorly).
+
+    Returns:
+        Dict of path name -> {"gpu_ms": float, "wall_ms": float} per frame
+    """
+    rng = np.random.default_rng(0)
+    tex_gui = ctx.texture(size, 4, rng.integers(0, 255, (size[1], size[0], 4), dtype='u1').tobytes())  # RGBA like main.py
+    tex_3d = ctx.texture(size, 4, rng.integers(0, 255, (size[1], size[0], 4), dtype='u1').tobytes())
+    target = ctx.framebuffer(color_attachments=[ctx.texture(size, 3)])
+    uniforms = {
+        'time': 0.0, 'intensity': 0.2,
+        'elem_pos': (0.0, 0.0), 'elem_size': (0.4, 0.9),
+        'focus_pos': (0.3, 0.3), 'focus_size': (0.1, 0.1),
+        'clip_pos': (0.0, 0.0), 'clip_size': (1.0, 1.0),
+    }
+
+    paths = {
+        "multi-pass": PostProcessPipeline(ctx, size, timing=False),
+        "fused": FusedPostProcess(ctx, size),
+    }
+    for tier, _ in QUALITY_TIERS[1:]:  # "high" is the multi-pass path
+        paths[f"tier {tier}"] = PostProcessPipeline(ctx, size, tier=tier, timing=False)
+    results = {}
+    for name, path in paths.items():
+        path.render(target, tex_gui, tex_3d, uniforms)  # warm up (shader compile, first upload)
+        ctx.finish()
+        query = ctx.query(time=True)
+        total_ns = 0
+        start = time.perf_counter()
+        for i in range(frames):
+            uniforms['time'] = i / 30.0
+            with query:
+                path.render(target, tex_gui, tex_3d, uniforms)
+            total_ns += query.elapsed
+        ctx.finish()
+        results[name] = {
+            "gpu_ms": total_ns / frames / 1e6,
+            "wall_ms": (time.perf_counter() - start) / frames * 1000,
+        }
+    return results
+
+
+# Example usage
+if __name__ == "__main__":
+    ctx = create_standalone_context()
+    print(f"Renderer: {ctx.info['GL_RENDERER']}")
+    for name, result in benchmark(ctx).items():
+        print(f"{name:>12}: {result['gpu_ms']:.3f} ms GPU, {result['wall_ms']:.3f} ms wall per frame")
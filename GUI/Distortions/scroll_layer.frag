@@ -0,0 +1,16 @@
+#version 330
+// Draws a GPU scrolled table's content under the GUI texture (see PostProcess.ScrollLayer).
+// Runs with the viewport set to the table rect and blends with the GUI already in the texture:
+// where the GUI is transparent (the hole the table left) the content shows through.
+
+in vec2 uv;
+out vec4 fragColor;
+
+uniform sampler2D tex_scroll;  // content texture, top row first
+uniform vec2 scroll_uv;        // (scroll offset, viewport height) as a fraction of the texture height
+uniform vec3 scroll_bg;        // GUI background the table is drawn on
+
+void main() {
+    vec4 content = texture(tex_scroll, vec2(uv.x, scroll_uv.x + (1.0 - uv.y) * scroll_uv.y));
+    fragColor = vec4(mix(scroll_bg, content.rgb, content.a), 1.0);
+}
@@ -0,0 +1,218 @@
+import math
+
+# Side of the square buckets the element rects are sorted into (px)
+BUCKET_SIZE = 64
+# Distance along the direction counts this much more than the offset across it (both squared):
+# the next row of a table beats something straight above it further away
+ALONG_WEIGHT = 13
+
+# Direction -> (axis along it, sign): x/y grow right/down
+_DIRECTIONS = {
+    "up": (1, -1),
+    "down": (1, 1),
+    "left": (0, -1),
+    "right": (0, 1),
+}
+
+
+class FocusIndex:
+    def __init__(self, menu):
+        """
+        Spatial index over the selectable elements of a menu, resolves arrow key navigation
+        at keypress time (see find) instead of a hand-wired neighbor graph.
+
+        Each panel of the menu has a grid of buckets over its elements' rects. The grids are
+        synced lazily on find(): panels added to or removed from the menu are picked up, and
+        within a panel only elements that were added, removed, moved or resized are re-bucketed.
+
+        The nearest element within the panel of the element navigated from wins, other panels
+        are only searched when there's none in the direction.
+
+        Elements of scrolling tables are indexed where they sit in the table's content
+        (ScrollingTableVertical positions rows without the scroll offset), the offset is applied
+        when searching. From outside a scrolling table only its visible rows can be reached.
+
+        Parameters:
+            menu (Menu): Menu whose panels are indexed
+        """
+        self.menu = menu
+        self._grids = {}  # id(panel) -> _PanelGrid
+
+    def find(self, element, direction):
+        """
+        The selectable element nearest to element in a direction, None if there isn't one.
+
+        Parameters:
+            element (Element): Element navigated from (any element of the menu)
+            direction (str): "up", "down", "left" or "right"
+        """
+        self.sync()
+        axis, sign = _DIRECTIONS[direction]
+        source_panel = element.parent_panel
+        source = _screen_rect(element, source_panel)
+        # The focus leaves a panel only at its edges, like moving through a table row by row
+        own = self._grids.get(id(source_panel))
+        if own is not None and own.panel is source_panel:
+            found, _ = own.nearest(_to_grid(source, own.panel), axis, sign, element, None, None)
+            if found is not None:
+                return found
+        best, best_score = None, None
+        for grid in self._grids.values():
+            if grid.panel is source_panel:
+                continue
+            clip = None
+            offset = _scroll_offset(grid.panel)
+            if offset is not None:
+                # Only the visible rows of a scrolling table can be entered
+                clip = (grid.panel.y + offset, grid.panel.y + offset + grid.panel.height)
+            found, score = grid.nearest(_to_grid(source, grid.panel), axis, sign, element, clip, best_score)
+            if found is not None:
+                best, best_score = found, score
+        return best
+
+    def sync(self):
+        """Index the panels currently in the menu, re-bucketing only what changed"""
+        panels = {id(panel): panel for panel in self.menu.panels if getattr(panel, "navigable", True)}
+        for key in [key for key in self._grids if key not in panels]:
+            del self._grids[key]
+        for key, panel in panels.items():
+            grid = self._grids.get(key)
+            if grid is None or grid.panel is not panel:
+                grid = self._grids[key] = _PanelGrid(panel)
+            grid.sync(panel.getElements())
+
+
+class _PanelGrid:
+    """Buckets of BUCKET_SIZE px holding the selectable elements of one panel"""
+
+    def __init__(self, panel):
+        self.panel = panel
+        self._rects = {}  # id(element) -> (element, rect), rect is (left, top, right, bottom)
+        self._buckets = {}  # (column, row) -> set of ids of the elements overlapping it
+
+    def sync(self, elements):
+        current = {}
+        for element in elements:
+            if element.selectable:
+                current[id(element)] = element
+        for key in [key for key in self._rects if key not in current]:
+            self._remove(key)
+        for key, element in current.items():
+            rect = (element.x, element.y, element.x + element.width, element.y + element.height)
+            indexed = self._rects.get(key)
+            if indexed is not None and indexed[1] == rect:
+                continue
+            if indexed is not None:
+                self._remove(key)
+            self._rects[key] = (element, rect)
+            for bucket in _buckets_of(rect):
+                self._buckets.setdefault(bucket, set()).add(key)
+
+    def _remove(self, key):
+        _, rect = self._rects.pop(key)
+        for bucket in _buckets_of(rect):
+            ids = self._buckets.get(bucket)
+            if ids is not None:
+                ids.discard(key)
+                if not ids:
+                    del self._buckets[bucket]
+
+    def nearest(self, source, axis, sign, exclude, clip, best_score):
+        """
+        Best candidate beyond source in the direction, if it beats best_score.
+        Buckets are visited in rings of growing distance along the direction until no
+        unvisited bucket can hold a better candidate.
+
+        Parameters:
+            source (tuple): (left, top, right, bottom) in this grid's coordinates
+            axis (int): 0 for left/right, 1 for up/down
+            sign (int): -1 towards smaller coordinates, 1 towards larger ones
+            exclude (Element): Element navigated from
+            clip (tuple): (top, bottom) the centers of candidates have to lie within, None for all
+            best_score (float): Score of the best candidate of other panels, None if none yet
+
+        Returns:
+            (element, score) of the better candidate, (None, best_score) otherwise
+        """
+        if not self._rects:
+            return None, best_score
+        best = None
+        columns, rows = zip(*self._buckets)
+        lowest, highest = (min(columns), max(columns)) if axis == 0 else (min(rows), max(rows))
+        cross_lowest, cross_highest = (min(rows), max(rows)) if axis == 0 else (min(columns), max(columns))
+        # Edge of the source facing the direction, in buckets
+        edge = source[axis + 2] if sign > 0 else source[axis]
+        start = math.floor(edge / BUCKET_SIZE)
+        # Half the source may overlap a candidate, so the ring of the source's center is the first
+        center = (source[axis] + source[axis + 2]) / 2
+        ring = math.floor(center / BUCKET_SIZE)
+        ring = max(ring, lowest) if sign > 0 else min(ring, highest)
+        seen = set()
+        while lowest <= ring <= highest:
+            distance = max(0, (ring - start) * sign - 1) * BUCKET_SIZE
+            if best_score is not None and ALONG_WEIGHT * distance * distance > best_score:
+                break
+            for cross in range(cross_lowest, cross_highest + 1):
+                bucket = (ring, cross) if axis == 0 else (cross, ring)
+                for key in self._buckets.get(bucket, ()):
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    element, rect = self._rects[key]
+                    if element is exclude:
+                        continue
+                    if clip is not None and not clip[0] <= (rect[1] + rect[3]) / 2 <= clip[1]:
+                        continue
+                    score = _score(source, rect, axis, sign)
+                    if score is not None and (best_score is None or score < best_score):
+                        best, best_score = element, score
+            ring += sign
+        return best, best_score
+
+
+def _score(source, rect, axis, sign):
+    """
+    Weighted squared distance of a candidate rect, lower is better, None if the candidate
+    isn't in the direction. It may overlap the source by up to half its size.
+    """
+    cross = 1 - axis
+    if sign > 0:
+        gap = rect[axis] - source[axis + 2]
+    else:
+        gap = source[axis] - rect[axis + 2]
+    overlap_allowed = min(source[axis + 2] - source[axis], rect[axis + 2] - rect[axis]) / 2
+    if gap < -overlap_allowed:
+        return None
+    source_center = (source[axis] + source[axis + 2]) / 2
+    rect_center = (rect[axis] + rect[axis + 2]) / 2
+    if (rect_center - source_center) * sign <= 0:
+        return None
+    # Menus stack horizontal bars: left/right stay within the rows the source covers (rows that
+    # only touch it don't count), up/down may go sideways to whatever is nearest in the next bar
+    if axis == 0 and not (rect[1] < source[3] and source[1] < rect[3]):
+        return None
+    along = max(0, gap)
+    cross_offset = (rect[cross] + rect[cross + 2]) / 2 - (source[cross] + source[cross + 2]) / 2
+    return ALONG_WEIGHT * along * along + cross_offset * cross_offset
+
+
+def _buckets_of(rect):
+    left, top, right, bottom = (math.floor(value / BUCKET_SIZE) for value in rect)
+    return [(column, row) for column in range(left, right + 1) for row in range(top, bottom + 1)]
+
+
+def _scroll_offset(panel):
+    """Scroll offset of a scrolling table, None for panels that don't scroll"""
+    return getattr(panel, "scroll_offset", None)
+
+
+def _to_grid(rect, panel):
+    """A screen rect in the coordinates panel's grid is kept in"""
+    offset = _scroll_offset(panel) or 0
+    return (rect[0], rect[1] + offset, rect[2], rect[3] + offset)
+
+
+def _screen_rect(element, panel):
+    """(left, top, right, bottom) of an element where it's shown"""
+    offset = _scroll_offset(panel) or 0
+    return (element.x, element.y - offset, element.x + element.width, element.y + element.height - offset)
@@ -0,0 +1,128 @@
+import time
+
+
+class Timeline:
+    def __init__(self):
+        """
+        Pausable animation time. Subscribers are called with a fixed dt on every step.
+        """
+        self.time = 0.0
+        self.paused = False
+        self.subscribers = []
+
+    def subscribe(self, callback):
+        """Register callback(dt) to be called on every fixed step"""
+        if callback not in self.subscribers:
+            self.subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        """Remove a previously registered callback"""
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def step(self, dt):
+        """Advance time by dt and notify subscribers (does nothing while paused)"""
+        if self.paused:
+            return
+        self.time += dt
+        for callback in list(self.subscribers):  # copy, callbacks may unsubscribe themselves
+            callback(dt)
+
+
+class FrameClock:
+    def __init__(self, step=1/60, max_steps=5):
+        """
+        Frame clock with fixed-timestep updates.
+
+        tick() is called once per rendered frame. It measures the real frame delta and
+        advances the timeline in whole steps of `step` seconds. Leftover time is kept for
+        the next frame and exposed as `alpha` (0..1) for interpolating between steps.
+        At most max_steps are run per frame, so a long stall (or an idle frame) drops
+        the backlog instead of spending the next frame catching up. delta_time is capped
+        the same way (step * max_steps), and time slept waiting for input isn't counted
+        at all (see skip_wait), so per-frame animations don't jump after an idle pause.
+
+        Parameters:
+            step (float): Length of one fixed update in seconds
+            max_steps (int): Upper bound of fixed updates per frame
+        """
+        self.step = step
+        self.max_steps = max_steps
+        self.max_delta = step * max_steps  # Longest frame delta_time reports
+        self.timeline = Timeline()
+
+        self.delta_time = 0.0  # Real time between the last two ticks
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.frame_count = 0
+        self._last_tick = None
+
+    def tick(self, dt=None):
+        """
+        Start a new frame: update delta_time and run the due fixed steps.
+
+        Parameters:
+            dt (float): Use this frame delta instead of measuring it (deterministic runs)
+
+        Returns:
+            Number of fixed steps that were run
+        """
+        now = time.perf_counter()
+        if dt is not None:
+            self.delta_time = dt
+        else:
+            self.delta_time = 0.0 if self._last_tick is None else min(now - self._last_tick, self.max_delta)
+        self._last_tick = now
+        self.frame_count += 1
+
+        if self.timeline.paused:
+            self.alpha = 0.0
+            return 0
+
+        self.accumulator += self.delta_time
+        steps = 0
+        while self.accumulator >= self.step and steps < self.max_steps:
+            self.timeline.step(self.step)
+            self.accumulator -= self.step
+            steps += 1
+        if steps == self.max_steps:
+            # Too far behind, drop the rest instead of spiralling
+            self.accumulator = min(self.accumulator, self.step)
+        self.alpha = min(1.0, self.accumulator / self.step)
+        return steps
+
+    def skip_wait(self):
+        """
+        Don't count the time since the last tick as frame time, call after sleeping
+        until input arrived (nothing was animating, so nothing should catch up)
+        """
+        if self._last_tick is not None:
+            self._last_tick = time.perf_counter()
+
+    @property
+    def time(self):
+        """Interpolated timeline time for rendering"""
+        if self.timeline.paused:
+            return self.timeline.time
+        return self.timeline.time + self.alpha * self.step
+
+    def subscribe(self, callback):
+        """Shortcut for timeline.subscribe"""
+        return self.timeline.subscribe(callback)
+
+    def unsubscribe(self, callback):
+        """Shortcut for timeline.unsubscribe"""
+        self.timeline.unsubscribe(callback)
+
+    def pause(self):
+        self.timeline.pause()
+
+    def resume(self):
+        self.timeline.resume()
@@ -0,0 +1,127 @@
+import math
+import time
+import pygame
+
+
+class FrameScheduler:
+    def __init__(self, active_fps=30, idle_timeout=1.0, animate_effects=False, report_window=240):
+        """
+        Decides how often the main loop renders.
+
+        While something is animating (3D display, fading notification, or the CRT
+        effects if animate_effects is True) frames are paced at active_fps.
+        Otherwise the loop blocks in pygame.event.wait() and only renders after input,
+        once per idle_timeout so the clock keeps ticking, or when an element asked to be
+        redrawn (a timed carousel's progress step, see Element.redraw_at).
+
+        Parameters:
+            active_fps (int): Frame rate used while animations are running
+            idle_timeout (float): Longest time in seconds to sleep when nothing animates
+            animate_effects (bool): Treat the shader time uniform as an animation (old behaviour)
+            report_window (int): Number of recent frames kept for the frame-budget report
+        """
+        self.active_fps = active_fps
+        self.idle_timeout = idle_timeout
+        self.animate_effects = animate_effects
+        self.report_window = report_window
+        self.clock = pygame.time.Clock()
+
+        self.animating = False
+        self.frame_start = time.perf_counter()
+        self.frame_times = []  # (work_time, animating) of recent frames
+        self.total_frames = 0
+        self.idle_frames = 0
+        self.over_budget_frames = 0
+        self.time_waiting = 0.0
+        self.started_at = time.perf_counter()
+
+    @property
+    def frame_budget(self):
+        """Time in seconds one frame may take at the active frame rate"""
+        return 1.0 / self.active_fps
+
+    def is_animating(self, menu, notification=None):
+        """Check if anything on screen needs continuous frames"""
+        if self.animate_effects:
+            return True
+        if notification is not None and notification.is_animating():
+            return True
+        if menu is not None and hasattr(menu, "is_animating"):
+            return menu.is_animating()
+        return False
+
+    def wait_events(self, animating, wake_at=None):
+        """
+        Collect the events for the next frame.
+        Blocks until input arrives (or the idle timeout passes) when nothing is animating.
+
+        Parameters:
+            animating (bool): Something needs continuous frames, don't block
+            wake_at (float): time.perf_counter() to wake up at the latest (Menu.next_redraw_time)
+        """
+        self.animating = animating
+        if animating:
+            events = pygame.event.get()
+        else:
+            wait_start = time.perf_counter()
+            # Wake up on the next wall-clock second at the latest, so the clock stays in step
+            timeout = min(self.idle_timeout, 1.0 - (time.time() % 1.0))
+            if wake_at is not None:
+                timeout = min(timeout, wake_at - wait_start)
+            event = pygame.event.wait(max(1, math.ceil(timeout * 1000)))  # not before the deadline
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events.extend(pygame.event.get())
+            self.time_waiting += time.perf_counter() - wait_start
+
+        self.frame_start = time.perf_counter()
+        return events
+
+    def end_frame(self):
+        """Record the frame's work time and sleep off the rest of the budget if animating"""
+        work_time = time.perf_counter() - self.frame_start
+
+        self.frame_times.append((work_time, self.animating))
+        if len(self.frame_times) > self.report_window:
+            self.frame_times.pop(0)
+        self.total_frames += 1
+        if not self.animating:
+            self.idle_frames += 1
+        if work_time > self.frame_budget:
+            self.over_budget_frames += 1
+
+        if self.animating:
+            self.clock.tick(self.active_fps)
+
+    def report(self):
+        """
+        Frame-budget statistics over the recent frame window.
+
+        Returns:
+            dict with keys: budget_ms, mean_ms, p95_ms, max_ms, active_frames, idle_frames,
+            over_budget, total_frames, wait_ratio
+        """
+        work = sorted(t for t, _ in self.frame_times)
+        elapsed = max(time.perf_counter() - self.started_at, 1e-9)
+        if not work:
+            work = [0.0]
+        return {
+            "budget_ms": self.frame_budget * 1000,
+            "mean_ms": sum(work) / len(work) * 1000,
+            "p95_ms": work[min(len(work) - 1, int(len(work) * 0.95))] * 1000,
+            "max_ms": work[-1] * 1000,
+            "active_frames": sum(1 for _, a in self.frame_times if a),
+            "idle_frames": sum(1 for _, a in self.frame_times if not a),
+            "over_budget": self.over_budget_frames,
+            "total_frames": self.total_frames,
+            "wait_ratio": self.time_waiting / elapsed,
+        }
+
+    def format_report(self):
+        """Human readable version of report()"""
+        r = self.report()
+        return (
+            f"Frames: {r['total_frames']} ({self.idle_frames} idle), over budget: {r['over_budget']}\n"
+            f"Last {r['active_frames'] + r['idle_frames']} frames: mean {r['mean_ms']:.1f} ms, "
+            f"p95 {r['p95_ms']:.1f} ms, max {r['max_ms']:.1f} ms (budget {r['budget_ms']:.1f} ms)\n"
+            f"Time spent sleeping on events: {r['wait_ratio'] * 100:.0f}%"
+        )
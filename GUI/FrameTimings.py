@@ -0,0 +1,222 @@
+import csv
+import json
+import time
+from contextlib import contextmanager
+
+
+class FrameTimings:
+    def __init__(self, enabled=True, max_frames=None, trace=False, element_window=30):
+        """
+        Per-frame timings of the main loop stages (render2d, upload, gpu, flip...).
+
+        Usage:
+            timings.begin_frame("MainMenu")
+            with timings.section("render2d"):
+                ...
+            timings.end_frame()
+
+        Parameters:
+            enabled (bool): If False, sections cost nothing and no frames are recorded
+            max_frames (int): Keep only this many recent frames (None keeps all, e.g. for dump())
+            trace (bool): Also record start/duration events for export_trace()
+            element_window (int): Number of recent frames used for top_elements()
+        """
+        self.enabled = enabled
+        self.max_frames = max_frames
+        self.trace = trace
+        self.element_window = element_window
+        self.frames = []  # dicts: frame, menu, <section>: ms..., <counter>: n..., total: ms
+        self.sections = []  # section names in the order they first appeared
+        self.counters = []  # counter names (not times)
+        self.element_frames = []  # per recent frame: {element id: (label, ms)}
+        self.events = []  # trace events: (name, category, start s, duration s, args)
+        self.frame_count = 0
+        self._current = None
+        self._current_elements = None
+        self._frame_start = 0.0
+        self._started_at = time.perf_counter()
+
+    def begin_frame(self, menu_name=""):
+        if not self.enabled:
+            return
+        self._current = {"frame": self.frame_count, "menu": menu_name}
+        self._current_elements = {}
+        self._frame_start = time.perf_counter()
+
+    @property
+    def active(self):
+        """True between begin_frame() and end_frame() of an enabled recorder"""
+        return self.enabled and self._current is not None
+
+    @contextmanager
+    def section(self, name):
+        """Time the body of the with-block as part of the current frame"""
+        if not self.enabled or self._current is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.add(name, (end - start) * 1000)
+            if self.trace:
+                self.events.append((name, "section", start, end - start, None))
+
+    def add(self, name, ms):
+        """Add a value measured elsewhere (e.g. GPU timer queries) to the current frame"""
+        if not self.enabled or self._current is None:
+            return
+        if name not in self.sections:
+            self.sections.append(name)
+        self._current[name] = self._current.get(name, 0.0) + ms
+
+    def count(self, name, n=1):
+        """Add to a per-frame counter (e.g. number of elements drawn)"""
+        if not self.enabled or self._current is None:
+            return
+        if name not in self.counters:
+            self.counters.append(name)
+        self._current[name] = self._current.get(name, 0) + n
+
+    def element(self, element, start, end):
+        """
+        Record one element render, start/end from time.perf_counter().
+
+        Parameters:
+            element: The element (or self-rendering panel) that was drawn
+        """
+        if not self.enabled or self._current is None:
+            return
+        key = id(element)
+        label, previous = self._current_elements.get(key, (None, 0.0))
+        if label is None:
+            label = element_label(element)
+        self._current_elements[key] = (label, previous + (end - start) * 1000)
+        if self.trace:
+            self.events.append((label, "element", start, end - start, None))
+
+    def end_frame(self):
+        if not self.enabled or self._current is None:
+            return
+        end = time.perf_counter()
+        self._current["total"] = (end - self._frame_start) * 1000
+        if self.trace:
+            self.events.append((f"frame {self.frame_count}", "frame", self._frame_start,
+                                end - self._frame_start, {"menu": self._current["menu"]}))
+        self.frames.append(self._current)
+        self.element_frames.append(self._current_elements)
+        if self.max_frames is not None and len(self.frames) > self.max_frames:
+            self.frames.pop(0)
+        if len(self.element_frames) > self.element_window:
+            self.element_frames.pop(0)
+        self.frame_count += 1
+        self._current = None
+        self._current_elements = None
+
+    # === Results ===
+    def recent(self, name, frames=30):
+        """Average of a section or counter over the last frames (0 if never recorded)"""
+        values = [f[name] for f in self.frames[-frames:] if name in f]
+        return sum(values) / len(values) if values else 0.0
+
+    def top_elements(self, n=5):
+        """
+        Most expensive elements over the element window.
+
+        Returns:
+            List of (label, average ms per frame), most expensive first
+        """
+        totals = {}
+        for frame in self.element_frames:
+            for key, (label, ms) in frame.items():
+                totals[key] = (label, totals.get(key, (label, 0.0))[1] + ms)
+        frames = max(1, len(self.element_frames))
+        ranked = sorted(totals.values(), key=lambda item: item[1], reverse=True)
+        return [(label, ms / frames) for label, ms in ranked[:n]]
+
+    def summary(self):
+        """
+        Statistics per menu and section.
+
+        Returns:
+            {menu: {section: {"mean": ms, "p50": ms, "p95": ms, "p99": ms, "max": ms}}, ...}
+        """
+        result = {}
+        menus = []
+        for frame in self.frames:
+            if frame["menu"] not in menus:
+                menus.append(frame["menu"])
+        for menu in menus:
+            rows = [f for f in self.frames if f["menu"] == menu]
+            result[menu] = {"frames": len(rows)}
+            for name in self.sections + self.counters + ["total"]:
+                values = sorted(r[name] for r in rows if name in r)
+                if not values:
+                    continue
+                result[menu][name] = {
+                    "mean": sum(values) / len(values),
+                    "p50": percentile(values, 50),
+                    "p95": percentile(values, 95),
+                    "p99": percentile(values, 99),
+                    "max": values[-1],
+                }
+        return result
+
+    def format_summary(self):
+        """Human readable summary() as a table"""
+        lines = []
+        for menu, stats in self.summary().items():
+            lines.append(f"{menu or '-'} ({stats['frames']} frames)")
+            for name in self.sections + self.counters + ["total"]:
+                if name in stats:
+                    s = stats[name]
+                    unit = "" if name in self.counters else " ms"
+                    lines.append(f"  {name:<16} mean {s['mean']:7.2f}  p50 {s['p50']:7.2f}  "
+                                 f"p95 {s['p95']:7.2f}  p99 {s['p99']:7.2f}  max {s['max']:7.2f}{unit}")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        """Write every recorded frame to a .csv or .json file (chosen by extension)"""
+        columns = ["frame", "menu"] + self.sections + self.counters + ["total"]
+        if str(path).endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({"frames": self.frames, "summary": self.summary()}, f, indent=2)
+            return
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            for frame in self.frames:
+                writer.writerow({k: (round(v, 4) if isinstance(v, float) else v) for k, v in frame.items()})
+
+    def export_trace(self, path):
+        """
+        Write the recorded events in Chrome trace format
+        (open in chrome://tracing or https://ui.perfetto.dev)
+        """
+        trace_events = []
+        for name, category, start, duration, args in self.events:
+            event = {
+                "name": name, "cat": category, "ph": "X", "pid": 0, "tid": 0,
+                "ts": round((start - self._started_at) * 1e6, 1),
+                "dur": round(duration * 1e6, 1),
+            }
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile (p in 0..100) of an already sorted, non-empty list"""
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+
+def element_label(element):
+    """Short readable name of an element for reports, e.g. Button('Start')"""
+    for attribute in ("text", "prompt"):
+        text = getattr(element, attribute, None)
+        if isinstance(text, str) and text:
+            return f"{type(element).__name__}('{text[:20]}')"
+    return f"{type(element).__name__}@{int(element.x)},{int(element.y)}"
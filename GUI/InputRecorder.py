@@ -0,0 +1,136 @@
+import json
+import time
+import pygame
+
+# Event types a recording can hold, by the name stored in the file
+EVENT_TYPES = {"KEYDOWN": pygame.KEYDOWN, "KEYUP": pygame.KEYUP}
+
+
+class InputRecorder:
+    def __init__(self, manager, event_types=(pygame.KEYDOWN, pygame.KEYUP)):
+        """
+        Records the key events that reach MenuManager.handle_event, so a session can be
+        replayed later with InputReplay (e.g. as a benchmark scenario).
+
+        Every event is stored with the frame it arrived on, the animation time of the
+        manager's FrameClock at that moment and the wall clock time since attach().
+
+        Usage:
+            recorder = InputRecorder(manager)
+            recorder.attach()
+            ...
+            recorder.save("session.json")
+
+        Parameters:
+            manager (MenuManager): Manager whose handle_event is recorded
+            event_types (tuple): pygame event types to record
+        """
+        self.manager = manager
+        self.event_types = event_types
+        self.events = []  # dicts: frame, time, timestamp, type, key, unicode, mod
+        self._original_handle_event = None
+        self._started_at = 0.0
+
+    def attach(self):
+        """Start recording (wraps manager.handle_event)"""
+        if self._original_handle_event is not None:
+            return
+        self._original_handle_event = self.manager.handle_event
+        self._started_at = time.perf_counter()
+
+        def handle_event(event):
+            self.record(event)
+            return self._original_handle_event(event)
+
+        self.manager.handle_event = handle_event
+
+    def detach(self):
+        """Stop recording and restore manager.handle_event"""
+        if self._original_handle_event is None:
+            return
+        self.manager.handle_event = self._original_handle_event
+        self._original_handle_event = None
+
+    def record(self, event):
+        if event.type not in self.event_types or _event_type_name(event.type) is None:
+            return
+        clock = self.manager.frame_clock
+        self.events.append({
+            "frame": clock.frame_count,  # events are handled before the frame's tick()
+            "time": round(clock.time, 6),
+            "timestamp": round(time.perf_counter() - self._started_at, 6),
+            "type": _event_type_name(event.type),
+            "key": pygame.key.name(event.key),
+            "unicode": getattr(event, "unicode", ""),
+            "mod": getattr(event, "mod", 0),
+        })
+
+    def save(self, path):
+        """Write the recording to a .json file"""
+        with open(path, "w") as f:
+            json.dump({"events": self.events}, f, indent=1)
+
+
+class InputReplay:
+    def __init__(self, events, by="time"):
+        """
+        Feeds recorded events back into the main loop, same interface as InputScript.
+
+        Replaying by animation time puts every event at the same point of the menu
+        animations (loading, transitions) as when it was recorded, even though frames
+        are paced differently (recording waits for input, headless runs don't).
+        Replaying by frame repeats the exact frame numbers instead.
+
+        Parameters:
+            events (list): Recorded event dicts (see InputRecorder.record)
+            by (str): "time" or "frame"
+        """
+        if by not in ("time", "frame"):
+            raise ValueError(f"Unknown replay mode: {by}")
+        self.events = sorted(events, key=lambda e: (e[by], e["frame"]))
+        self.by = by
+        self._next = 0
+
+    @classmethod
+    def load(cls, path, by="time"):
+        """Read a recording written by InputRecorder.save()"""
+        with open(path) as f:
+            return cls(json.load(f)["events"], by)
+
+    @property
+    def length(self):
+        """Frame of the last recorded event"""
+        return max((e["frame"] for e in self.events), default=0)
+
+    @property
+    def duration(self):
+        """Animation time of the last recorded event in seconds"""
+        return max((e["time"] for e in self.events), default=0.0)
+
+    def rewind(self):
+        self._next = 0
+
+    def events_for(self, frame, time=None):
+        """
+        pygame events to inject on the given frame. Call once per frame with increasing
+        frames, time is the FrameClock time before the frame's tick (needed by="time").
+        """
+        by = self.by if time is not None else "frame"
+        position = time if by == "time" else frame
+        events = []
+        # Small epsilon, recorded times are rounded
+        while self._next < len(self.events) and self.events[self._next][by] <= position + 1e-6:
+            e = self.events[self._next]
+            events.append(pygame.event.Event(
+                EVENT_TYPES[e["type"]],
+                key=pygame.key.key_code(e["key"]), mod=e["mod"], unicode=e["unicode"], scancode=0
+            ))
+            self._next += 1
+        return events
+
+
+def _event_type_name(event_type):
+    for name, value in EVENT_TYPES.items():
+        if value == event_type:
+            return name
+    return None
@@ -0,0 +1,54 @@
+import pygame
+
+
+class InputScript:
+    def __init__(self, steps=None):
+        """
+        Scripted keyboard input for runs without a user (headless benchmarks).
+
+        Each step is (frame, key name), key names as in pygame.key.key_code(),
+        e.g. "return", "down", "a". Every key is sent as a KEYDOWN followed by a KEYUP.
+
+        Parameters:
+            steps (list): List of (frame, key name) tuples
+        """
+        self.steps = sorted(steps or [], key=lambda step: step[0])
+
+    @classmethod
+    def parse(cls, text):
+        """
+        Build a script from text. Steps are separated by newlines or commas,
+        each one is "<frame> <key>" or "<frame>:<key>". Lines starting with # are ignored.
+
+        Example: "1:return, 240:down, 250:return"
+        """
+        steps = []
+        for line in text.replace(",", "\n").splitlines():
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            frame, key = line.replace(":", " ", 1).split(None, 1)
+            steps.append((int(frame), key.strip()))
+        return cls(steps)
+
+    @classmethod
+    def load(cls, path):
+        """Read a script file (see parse() for the format)"""
+        with open(path) as f:
+            return cls.parse(f.read())
+
+    @property
+    def length(self):
+        """Frame of the last step"""
+        return self.steps[-1][0] if self.steps else 0
+
+    def events_for(self, frame, time=None):
+        """pygame events to inject on the given frame (time is unused, see InputReplay)"""
+        events = []
+        for step_frame, key in self.steps:
+            if step_frame == frame:
+                code = pygame.key.key_code(key)
+                unicode = key if len(key) == 1 else ""
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=code, mod=0, unicode=unicode, scancode=0))
+                events.append(pygame.event.Event(pygame.KEYUP, key=code, mod=0, unicode=unicode, scancode=0))
+        return events
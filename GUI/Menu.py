@@ -3,13 +3,54 @@ from GUI.Table import Table
 from GUI.panels.navigation_bar import NavigationBar
 from GUI.ScrollingTableVertical import ScrollingTableVertical
 from GUI.elements.Display3D import Display3D
+from GUI.FocusIndex import FocusIndex
 import pygame
+import time
 class Menu:
-    def __init__(self, screen, manager):
+    keep_alive = False  # True: MenuManager never drops the menu to stay in its memory budget
+
+    def __init__(self, screen, manager, preloaded=None):
         self.screen = screen
         self.manager = manager
         self.panels = []
+        self._display3d_elements = None  # Cached Display3D lookup, reset when panels change
+        self.preloaded = preloaded if preloaded is not None else {}  # See preload()
+        self.focus_index = FocusIndex(self)  # Arrow key navigation between the panels' elements
         self.setup()  # Automatically call setup during initialization
+
+    @classmethod
+    def preload(cls, query):
+        """Override this to run the data work of setup() ahead of time:
+        database queries and image decoding, nothing that draws or touches GL.
+        MockLoadingMenu runs it on a loader thread and passes the result to the
+        constructor as preloaded, setup() takes values from it with preloaded_or().
+
+        Returns:
+            dict of preloaded values
+        """
+        return {}
+
+    def preloaded_or(self, key, query):
+        """Value preload() computed for key (used once, later calls run query), otherwise query()"""
+        if key in self.preloaded:
+            return self.preloaded.pop(key)
+        return query()
+
+    def query_async(self, name, function, on_result, preloaded_key=None):
+        """
+        Run function(query) on the manager's QueryExecutor, on_result(result) is called
+        on the main thread once it's done. A newer request with the same name replaces
+        the older one, so quick changes of a selection only show the last result.
+
+        Parameters:
+            name (str): What the result is for, per menu (e.g. "plot")
+            preloaded_key: Key of a value preload() computed, given to on_result right away if present
+        """
+        if preloaded_key is not None and preloaded_key in self.preloaded:
+            self.manager.query_executor.cancel((self, name))
+            on_result(self.preloaded.pop(preloaded_key))
+            return
+        self.manager.query_executor.submit((self, name), function, on_result)
         
     def setup(self):
         """Override this to:
@@ -26,12 +67,14 @@ class Menu:
             kwargs['manager'] = self.manager
         panel = panel_class(*args, **kwargs)
         self.panels.append(panel)
+        self._display3d_elements = None
         return panel
     
     def add_panel_instance(self, panel_instance):
         """Add an existing panel instance to the menu"""
         if isinstance(panel_instance, (Panel,Table,NavigationBar)):
             self.panels.append(panel_instance)
+            self._display3d_elements = None
         else:
             raise TypeError("Expected a Panel instance")
     
@@ -39,6 +82,7 @@ class Menu:
         """Remove a panel from the menu"""
         if panel in self.panels:
             self.panels.remove(panel)
+            self._display3d_elements = None
     
     def remove_panels(self,except_panels=None):
         """Remove all panels except specified ones"""
@@ -55,6 +99,10 @@ class Menu:
         # 2. Regular panels where we render elements individually
         clipping_panels = []
         regular_panels = []
+        # Per-element render times for the profiling overlay (only while a frame is being profiled)
+        timings = getattr(self.manager, 'frame_timings', None)
+        if timings is not None and not timings.active:
+            timings = None
         
         for panel in self.panels:
             if isinstance(panel, ScrollingTableVertical):
@@ -64,12 +112,14 @@ class Menu:
                 regular_panels.append(panel)
         
         # First render self-rendering panels (sorted by their own layer)
-        for panel in sorted(clipping_panels, key=lambda p: getattr(p, 'layer', 0)):
+        # Only one table at a time scrolls its content on the GPU, others compose on the CPU
+        for i, panel in enumerate(sorted(clipping_panels, key=lambda p: getattr(p, 'layer', 0))):
+            panel.gpu_scroll_allowed = i == 0
             # # Draw panel borders (if drawBorder is True)
             if panel.drawBorder:
                 border_rect = pygame.Rect(panel.x, panel.y, panel.width, panel.height)
                 pygame.draw.rect(self.screen, (255, 255, 255), border_rect, 1)  # 1px thick border
-            panel.render(screen)
+            self._render_timed(panel, screen, timings)
         # Then render all regular panel elements (sorted by layer)
         all_elements = []
         for panel in regular_panels:
@@ -82,14 +132,33 @@ class Menu:
                 pygame.draw.rect(self.screen, (255, 255, 255), border_rect, 1)  # 1px thick border
         
         for layer, element in sorted(all_elements, key=lambda x: x[0]):
-            element.render(screen)
+            self._render_timed(element, screen, timings)
+        if timings is not None:
+            timings.count("elements", len(all_elements) + sum(len(p.elements) for p in clipping_panels))
+
+    def _render_timed(self, drawable, screen, timings):
+        """Render an element (or self-rendering panel), recording its time when profiling"""
+        if timings is None:
+            drawable.render(screen)
+            return
+        start = time.perf_counter()
+        drawable.render(screen)
+        timings.element(drawable, start, time.perf_counter())
 
     def render3d(self):
-        for panel in self.panels:
-            for elem in panel.getElements():
-                if isinstance(elem, Display3D):
-                    elem.render3d()
+        for elem in self.get_display3d_elements():
+            elem.render3d()
                 
+    def release(self):
+        """
+        Free what the menu holds outside Python (GL textures and framebuffers of its elements),
+        call when dropping it (see MenuManager). Queries still running for it are dropped,
+        their results would recreate what was freed.
+        """
+        self.manager.query_executor.cancel_owned([self] + self.panels)
+        for panel in self.panels:
+            panel.release()
+
     def set_initial_focus(self, element):
         """Delegate to manager's focus system"""
         self.manager.focus_manager.set_focus(element)
@@ -98,8 +167,46 @@ class Menu:
         """Delegate event handling to manager"""
         return self.manager.handle_event(event)
     
-    def get_display3d_element(self):
+    def is_animating(self):
+        """Check if any element in the menu needs continuous frames (see Element.needs_animation)"""
         for panel in self.panels:
+            if hasattr(panel, 'is_animating') and panel.is_animating():
+                return True
             for elem in panel.getElements():
-                if isinstance(elem, Display3D):
-                    return elem
\ No newline at end of file
+                if getattr(elem, 'needs_animation', False):
+                    return True
+        return False
+
+    def next_redraw_time(self):
+        """Earliest time.perf_counter() an element changes on its own (see Element.redraw_at), None if none does"""
+        times = [elem.redraw_at for panel in self.panels for elem in panel.getElements()
+                 if getattr(elem, 'redraw_at', None) is not None]
+        return min(times) if times else None
+
+    def get_display3d_elements(self):
+        """All Display3D elements of the menu. Looked up once and cached until panels change"""
+        if self._display3d_elements is None:
+            self._display3d_elements = [
+                elem for panel in self.panels for elem in panel.getElements()
+                if isinstance(elem, Display3D)
+            ]
+        return self._display3d_elements
+
+    def get_display3d_element(self):
+        elements = self.get_display3d_elements()
+        return elements[0] if elements else None
+
+    def has_3d_content(self):
+        """True if the menu draws into the 3D framebuffer (renderer skips 3D and composite otherwise)"""
+        return len(self.get_display3d_elements()) > 0
+
+    def get_scroll_layer(self):
+        """Scrolling table whose content is drawn on the GPU this frame (None if all compose on the CPU)"""
+        for panel in self.panels:
+            if isinstance(panel, ScrollingTableVertical) and panel.gpu_active:
+                return panel
+        return None
+
+    def invalidate_3d_cache(self):
+        """Call after adding/removing a Display3D to a panel that's already in the menu"""
+        self._display3d_elements = None
\ No newline at end of file
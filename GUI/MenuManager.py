@@ -1,28 +1,162 @@
+import types
+import moderngl
+import pygame
 from GUI.FocusManager import FocusManager
+from GUI.FrameClock import FrameClock
+from GUI.QueryExecutor import QueryExecutor
 
 class MenuManager:
-    def __init__(self, gui_surface,queryTool, notification_system,ctx,fbo,tex):
+    def __init__(self, gui_surface,queryTool, notification_system,ctx,fbo,tex,frame_clock=None,frame_timings=None,menu_memory_budget=None):
+        """
+        Parameters:
+            menu_memory_budget (int): Bytes of surfaces and GL textures the lazily registered menus may keep while
+                                      built (see register_menu), least recently used ones are
+                                      dropped and rebuilt when needed again. None keeps all of them.
+        """
         self.gui_surface = gui_surface
         self.queryTool = queryTool
+        self.query_executor = QueryExecutor(queryTool)  # queries of event handlers, drained by the main loop
         self.notification_system = notification_system
         self.current_menu = None
+        self.current_menu_name = None
         self.focus_manager = FocusManager()  # Central focus control
-        self.menus = {}
+        self.menus = {}  # name -> built menu
+        self._factories = {}  # name -> callable building the menu, for menus registered lazily
+        self._preloads = {}  # name -> preload of a lazily registered menu (see register_menu)
+        self._preloaded = {}  # name -> result of the preload, until the menu is built from it
+        self._last_used = {}  # name -> switch count when the menu was last switched to
+        self._switches = 0
+        self._transitions = {}  # (from name, to name) -> times switched, to guess the next menu
+        self.menu_memory_budget = menu_memory_budget
+        self.prewarm_idle_frames = 15  # frames without input before the next likely menu is built
+        self._idle_frames = 0
+        self._prewarmed = False  # the quiet spell's menu was built (or there's none to build)
         self.context = {} # for some globalcontext
         self.screen3Drefs = {'ctx':ctx,'fbo':fbo,'tex':tex}
+        self.frame_clock = frame_clock if frame_clock is not None else FrameClock() # shared animation time
+        self.frame_timings = frame_timings # optional FrameTimings, menus record element render times into it
 
-    def register_menu(self, name, menu_instance):
-        self.menus[name] = menu_instance
+    def register_menu(self, name, menu, preload=None):
+        """
+        Register a built menu, or a factory (callable taking the preloaded data, returning the
+        menu) that builds it on the first switch_to(), or earlier in idle frames (see idle_frame).
+
+        Parameters:
+            preload (callable): For a factory, the menu's data work (e.g. its class's Menu.preload),
+                                gets the Query tool. It runs on the QueryExecutor right away and the
+                                factory gets its result, or None if the menu is needed before it's
+                                done (setup() then queries on its own). It runs again before the
+                                menu is rebuilt after being dropped over budget.
+        """
+        if callable(menu):
+            self._factories[name] = menu
+            self.menus.pop(name, None)
+            self._preloaded.pop(name, None)
+            if preload is not None:
+                self._preloads[name] = preload
+                self._start_preload(name)
+            else:
+                self._preloads.pop(name, None)
+        else:
+            self.menus[name] = menu
+
+    def get_menu(self, name):
+        """The menu registered as name, built now if it was registered lazily (None if unknown)"""
+        if name not in self.menus:
+            if name not in self._factories:
+                return None
+            # Needed now: a preload still running isn't waited for
+            self.query_executor.cancel(self._preload_key(name))
+            self.menus[name] = self._factories[name](self._preloaded.pop(name, None))
+            self._last_used.setdefault(name, self._switches)
+            self._evict_over_budget(keep=name)
+        return self.menus[name]
+
+    def _preload_key(self, name):
+        return (self, "preload", name)
+
+    def _start_preload(self, name):
+        """Run a lazily registered menu's preload on the QueryExecutor, kept until the menu is built"""
+        def store(preloaded):
+            if name not in self.menus:
+                self._preloaded[name] = preloaded
+
+        def failed(error):
+            print(f"Preloading {name} failed, it's built without: {error!r}")
+            store(None)
+        self.query_executor.submit(self._preload_key(name), self._preloads[name], store, failed)
 
     def switch_to(self, menu_name):
-        if menu_name in self.menus:
+        if menu_name in self.menus or menu_name in self._factories:
+            menu = self.get_menu(menu_name)
             self.focus_manager.clear_focus()
-            self.current_menu = self.menus[menu_name]
+            if self.current_menu_name is not None:
+                key = (self.current_menu_name, menu_name)
+                self._transitions[key] = self._transitions.get(key, 0) + 1
+            self._switches += 1
+            self._last_used[menu_name] = self._switches
+            self.current_menu = menu
+            self.current_menu_name = menu_name
             # Set initial focus for the new menu
             if hasattr(self.current_menu, "set_initial_focus_on_switch"):
                 self.current_menu.set_initial_focus_on_switch()
+            # Menus grow caches while used, the one left may have to go now
+            self._evict_over_budget()
             return True
         return False
+
+    def idle_frame(self, had_events):
+        """
+        Call once per frame. After prewarm_idle_frames frames without input, the lazily
+        registered menu most likely to be switched to next is built, one menu per quiet spell.
+        A menu with a preload is only built once its preloaded data is there, if it was
+        dropped before, its preload is started again first.
+        """
+        if had_events:
+            self._idle_frames = 0
+            self._prewarmed = False
+            return
+        self._idle_frames += 1
+        if self._idle_frames < self.prewarm_idle_frames or self._prewarmed:
+            return
+        name = self.likely_next_menu()
+        if name is not None and name in self._preloads and name not in self._preloaded:
+            if not self.query_executor.pending(self._preload_key(name)):
+                self._start_preload(name)
+            return  # built in a later quiet frame, once the data is delivered
+        if name is not None:
+            self.get_menu(name)
+        self._prewarmed = True
+
+    def likely_next_menu(self):
+        """Unbuilt menu switched to most often from the current one (registration order on ties)"""
+        unbuilt = [name for name in self._factories if name not in self.menus]
+        if not unbuilt:
+            return None
+        return max(unbuilt, key=lambda name: self._transitions.get((self.current_menu_name, name), 0))
+
+    def _evict_over_budget(self, keep=None):
+        """
+        Drop least recently used lazily registered menus while they keep more than the budget.
+
+        Parameters:
+            keep (str): Name of a menu to keep as well (one just built)
+        """
+        if self.menu_memory_budget is None:
+            return
+        # The current menu, the menu an open form returns to and menus holding unsaved input stay
+        kept = {id(self.current_menu), id(getattr(self.current_menu, "return_menu_instance", None))}
+        evictable = [name for name in self.menus
+                     if name in self._factories and name != keep and id(self.menus[name]) not in kept
+                     and not getattr(self.menus[name], "keep_alive", False)]
+        sizes = {name: menu_surface_bytes(self.menus[name]) for name in evictable}
+        total = sum(sizes.values())
+        for name in sorted(evictable, key=lambda name: self._last_used.get(name, 0)):
+            if total <= self.menu_memory_budget:
+                break
+            # Python would drop the menu, but not its GL objects (the context doesn't collect them)
+            self.menus.pop(name).release()
+            total -= sizes[name]
     
     def create_form(self, formInstance, returnMenuInstance):
         formInstance.return_menu_instance = returnMenuInstance
@@ -45,4 +179,38 @@ class MenuManager:
             else:
                 return False
         
-        return False
\ No newline at end of file
+        return False
+
+
+def menu_surface_bytes(menu, max_depth=8):
+    """
+    Rough memory a menu keeps: pixel bytes of the surfaces and GL textures reachable from its
+    panels (elements, their caches, GPU charts, ...) within max_depth references. The shared GUI surface
+    and everything reached through the manager (other menus, the database) aren't counted.
+    """
+    seen = {id(menu), id(menu.screen), id(menu.manager)}
+    total = 0
+    pending = [(menu.panels, 0)]
+    while pending:
+        value, depth = pending.pop()
+        if isinstance(value, pygame.Surface):
+            total += value.get_width() * value.get_height() * value.get_bytesize()
+            continue
+        if isinstance(value, moderngl.Texture):
+            total += value.width * value.height * value.components * int(value.dtype[-1])
+            continue
+        if depth >= max_depth:
+            continue
+        if isinstance(value, dict):
+            children = value.values()
+        elif isinstance(value, (list, tuple, set)):
+            children = value
+        elif hasattr(value, "__dict__") and not isinstance(value, (type, types.ModuleType)):
+            children = vars(value).values()
+        else:
+            continue
+        for child in children:
+            if id(child) not in seen:
+                seen.add(id(child))
+                pending.append((child, depth + 1))
+    return total
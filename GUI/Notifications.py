@@ -93,6 +93,10 @@ class Notification:
         screen.blit(background, (pos_x, pos_y))
         screen.blit(text_alpha_surface, (pos_x + padding, pos_y + padding))
 
+    def is_animating(self):
+        """True while a notification is fading out on screen"""
+        return self.active and time.time() - self.start_time < self.display_duration
+
     def set_position(self, position):
         """Set notification position ('top' or 'bottom')"""
         self.style['position'] = position
@@ -1,4 +1,6 @@
 class Panel:
+    navigable = True  # False: arrow keys never move the focus to the panel's elements (see FocusIndex)
+
     def __init__(
         self,
         x, y, width, height,
@@ -35,22 +37,10 @@ class Panel:
         """Clear all elements from the panel."""
         self.elements = []
     
-    def setNeighbors(self):
-        """Sets neighbors for all elements based on their layout."""
-        elements = self.getElements()
-        if self.layout_type == "vertical":
-            for i in range(len(elements)):
-                if i > 0:
-                    elements[i].set_neighbor("up", elements[i-1])
-                if i < len(elements) - 1:
-                    elements[i].set_neighbor("down", elements[i+1])
-
-        if self.layout_type == "horizontal":
-            for i in range(len(elements)):
-                if i > 0:
-                    elements[i].set_neighbor("left", elements[i-1])
-                if i < len(elements) - 1:
-                    elements[i].set_neighbor("right", elements[i+1])
+    def release(self):
+        """Release the elements (see Element.release), called when the panel's menu is dropped"""
+        for element in self.getElements():
+            element.release()
 
     def add_element(self, element):
         """Add element and reposition all based on panel layout"""
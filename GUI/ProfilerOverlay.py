@@ -0,0 +1,118 @@
+import pygame
+import time
+
+
+class ProfilerOverlay:
+    def __init__(self, timings, font_size=14, top_n=5, window=30, refresh_time=0.5, key=pygame.K_F3):
+        """
+        On-screen frame profiler, toggled with a key. Drawn onto the GUI surface after
+        the notification, in the same style, so it goes through the same post-processing.
+
+        Shows the frame time and its parts (render2d, render3d, upload, each shader pass,
+        handle_event), the number of drawn elements and the top_n most expensive elements.
+
+        Parameters:
+            timings (FrameTimings): Recorder filled by the main loop and Menu.render2d
+            font_size (int): Font size of the overlay text
+            top_n (int): Number of most expensive elements listed
+            window (int): Number of recent frames averaged
+            refresh_time (float): Seconds between text updates (rendering text isn't free)
+            key (int): pygame key that toggles the overlay
+        """
+        self.timings = timings
+        self.font = pygame.font.SysFont("Consolas,DejaVu Sans Mono,Courier New,monospace", font_size)
+        self.top_n = top_n
+        self.window = window
+        self.refresh_time = refresh_time
+        self.key = key
+        self.visible = False
+        self._timings_were_enabled = timings.enabled
+        self._surface = None
+        self._last_refresh = 0.0
+        self.style = {
+            'bg_color': (50, 50, 50),
+            'text_color': (255, 255, 255),
+            'border_color': (100, 100, 100),
+            'padding': 8,
+            'border_radius': 5,
+            'alpha': 200,
+            'position': (10, 10)
+        }
+
+    def toggle(self):
+        """Show/hide the overlay. Timings are recorded while it is visible"""
+        self.visible = not self.visible
+        if self.visible:
+            self._timings_were_enabled = self.timings.enabled
+            self.timings.enabled = True
+            self._surface = None
+        else:
+            self.timings.enabled = self._timings_were_enabled
+
+    def handle_event(self, event):
+        """Toggle on the overlay key. Returns True if the event was consumed"""
+        if event.type == pygame.KEYDOWN and event.key == self.key:
+            self.toggle()
+            return True
+        return False
+
+    def lines(self):
+        """Overlay text, one string per line"""
+        t = self.timings
+        w = self.window
+        frame_ms = t.recent("total", w)
+        fps = 1000.0 / frame_ms if frame_ms > 0 else 0.0
+        lines = [
+            f"frame   {frame_ms:6.1f} ms ({fps:4.1f} fps of work)",
+            f"events  {t.recent('handle_event', w):6.2f} ms   update {t.recent('update', w):6.2f} ms",
+            f"2d      {t.recent('render2d', w):6.2f} ms   3d     {t.recent('render3d', w):6.2f} ms",
+            f"upload  {t.recent('upload', w):6.2f} ms   flip   {t.recent('flip', w):6.2f} ms",
+            f"gpu     {t.recent('gpu', w):6.2f} ms",
+        ]
+        passes = [name for name in t.sections if name.startswith("gpu_")]
+        for name in passes:
+            lines.append(f"  {name[4:]:<12}{t.recent(name, w):6.2f} ms")
+        lines.append(f"elements drawn {t.recent('elements', w):.0f}")
+        lines.append(f"top {self.top_n} elements:")
+        for label, ms in t.top_elements(self.top_n):
+            lines.append(f"  {label[:28]:<28}{ms:6.2f} ms")
+        return lines
+
+    def _build_surface(self):
+        text_surfaces = [self.font.render(line, True, self.style['text_color']) for line in self.lines()]
+        padding = self.style['padding']
+        line_height = self.font.get_linesize()
+        width = max(s.get_width() for s in text_surfaces) + padding * 2
+        height = line_height * len(text_surfaces) + padding * 2
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(
+            surface,
+            (*self.style['bg_color'], self.style['alpha']),
+            (0, 0, width, height),
+            border_radius=self.style['border_radius']
+        )
+        pygame.draw.rect(
+            surface,
+            (*self.style['border_color'], self.style['alpha']),
+            (0, 0, width, height),
+            width=1,
+            border_radius=self.style['border_radius']
+        )
+        for i, text_surface in enumerate(text_surfaces):
+            surface.blit(text_surface, (padding, padding + i * line_height))
+        return surface
+
+    def render(self, screen):
+        """Draw the overlay if visible. Call after notification.render()"""
+        if not self.visible:
+            return
+        now = time.time()
+        if self._surface is None or now - self._last_refresh >= self.refresh_time:
+            self._surface = self._build_surface()
+            self._last_refresh = now
+        screen.blit(self._surface, self.style['position'])
+
+    def is_animating(self):
+        """Numbers change every frame, keep frames coming while visible"""
+        return self.visible
@@ -0,0 +1,102 @@
+import queue
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+
+class QueryExecutor:
+    def __init__(self, query, workers=1):
+        """
+        Runs database queries off the main thread, so event handlers return right away
+        and frames keep coming while a heavy query (stats, histories) runs.
+
+        Results come back through a queue that the main loop drains once per frame
+        (see drain), the result callbacks run there, on the main thread, where it's safe
+        to touch elements. A query that raises is reported there and the frame loop goes on. Every request has a key, a new request with the same key makes
+        the older one stale: it's cancelled if it hasn't started, its result dropped if it has.
+
+        Usage:
+            executor.submit((menu, "plot"), lambda query: query.get_bodyweight_history(4), show_plot)
+            executor.drain()  # once per frame, calls show_plot(result) when it's done
+
+        Parameters:
+            query (Query): Query tool the functions get
+            workers (int): Worker threads, one keeps the queries in submission order
+        """
+        self.query = query
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="QueryExecutor")
+        self._requests = {}  # key -> future of the latest request
+        self._finished = queue.SimpleQueue()  # (key, future, on_result, on_error) of finished requests
+
+    def submit(self, key, function, on_result, on_error=None):
+        """
+        Run function(query) on a worker, on_result(result) follows from drain().
+
+        Parameters:
+            key (hashable): Identifies what the result is for (e.g. (menu, "plot")),
+                            an earlier request with the same key is replaced
+            function (callable): Gets the Query tool, returns the result
+            on_result (callable): Gets the result, on the main thread
+            on_error (callable): Gets the exception if function raised, on the main thread
+                                 (default: print it, on_result isn't called)
+
+        Returns:
+            concurrent.futures.Future of the request
+        """
+        self.cancel(key)
+        future = self._pool.submit(function, self.query)
+        self._requests[key] = future
+        future.add_done_callback(lambda done: self._finished.put((key, done, on_result, on_error)))
+        return future
+
+    def cancel(self, key):
+        """Drop the request with this key (cancelled if it hasn't started yet)"""
+        future = self._requests.pop(key, None)
+        if future is not None:
+            future.cancel()
+
+    def cancel_owned(self, owners):
+        """Drop the requests whose key is a tuple starting with one of owners (e.g. a menu and its panels)"""
+        owners = {id(owner) for owner in owners}
+        for key in [key for key in self._requests if isinstance(key, tuple) and key and id(key[0]) in owners]:
+            self.cancel(key)
+
+    def pending(self, key):
+        """True while a request with this key hasn't been delivered"""
+        return key in self._requests
+
+    def busy(self):
+        """True while any request is waiting for delivery (the main loop keeps frames coming)"""
+        return bool(self._requests)
+
+    def drain(self):
+        """
+        Deliver the results finished since the last call, call once per frame on the main
+        thread. A query that raised goes to its on_error (printed by default) instead of
+        raising here, one failed query doesn't take the main loop down.
+
+        Returns:
+            Number of results delivered
+        """
+        delivered = 0
+        while True:
+            try:
+                key, future, on_result, on_error = self._finished.get_nowait()
+            except queue.Empty:
+                return delivered
+            if self._requests.get(key) is not future:
+                continue  # stale, a newer request replaced it
+            del self._requests[key]
+            error = future.exception()
+            if error is None:
+                on_result(future.result())
+            elif on_error is not None:
+                on_error(error)
+            else:
+                print(f"Error in background query {key!r}:")
+                traceback.print_exception(error)
+            delivered += 1
+
+    def shutdown(self):
+        """Cancel waiting requests and stop the workers"""
+        self._requests.clear()
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -1,8 +1,16 @@
+import math
 import pygame
 from GUI.Table import Table
+from GUI.style import StyleManager
 from GUI.elements.Button import Button
 from GUI.elements.Label import Label
 
+# Render the whole content into a texture once and let the GPU scroll it
+# (see PostProcess.ScrollLayer), otherwise the visible rows are composed on the CPU every scroll
+GPU_SCROLLING = True
+# How quickly the shown offset follows scroll_to() (1/s), higher is snappier
+SCROLL_RESPONSE = 18.0
+
 class ScrollingTableVertical(Table):
     def __init__(self, x, y, width, height, manager, totalHeight, cols=1, cell_height=100):
         super().__init__(x, y, width, height, manager, rows=1, cols=cols)
@@ -11,8 +19,49 @@ class ScrollingTableVertical(Table):
         self.scroll_offset = 0  # Current scroll offset in pixels
         self.scroll_speed = 25
         self.max_offset = max(0, self.totalHeight - self.height)
+        self._viewport = None  # composed visible rows, reallocated only when the table is resized
+        self._row_cache = {}  # row -> (render state, surface), only rows inside the viewport
+        self._viewport_key = None  # (scroll offset, first row, last row) the viewport was composed for
+        self.gpu_scroll_allowed = True  # Menu allows one GPU scrolled table, like one Display3D
+        self.gpu_active = False  # content drawn on the GPU in the last render()
+        self.content_texture = None  # full content, top row first, for PostProcess.ScrollLayer
+        self._content_states = {}  # row -> render state currently in content_texture
+        self._row_surface = None  # scratch surface rows are rendered into before upload
+        self._max_texture_size = None
         self.enforceElementsSize()
 
+    @property
+    def scroll_offset(self):
+        """Offset currently shown, follows scroll_target smoothly"""
+        return self._scroll_offset
+
+    @scroll_offset.setter
+    def scroll_offset(self, value):
+        """Jump to an offset without animation (use scroll_to() to glide there)"""
+        self._scroll_offset = value
+        self.scroll_target = value
+
+    def scroll_to(self, offset):
+        """Scroll smoothly to an offset, clamped to the content"""
+        self.scroll_target = min(max(offset, 0), self.max_offset)
+        frame_clock = getattr(self.manager, 'frame_clock', None)
+        if frame_clock is None:
+            self._scroll_offset = self.scroll_target
+        elif self._scroll_offset != self.scroll_target:
+            frame_clock.subscribe(self._advance_scroll)  # until the target is reached
+
+    def _advance_scroll(self, dt):
+        """Fixed-timestep update moving the shown offset towards the target (exponential ease-out)"""
+        self._scroll_offset += (self.scroll_target - self._scroll_offset) * (1 - math.exp(-SCROLL_RESPONSE * dt))
+        if abs(self.scroll_target - self._scroll_offset) < 0.5:
+            self._scroll_offset = self.scroll_target
+        if self._scroll_offset == self.scroll_target:
+            self.manager.frame_clock.unsubscribe(self._advance_scroll)
+
+    def is_animating(self):
+        """Needs frames while a scroll is in progress"""
+        return self._scroll_offset != self.scroll_target
+
 
     def handle_event(self, event):
         """Handle events for the panel including scrolling before passing to elements"""
@@ -20,13 +69,13 @@ class ScrollingTableVertical(Table):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_COMMA:  # "<" key
                 #print("im in")
-                self.scroll_offset = max(self.scroll_offset - self.scroll_speed, 0)
+                self.scroll_to(self.scroll_target - self.scroll_speed)
                 #print(self.scroll_offset)
                 return True  # Event handled
                 
             elif event.key == pygame.K_PERIOD:  # ">" key
                 #print("im in")
-                self.scroll_offset = min(self.scroll_offset + self.scroll_speed, self.max_offset)
+                self.scroll_to(self.scroll_target + self.scroll_speed)
                 #print(self.scroll_offset)
                 return True  # Event handled
                 
@@ -34,47 +83,37 @@ class ScrollingTableVertical(Table):
 
     def enforceElementsSize(self):
         """Override Table's version to use cell_height and totalHeight."""
-        cell_width = self.width / self.cols
         for r in range(len(self.elements_grid)):
-            for c in range(self.cols):
-                elem = self.elements_grid[r][c]
-                if elem:
-                    elem.width = cell_width
-                    elem.height = self.cell_height
-                    elem.x = self.x + c * cell_width
-                    elem.y = self.y + r * self.cell_height
+            self._place_row(r)
+
+    def _place_row(self, r):
+        cell_width = self.width / self.cols
+        for c in range(self.cols):
+            elem = self.elements_grid[r][c]
+            if elem:
+                elem.width = cell_width
+                elem.height = self.cell_height
+                elem.x = self.x + c * cell_width
+                elem.y = self.y + r * self.cell_height
 
     def _reposition_elements(self):
         """Override to skip Table's logic and use our own."""
         self.enforceElementsSize()  # Just use ourversion from ScrollingTable
 
     def render(self, screen):
-        # Create and clear virtual surface
-        virtual_surface = pygame.Surface((self.width, self.totalHeight), pygame.SRCALPHA)
-        virtual_surface.fill((0, 0, 0, 0))
-        
-        # Render elements with scroll compensation
-        for element in self.getElements():
-        # Temporarily adjust coordinates so they're relative to the table's top-left
-            original_x, original_y = element.x, element.y
-            element.x -= self.x
-            element.y -= self.y
-            element.render(virtual_surface)
-            element.x, element.y = original_x, original_y  # restore absolute positions
-        # Create and clear viewport
-        # Create viewport and blit visible portion
-        viewport = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        viewport.blit(
-            virtual_surface,
-            (0, 0),  # draw at top-left of viewport
-            (0, self.scroll_offset, self.width, self.height)  # grab only the visible region
-        )
-        
-        # Blit visible portion
-        viewport.blit(virtual_surface, (self.x, self.y), (self.x, self.y + self.scroll_offset, self.width, self.height))
-        
-        # Blit to screen
-        screen.blit(viewport, (self.x, self.y))
+        """
+        Draw the content and the scroll indicators. With a GL context the content lives in
+        content_texture and PostProcess.ScrollLayer shows the visible part of it, the table only
+        leaves a transparent hole in the GUI surface (anything drawn later stays on top).
+        Without one, or if the content is too tall for a texture, rows are composed here.
+        """
+        ctx = self._gpu_context()
+        self.gpu_active = ctx is not None
+        if self.gpu_active:
+            self._update_content_texture(ctx)
+            screen.fill((0, 0, 0, 0), (self.x, self.y, self.width, self.height))
+        else:
+            self._render_visible_rows(screen)
 
         # ---- Scroll indicator ----
         scroll_bar_x = self.x + self.width + 10  # Just outside the table
@@ -134,26 +173,192 @@ class ScrollingTableVertical(Table):
                              (self.width, tri_y + triangle_height + 2), 2)
 
 
+    def _render_visible_rows(self, screen):
+        """
+        Draw the rows that intersect the viewport. Every row is rendered once into its own
+        surface and only redrawn when one of its cells changes (see _render_state), the
+        composed viewport is only rebuilt when a row or the scroll offset changes.
+        """
+        size = (int(self.width), int(self.height))
+        if self._viewport is None or self._viewport.get_size() != size:
+            self._viewport = pygame.Surface(size, pygame.SRCALPHA)
+            self.invalidate()
+
+        first_row, last_row = self._visible_rows()
+        visible = range(first_row, last_row + 1)
+        style_id = id(StyleManager.current_style)
+
+        changed = self._viewport_key != (self.scroll_offset, first_row, last_row)
+        for r in visible:
+            state = self._row_state(r, style_id)
+            cached = self._row_cache.get(r)
+            if cached is None or cached[0] != state or self._row_animating(r):
+                self._row_cache[r] = (state, self._render_row(r, cached[1] if cached else None))
+                changed = True
+        # Rows scrolled out of view are rendered again when they come back
+        for r in [r for r in self._row_cache if r not in visible]:
+            del self._row_cache[r]
+
+        if changed:
+            self._viewport.fill((0, 0, 0, 0))
+            for r in visible:
+                self._viewport.blit(self._row_cache[r][1], (0, round(r * self.cell_height - self.scroll_offset)))
+            self._viewport_key = (self.scroll_offset, first_row, last_row)
+
+        # Blit to screen
+        screen.blit(self._viewport, (self.x, self.y))
+
+    def _visible_rows(self):
+        """First and last row intersecting the viewport at the shown offset"""
+        first_row = max(0, int(self.scroll_offset // self.cell_height))
+        last_row = min(self.rows - 1, int((self.scroll_offset + self.height - 1) // self.cell_height))
+        return first_row, last_row
+
+    def _gpu_context(self):
+        """GL context to scroll on, None to compose rows on the CPU"""
+        if not GPU_SCROLLING or not self.gpu_scroll_allowed or self.manager is None:
+            return None
+        ctx = self.manager.screen3Drefs.get('ctx')
+        if ctx is None:
+            return None
+        if self._max_texture_size is None:
+            self._max_texture_size = ctx.info["GL_MAX_TEXTURE_SIZE"]
+        if max(self.totalHeight, self.height) > self._max_texture_size:
+            return None
+        return ctx
+
+    def _update_content_texture(self, ctx):
+        """Upload the rows that changed since the last frame (all rows the first time)"""
+        size = (int(self.width), int(math.ceil(max(self.totalHeight, self.height))))
+        if self.content_texture is None or self.content_texture.size != size:
+            if self.content_texture is not None:
+                self.content_texture.release()
+            self.content_texture = ctx.texture(size, 4, bytes(size[0] * size[1] * 4))
+            self.content_texture.filter = (ctx.NEAREST, ctx.NEAREST)  # 1:1 with screen pixels
+            self.content_texture.repeat_x = False
+            self.content_texture.repeat_y = False
+            self._content_states = {}
+
+        row_height = int(math.ceil(self.cell_height))
+        style_id = id(StyleManager.current_style)
+        # Rows are checked for changes once they are visible, scrolling to them is free
+        first_row, last_row = self._visible_rows()
+        for r in range(self.rows):
+            if r in self._content_states and not first_row <= r <= last_row:
+                continue
+            state = self._row_state(r, style_id)
+            if self._content_states.get(r) == state and not self._row_animating(r):
+                continue
+            self._row_surface = self._render_row(r, self._row_surface)
+            self._write_row(r, pygame.image.tobytes(self._row_surface, "RGBA"), row_height)
+            self._content_states[r] = state
+        # Rows that were removed leave transparent space behind
+        for r in [r for r in self._content_states if r >= self.rows]:
+            self._write_row(r, bytes(size[0] * row_height * 4), row_height)
+            del self._content_states[r]
+
+    def _write_row(self, row, data, row_height):
+        """Write one row's RGBA bytes into content_texture (texture rows are top row first)"""
+        width, height = self.content_texture.size
+        y = round(row * self.cell_height)
+        rows = min(row_height, height - y)
+        if rows <= 0:
+            return
+        self.content_texture.write(data[:width * rows * 4], viewport=(0, y, width, rows))
+
+    def scroll_uniforms(self):
+        """Uniforms for PostProcess.ScrollLayer, which draws the content texture under the GUI"""
+        texture_height = self.content_texture.size[1]
+        return {
+            'scroll_rect': (int(self.x), int(self.y), int(self.width), int(self.height)),
+            'scroll_uv': (self.scroll_offset / texture_height, self.height / texture_height),
+        }
+
+    def _row_state(self, row, style_id):
+        return (style_id, tuple(_render_state(e) for e in self.elements_grid[row] if e is not None))
+
+    def _row_animating(self, row):
+        return any(e is not None and e.needs_animation for e in self.elements_grid[row])
+
+    def _render_row(self, row, surface=None):
+        """Render one row into its own surface (reused if given), cells drawn relative to the row's top-left"""
+        size = (int(self.width), int(math.ceil(self.cell_height)))
+        if surface is None or surface.get_size() != size:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        row_y = self.y + row * self.cell_height
+        for element in self.elements_grid[row]:
+            if element is None:
+                continue
+            # Temporarily adjust coordinates so they're relative to the row's top-left
+            original_x, original_y = element.x, element.y
+            element.x -= self.x
+            element.y -= row_y
+            element.render(surface)
+            element.x, element.y = original_x, original_y  # restore absolute positions
+        return surface
+
+    def invalidate(self):
+        """Drop all cached rows, e.g. after changing something a cell's attributes don't show"""
+        self._row_cache = {}
+        self._viewport_key = None
+        self._content_states = {}
+        if self.content_texture is not None:
+            # Recreated empty on the next render, removed rows mustn't stay in it
+            self.content_texture.release()
+            self.content_texture = None
+
+    def release(self):
+        """Release the cells, the content texture and a running scroll"""
+        super().release()
+        frame_clock = getattr(self.manager, 'frame_clock', None)
+        if frame_clock is not None:
+            frame_clock.unsubscribe(self._advance_scroll)
+        if self.content_texture is not None:
+            self.content_texture.release()
+            self.content_texture = None
+
     def changeDims(self,newTotalHeight):
+        # Same height: rows are redrawn as their cells change (reloads reuse them, see Table._load_rows)
+        resized = newTotalHeight != self.totalHeight
         self.totalHeight = newTotalHeight
         self.max_offset = max(0, self.totalHeight - self.height)
         self.enforceElementsSize()
+        if resized:
+            self.invalidate()
+
+    def scroll_into_view(self, element):
+        """Scroll smoothly just far enough for an element's row to be fully visible"""
+        top = element.y - self.y
+        bottom = top + element.height
+        if top < self.scroll_target:
+            self.scroll_to(top)
+        elif bottom > self.scroll_target + self.height:
+            self.scroll_to(bottom - self.height)
 
-    def setNeighbors(self):
-        """ Override Set up neighbors, so that if the element is at edge and bellow it or above it there is none, set it to neares one"""
-        super().setNeighbors()
-        for r in range(self.rows):
-            for c in range(self.cols):
-                elem = self.elements_grid[r][c]
-                if elem is None:
-                    continue
-                # Up neighbor
-                if r > 0 and self.elements_grid[r-1][c] is None:
-                    elem.set_neighbor("up", self.getElementsInRow(r-1)[-1])
-                # Down neighbor
-                if r < self.rows-1 and self.elements_grid[r+1][c] is None:
-                     elem.set_neighbor("down", self.getElementsInRow(r+1)[-1])
 
-        
+def _render_state(element):
+    """
+    Everything a cell's rendering can depend on that changes at runtime: its own plain
+    attributes (text, values, edit state, focus, position...) and one level of dicts and
+    lists (style overrides). Other objects (fonts, styles) only count by identity.
+    """
+    state = [id(element)]
+    for name, value in vars(element).items():
+        kind = type(value)
+        if kind in _PLAIN_TYPES:
+            state.append(value)
+        elif name in _IGNORED_ATTRIBUTES:
+            continue
+        elif kind is dict:
+            state.append(tuple(value.items()))
+        elif kind is list:
+            state.append(tuple(value))
+        else:
+            state.append(id(value))
+    return tuple(state)
 
 
+_PLAIN_TYPES = {int, float, str, bool, tuple, type(None)}
+# Attributes that never change how a cell looks
+_IGNORED_ATTRIBUTES = {"neighbors", "parent_panel", "manager"}
@@ -16,6 +16,12 @@ class Table(Panel):
         self.elements_grid = [[None for _ in range(cols)] for _ in range(rows)]
         self.elements = []
         self.drawBorder = drawBorder
+        # Reloads reuse cells instead of building the grid anew (see _load_rows)
+        self._cell_roles = {}  # id(cell) -> role of the cells the loads created ("label", "set"...)
+        self._spare_cells = {}  # role -> cells of earlier loads that aren't in the grid anymore
+        self._row_data = []  # row -> data its cells were loaded from, None once they were changed
+        self._program_name = None  # program of the loaded session
+        self._exercise_details = {}  # Query.get_program_exercise_details of that program
 
     def add_element(self, element, row, col):
         """Add element at specific row, col and reposition all."""
@@ -68,39 +74,19 @@ class Table(Panel):
     
     def enforceElementsSize(self):
         """Ensure all elements fit within their grid cells."""
-        cell_width = self.width / self.cols - 1
-        cell_height = self.height / self.rows - 1
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.elements_grid[r][c] is not None:
-                    self.elements_grid[r][c].width = cell_width
-                    self.elements_grid[r][c].height = cell_height
-                    self.elements_grid[r][c].x = self.x + c  * cell_width + 2
-                    self.elements_grid[r][c].y = self.y + r * cell_height + 2
-                        
-                    
-                    
-
-    def setNeighbors(self):
-        """Set up neighbors in all four directions for grid layout."""
         for r in range(self.rows):
-            for c in range(self.cols):
-                elem = self.elements_grid[r][c]
-                if elem is None:
-                    continue
-                # Up neighbor
-                if r > 0 and self.elements_grid[r-1][c]:
-                    elem.set_neighbor("up", self.elements_grid[r-1][c])
-                # Down neighbor
-                if r < self.rows-1 and self.elements_grid[r+1][c]:
-                    elem.set_neighbor("down", self.elements_grid[r+1][c])
-                # Left neighbor
-                if c > 0 and self.elements_grid[r][c-1]:
-                    elem.set_neighbor("left", self.elements_grid[r][c-1])
-                # Right neighbor
-                if c < self.cols-1 and self.elements_grid[r][c+1]:
-                    elem.set_neighbor("right", self.elements_grid[r][c+1])
+            self._place_row(r)
 
+    def _place_row(self, r):
+        """Fit the elements of one row into their grid cells."""
+        cell_width = self.width / self.cols - 1
+        cell_height = self.height / self.rows - 1
+        for c in range(self.cols):
+            if self.elements_grid[r][c] is not None:
+                self.elements_grid[r][c].width = cell_width
+                self.elements_grid[r][c].height = cell_height
+                self.elements_grid[r][c].x = self.x + c  * cell_width + 2
+                self.elements_grid[r][c].y = self.y + r * cell_height + 2
 
     def render(self, screen):
         # Draw table/grid lines if enabled
@@ -125,234 +111,206 @@ class Table(Panel):
             element.render(screen)
 
     def load_data_program(self, data, manager=None, **button_kwargs):
+        """
+        Show a program (Query.get_program_table_data): the header as labels, the exercises
+        as buttons in the color of their target. Reloading reuses the cells, only rows whose
+        data changed are updated. button_kwargs only apply to newly created buttons.
+        """
         if not data or not data[0]:
             return
-            
-        self.rows = len(data)
-        self.cols = len(data[0])
-        self.elements_grid = [[None for _ in range(self.cols)] for _ in range(self.rows)]
-        self.elements = []  # Clear existing elements
-        
-        cell_width = self.width / self.cols
-        cell_height = self.height / self.rows
-        
-        for r, row in enumerate(data):
+
+        # One lookup for the targets of all rows
+        exercises = self.manager.queryTool.get_exercises_by_names([row[0] for row in data[1:]])
+
+        def fill_row(r, row, cells):
+            if r == 0:
+                for c, value in enumerate(row):
+                    label = cells.take(c, "label", lambda: Label(text="", manager=manager, parent_panel=self))
+                    label.editText(str(value))
+                return
+            color = StyleManager.get_muscle_group_color(exercises[row[0]].target)["bg_color"]
             for c, value in enumerate(row):
-                x = self.x + c * cell_width
-                y = self.y + r * cell_height
-                if r == 0:
-                    elem = Label(
-                        text=str(value), x=x, y=y, 
-                        width=cell_width, height=cell_height, 
-                        manager=manager, parent_panel=self
-                    )
-                else:
-                    color=StyleManager.get_muscle_group_color(self.manager.queryTool.get_exercise_by_name(data[r][0]).target)["bg_color"]
-                    elem = Button(
-                        text=str(value), x=x, y=y, 
-                        width=cell_width, height=cell_height, 
-                        manager=manager, parent_panel=self, 
-                        **button_kwargs
-                    )
-                    elem.set_style_override({'bg_color': color})
-                self.elements_grid[r][c] = elem
-                self.elements.append(elem)  # Add to elements list for rendering
-                
-        self.setNeighbors()
-        self.enforceElementsSize()
+                button = cells.take(c, "cell", lambda: Button(manager=manager, parent_panel=self, **button_kwargs))
+                button.text = str(value)
+                button.set_style_override({'bg_color': color})
+
+        self._load_rows(data, len(data[0]), fill_row)
 
     def load_data_session(self, programName, data, manager=None, **button_kwargs):
+        """
+        Show the last session of a program (Query.get_session_as_list): per exercise its name,
+        a SessionCell per set and an AddSet button. Reloading reuses the cells, rows whose data
+        changed or that were edited are loaded anew, the others are kept as they are.
+        button_kwargs only apply to newly created cells.
+        """
         if not data:
             # Initialize empty table
+            self._load_rows([], 2, None)
             self.rows = 1
-            self.cols = 2
             self.elements_grid = [[None for _ in range(self.cols)] for _ in range(self.rows)]
-            self.elements = []
             return
 
-        # Calculate max number of sets (add 1 extra column for AddSet button)
-        set_counts = [len(row) - 1 for row in data if isinstance(row, (list, tuple))]
-        max_sets = max(set_counts) if set_counts else 1
-        self.rows = len(data)
-        self.cols = 1 + max_sets + 1  # 1 for exercise name + max sets columns + 1 for AddSet button
-        self.elements_grid = [[None for _ in range(self.cols)] for _ in range(self.rows)]
-        self.elements = []
-
-        cell_width = self.width / self.cols
-        cell_height = self.height / self.rows
-
-        for r, row in enumerate(data):
-            if not isinstance(row, (list, tuple)) or len(row) == 0:
-                continue
+        # One lookup for the targets and rep ranges of all rows
+        self._program_name = programName
+        self._exercise_details = self.manager.queryTool.get_program_exercise_details(programName)
 
-            y = self.y + r * cell_height
+        def fill_row(r, row, cells):
             # Exercise name Button
             exercise_name = str(row[0])
-            exercise_repRange = self.manager.queryTool.get_exercise_rep_range(programName, exercise_name)
-            exercise_target = self.manager.queryTool.get_exercise_by_name(exercise_name).target
-            #print(f"EXERCISE targer: {exercise_target}")
-            button_elem = Button(
-                text=exercise_name,
-                x=self.x + 0.5 * cell_width,
-                y=y,
-                width=cell_width,
-                height=cell_height,
-                manager=manager,
-                parent_panel=self
-            )
-            button_elem.set_style_override({'bg_color': StyleManager.get_muscle_group_color(exercise_target)['bg_color']})
+            exercise, exercise_repRange = self._exercise_detail(programName, exercise_name)
+            button_elem = cells.take(0, "exercise", lambda: Button(manager=manager, parent_panel=self))
+            button_elem.text = exercise_name
+            button_elem.set_style_override({'bg_color': StyleManager.get_muscle_group_color(exercise.target)['bg_color']})
             button_elem.set_style_override({'text_color': (0,0,0)})
-            self.elements_grid[r][0] = button_elem
-            self.elements.append(button_elem)
 
             # Session cells for sets
             for c in range(1, len(row)):
                 weight = 0
                 reps = 0
-                if c < len(row) and isinstance(row[c], (list, tuple)) and len(row[c]) >= 2:
+                if isinstance(row[c], (list, tuple)) and len(row[c]) >= 2:
                     weight, reps = row[c][0], row[c][1]
-
-                cell_elem = SessionCell(
-                    x = self.x + (c + 0.5) * cell_width,
-                    y = y,
-                    width=cell_width,
-                    height=cell_height,
-                    manager=manager,
-                    parent_panel=self,
-                    weight_previous=weight,
-                    reps_previous=reps,
-                    rep_range=exercise_repRange,
-                    exercise=exercise_name,
-                    **button_kwargs
-                )
-                #print(f"r {r}")
-                #print(f"cell height {cell_height}")
-                #print(f"inside cell {cell_elem.y}")
-                #print(f"table y  {self.y}")
-                self.elements_grid[r][c] = cell_elem
-                self.elements.append(cell_elem)
+                cell_elem = cells.take(c, "set", lambda: self._new_session_cell(manager, **button_kwargs))
+                cell_elem.load_set(weight, reps, exercise_repRange, exercise_name, exercise.target, exercise.weight_inc)
 
             # Add "AddSet" button at the end of each row
-            add_set_col = len(row)  # This will be the column after the last set
-            add_set_button = Button(
-                text="+ Add Set",
-                x=self.x + (add_set_col + 0.5) * cell_width,
-                y=y,
-                width=cell_width,
-                height=cell_height,
-                manager=manager,
-                parent_panel=self
-            )
-            
-            # Add action to the button
-            add_set_button.on_press = lambda r=r: self._add_set_to_row(r,programName)
-            
-            self.elements_grid[r][add_set_col] = add_set_button
-            self.elements.append(add_set_button)
+            cells.take(len(row), "add_set", lambda: self._new_add_set_button(manager))
+
+        # Calculate max number of sets (add 1 extra column for AddSet button)
+        set_counts = [len(row) - 1 for row in data if isinstance(row, (list, tuple))]
+        max_sets = max(set_counts) if set_counts else 1
+        self._load_rows(data, 1 + max_sets + 1, fill_row, key=programName)  # 1 for exercise name + max sets columns + 1 for AddSet button
+
+    def _load_rows(self, data, cols, fill_row, key=None):
+        """
+        Resize the grid to the rows of data and cols columns, and fill the rows that changed.
+
+        A row is kept untouched when it was loaded from the same data (and key) and none of its
+        SessionCells were edited since. fill_row(r, row, cells) fills the others, cells.take(c,
+        role, create) hands it the cell to show at column c: the one already there if it has
+        that role, otherwise a spare one of an earlier load, create() only if there is none.
+        Cells left over go to the spares. Only rows of data that are non-empty lists get cells.
+        """
+        old_grid = self.elements_grid
+        new_grid = [[None for _ in range(cols)] for _ in range(len(data))]
+        row_data = []
+        for r, row in enumerate(data):
+            if not isinstance(row, (list, tuple)) or len(row) == 0:
+                row_data.append(None)
+                continue
+            old_row = old_grid[r] if r < len(old_grid) else []
+            loaded_from = (key, tuple(row))
+            if r < len(self._row_data) and self._row_data[r] == loaded_from and not self._row_edited(old_row):
+                for c, cell in enumerate(old_row):
+                    if cell is not None:
+                        new_grid[r][c] = cell
+            else:
+                fill_row(r, row, _RowCells(self, old_row, new_grid[r]))
+            row_data.append(loaded_from)
 
-        self.setNeighbors()
+        used = {id(cell) for grid_row in new_grid for cell in grid_row if cell is not None}
+        for grid_row in old_grid:
+            for cell in grid_row:
+                if cell is not None and id(cell) not in used:
+                    self._release_cell(cell)
+
+        self.rows = len(data)
+        self.cols = cols
+        self.elements_grid = new_grid
+        self.elements = self.getElements()
+        self._row_data = row_data
         self.enforceElementsSize()
 
+    def _row_edited(self, row):
+        """True if a SessionCell of the row isn't as it was loaded anymore"""
+        return any(isinstance(cell, SessionCell) and cell.edit_state != "notEdited" for cell in row)
+
+    def _take_cell(self, role, create):
+        """A spare cell of a role, create() a new one if there is none"""
+        spare = self._spare_cells.get(role)
+        if spare:
+            return spare.pop()
+        cell = create()
+        self._cell_roles[id(cell)] = role
+        return cell
+
+    def _release_cell(self, cell):
+        """Keep a cell that left the grid for the next load (only the ones the loads created)"""
+        role = self._cell_roles.get(id(cell))
+        if role is not None:
+            self._spare_cells.setdefault(role, []).append(cell)
+
+    def _new_session_cell(self, manager, **kwargs):
+        return SessionCell(manager=manager, parent_panel=self, weight_previous=0, reps_previous=0,
+                           rep_range=None, exercise=None, target="", weight_inc=0, **kwargs)
+
+    def _new_add_set_button(self, manager):
+        add_set_button = Button(text="+ Add Set", manager=manager, parent_panel=self)
+        # The button moves between rows when cells are reused, its row is looked up when pressed
+        add_set_button.on_press = lambda: self._add_set_to_row(self._row_of(add_set_button), self._program_name)
+        return add_set_button
+
+    def _row_of(self, element):
+        for r, row in enumerate(self.elements_grid):
+            if element in row:
+                return r
+        raise ValueError("Element is not in the table")
+
+    def _exercise_detail(self, programName, exercise_name):
+        """(Exercise, rep range) of an exercise of the program, from the lookup of the last load if it's for that program"""
+        if programName == self._program_name:
+            detail = self._exercise_details.get(exercise_name.lower())
+            if detail is not None:
+                return detail
+        query = self.manager.queryTool
+        return query.get_exercise_by_name(exercise_name), query.get_exercise_rep_range(programName, exercise_name)
+
     def _add_set_to_row(self, row_index, programName):
         """Callback for when AddSet button is pressed - adds a new set to the row"""
         row = self.elements_grid[row_index]
-        
-        # Find the last SessionCell in the row
-        last_set_col = 0
+
+        # The AddSet button follows the last set
+        add_set_col = None
         for c in range(len(row)-1, -1, -1):  # Search from right to left
-            if row[c] is not None and isinstance(row[c], SessionCell):
-                last_set_col = c
+            if row[c] is not None and self._cell_roles.get(id(row[c])) == "add_set":
+                add_set_col = c
                 break
-        
-        # Get current cell dimensions
-        cell_width = self.width / self.cols
-        cell_height = self.height / self.rows
-        
-        # Get exercise info from first cell in row
-        exercise_button = self.elements_grid[row_index][0]
-        exercise_name = exercise_button.text if exercise_button else "Unknown"
-        exercise_repRange = self.manager.queryTool.get_exercise_rep_range(programName, exercise_name)
-        
-        # Check if we need to expand the table
-        if last_set_col >= self.cols - 2:  # -2 because last column is AddSet button
-            # Expand table by one column
+        if add_set_col is None:
+            print("Error: Couldn't find AddSet button in row")
+            return
+
+        # Expand the table by one column if the button is in the last one
+        expanded = add_set_col == self.cols - 1
+        if expanded:
             self.cols += 1
-            new_cell_width = self.width / self.cols
-            
-            # Update grid structure
-            for r in range(self.rows):
-                self.elements_grid[r].append(None)  # Add new column
-                
-            # Move AddSet button to new position
-            add_set_button = self.elements_grid[row_index][-2]  # Get current AddSet button
-            if add_set_button:
-                self.elements_grid[row_index][-1] = add_set_button  # Move to new column
-                self.elements_grid[row_index][-2] = None  # Clear old position
-                
-                # Update button position
-                add_set_button.width = new_cell_width
-                add_set_button.x = self.x + (self.cols-1) * new_cell_width
-            
-            # Position for new set is after last set
-            new_col = last_set_col + 1
-        else:
-            # Find the AddSet button in this row
-            add_set_col = None
-            for c in range(len(row)-1, -1, -1):
-                if row[c] is not None and hasattr(row[c], 'text') and row[c].text == "+ Add Set":
-                    add_set_col = c
-                    break
-            
-            if add_set_col is None:
-                print("Error: Couldn't find AddSet button in row")
-                return
-            
-            # Move AddSet button one column to the right
-            add_set_button = row[add_set_col]
-            self.elements_grid[row_index][add_set_col + 1] = add_set_button
-            self.elements_grid[row_index][add_set_col] = None
-            
-            # Update button position
-            add_set_button.x = self.x + (add_set_col + 1) * cell_width
-            
-            # Position for new set is where AddSet button was
-            new_col = add_set_col
-        
-        # Create new SessionCell at the calculated position
-        new_cell = SessionCell(
-            x=self.x + new_col * cell_width,
-            y=self.y + row_index * cell_height,
-            width=cell_width,
-            height=cell_height,
-            manager=self.manager,
-            parent_panel=self,
-            weight_previous=0,  # Default weight
-            reps_previous=0,    # Default reps
-            rep_range=exercise_repRange,
-            exercise=exercise_name
-        )
-        
-        # Insert the new cell into the grid
-        self.elements_grid[row_index][new_col] = new_cell
+            for grid_row in self.elements_grid:
+                grid_row.append(None)
+
+        # Move AddSet button one column to the right, the new set takes its place
+        exercise_name = row[0].text if row[0] else "Unknown"
+        exercise, exercise_repRange = self._exercise_detail(programName, exercise_name)
+        new_cell = self._take_cell("set", lambda: self._new_session_cell(self.manager))
+        new_cell.load_set(0, 0, exercise_repRange, exercise_name, exercise.target, exercise.weight_inc)  # New set, no previous values
+        row[add_set_col + 1] = row[add_set_col]
+        row[add_set_col] = new_cell
         self.elements.append(new_cell)
-        
-        # Update neighbors
-        self.setNeighbors()
-        self.manager.current_menu.connectNeighbors()
-        
-        # Reposition all elements
-        self.enforceElementsSize()
-        
+        if row_index < len(self._row_data):
+            self._row_data[row_index] = None  # not what was loaded anymore
+
+        # Reposition the row, all rows if the columns got narrower
+        if expanded:
+            self.enforceElementsSize()
+        else:
+            self._place_row(row_index)
+
         # Focus on the new cell
         if hasattr(self.manager, 'focus_manager'):
             self.manager.focus_manager.set_focus(new_cell)
 
-        # Update cells fromPrevious values
-        if  self.getElementsInRow(row_index)[-3] is not None and isinstance(self.getElementsInRow(row_index)[-3], SessionCell):
-            prev_weight = self.getElementsInRow(row_index)[-3].weightFromPreviousSession
-            prev_reps = self.getElementsInRow(row_index)[-3].repsFromPreviousSession
-            self.getElementsInRow(row_index)[-2].input_value_weight = prev_weight
-            self.getElementsInRow(row_index)[-2].input_value_reps = prev_reps
+        # Start from the values of the previous set
+        previous = row[add_set_col - 1]
+        if isinstance(previous, SessionCell):
+            new_cell.input_value_weight = previous.weightFromPreviousSession
+            new_cell.input_value_reps = previous.repsFromPreviousSession
 
     def get_session_data_JSON(self, program_name, date, bodyweight):
         """Convert table data to JSON session format.
@@ -401,4 +359,26 @@ class Table(Panel):
             if exercise_data["sets"]:
                 session_data["exercises"].append(exercise_data)
         
-        return session_data
\ No newline at end of file
+        return session_data
+
+
+class _RowCells:
+    """Hands out the cells of a row being loaded, see Table._load_rows"""
+
+    def __init__(self, table, old_row, new_row):
+        self.table = table
+        self.old_row = list(old_row)
+        self.new_row = new_row
+
+    def take(self, col, role, create):
+        roles = self.table._cell_roles
+        # The cell already at col, any other of the row with the role (the sets shifted), a spare one
+        cell = self.old_row[col] if col < len(self.old_row) else None
+        if cell is None or roles.get(id(cell)) != role:
+            cell = next((old for old in self.old_row if old is not None and roles.get(id(old)) == role), None)
+        if cell is None:
+            cell = self.table._take_cell(role, create)
+        else:
+            self.old_row[self.old_row.index(cell)] = None
+        self.new_row[col] = cell
+        return cell
@@ -0,0 +1,16 @@
+#version 330
+// Chart geometry (see ChartRenderer) in pixels, top-left origin like pygame
+in vec2 in_pos;
+in float in_dist;   // lines: signed distance from the line center in pixels
+
+uniform vec2 size;         // framebuffer size in pixels
+uniform float point_size;  // points: sprite size in pixels
+
+out float v_dist;
+
+void main() {
+    // Pixel row 0 goes to the framebuffer's first row, which fbo.read() returns first
+    gl_Position = vec4(in_pos / size * 2.0 - 1.0, 0.0, 1.0);
+    gl_PointSize = point_size;
+    v_dist = in_dist;
+}
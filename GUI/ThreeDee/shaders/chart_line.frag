@@ -0,0 +1,12 @@
+#version 330
+// Anti-aliased line: coverage falls off over the last pixel of the half width
+in float v_dist;
+out vec4 f_color;
+
+uniform vec3 color;
+uniform float half_width;
+
+void main() {
+    float coverage = clamp(half_width + 0.5 - abs(v_dist), 0.0, 1.0);
+    f_color = vec4(color * coverage, coverage);  // premultiplied alpha
+}
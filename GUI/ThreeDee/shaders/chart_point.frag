@@ -0,0 +1,17 @@
+#version 330
+// Anti-aliased data point: a ring of color around a fill (Plotter draws bg colored centers)
+in float v_dist;
+out vec4 f_color;
+
+uniform vec3 color;
+uniform vec3 fill;
+uniform float radius;
+uniform float inner_radius;
+uniform float point_size;
+
+void main() {
+    float d = length(gl_PointCoord - 0.5) * point_size;
+    float coverage = clamp(radius + 0.5 - d, 0.0, 1.0);
+    float inside = clamp(inner_radius + 0.5 - d, 0.0, 1.0);
+    f_color = vec4(mix(color, fill, inside) * coverage, coverage);  // premultiplied alpha
+}
@@ -0,0 +1,42 @@
+#version 330
+// Pie chart: every pixel finds its slice by angle, no polygons. Edges are anti-aliased,
+// at the rim and between slices (blended with the neighbor over one pixel of arc)
+in vec2 v_uv;
+out vec4 f_color;
+
+const int MAX_SLICES = 16;
+const float TAU = 6.28318530718;
+
+uniform vec2 center;                // pixels, top-left origin
+uniform float radius;
+uniform float start_angle;          // radians, pygame's orientation (y down, clockwise)
+uniform int slice_count;
+uniform float slice_end[MAX_SLICES];  // cumulative angle at the end of every slice (last = TAU)
+uniform vec3 slice_color[MAX_SLICES];
+
+void main() {
+    // gl_FragCoord row 0 is pixel row 0 (see chart.vert)
+    vec2 p = gl_FragCoord.xy - center;
+    float r = length(p);
+    float coverage = clamp(radius + 0.5 - r, 0.0, 1.0);
+    if (coverage <= 0.0 || slice_count == 0) {
+        discard;
+    }
+    float angle = mod(atan(p.y, p.x) - start_angle, TAU);
+
+    int i = 0;
+    while (i < slice_count - 1 && angle >= slice_end[i]) {
+        i++;
+    }
+    float slice_start = i == 0 ? 0.0 : slice_end[i - 1];
+    vec3 color = slice_color[i];
+    // Arc distance in pixels to both borders of the slice
+    float to_start = (angle - slice_start) * r;
+    float to_end = (slice_end[i] - angle) * r;
+    if (slice_count > 1 && to_start < 0.5) {
+        color = mix(slice_color[i == 0 ? slice_count - 1 : i - 1], color, 0.5 + to_start);
+    } else if (slice_count > 1 && to_end < 0.5) {
+        color = mix(slice_color[i == slice_count - 1 ? 0 : i + 1], color, 0.5 + to_end);
+    }
+    f_color = vec4(color * coverage, coverage);  // premultiplied alpha
+}
@@ -13,8 +13,8 @@ void main() {
     // Convert screen uv to TOP-LEFT space once
     vec2 uv_top = vec2(v_uv.x, 1.0 - v_uv.y);
 
-    // GUI samples already in top-left space
-    vec4 gui_color = texture(tex_gui, uv_top);
+    // GUI texture is uploaded bottom row first, same space as v_uv
+    vec4 gui_color = texture(tex_gui, v_uv);
 
     // Compute element-relative uv ALSO in top-left space
     vec2 rel_uv_top = (uv_top - elem_pos) / elem_size;
@@ -0,0 +1,34 @@
+#version 330
+// Muscle heatmap: colors a label map (see Image2D_Graph) by per-muscle intensity
+in vec2 v_uv;
+out vec4 f_color;
+
+uniform sampler2D labels;      // R8, label / 255 per pixel, NEAREST filtered
+uniform float intensity[11];   // 0..1 per muscle, in Image2D_Graph.LABEL_COLORS order
+uniform vec3 gray_color[11];   // muscle color grayed out, shown for untrained muscles
+uniform vec3 line_color;       // label 1 (black outlines in the source image)
+uniform vec3 detail_color;     // label 2 (gray details)
+
+// Cold -> warm -> hot
+vec3 ramp(float t) {
+    vec3 cold = vec3(0.20, 0.40, 1.00);
+    vec3 warm = vec3(1.00, 0.90, 0.20);
+    vec3 hot = vec3(1.00, 0.20, 0.10);
+    return t < 0.5 ? mix(cold, warm, t * 2.0) : mix(warm, hot, t * 2.0 - 1.0);
+}
+
+void main() {
+    int label = int(texture(labels, v_uv).r * 255.0 + 0.5);
+    if (label == 0) {
+        f_color = vec4(0.0);
+    } else if (label == 1) {
+        f_color = vec4(line_color, 1.0);
+    } else if (label == 2) {
+        f_color = vec4(detail_color, 1.0);
+    } else {
+        int muscle = label - 3;
+        float t = clamp(intensity[muscle], 0.0, 1.0);
+        // Fade in quickly so lightly trained muscles already stand out from the untrained ones
+        f_color = vec4(mix(gray_color[muscle], ramp(t), min(1.0, t * 4.0)), 1.0);
+    }
+}
@@ -0,0 +1,198 @@
+from pathlib import Path
+import numpy as np
+import moderngl
+import pygame
+from GUI.Distortions.PostProcess import QUAD_VERTICES, COMPOSITE_VERTEX_SHADER, _read
+
+SHADER_DIR = Path(__file__).parent.parent / "ThreeDee" / "shaders"
+# Draw charts with ChartRenderer when the manager has a hardware GL context (False: always pygame)
+GPU_CHARTS = True
+# Software rasterisers fill the anti-aliased geometry slower than pygame draws it
+SOFTWARE_RENDERERS = ("llvmpipe", "softpipe", "swrast", "SwiftShader")
+
+_programs = {}  # id(ctx) -> {name: program}, compiled once per context
+_hardware = {}  # id(ctx) -> True if the renderer isn't a software rasteriser
+
+
+def _program(ctx, name):
+    programs = _programs.setdefault(id(ctx), {})
+    if name not in programs:
+        if name == "sector":
+            vertex_shader = _read(COMPOSITE_VERTEX_SHADER)
+        else:
+            vertex_shader = _read(SHADER_DIR / "chart.vert")
+        programs[name] = ctx.program(vertex_shader=vertex_shader,
+                                     fragment_shader=_read(SHADER_DIR / f"chart_{name}.frag"))
+    return programs[name]
+
+
+def chart_context(manager):
+    """GL context charts are drawn with, None to draw them with pygame"""
+    if not GPU_CHARTS or manager is None:
+        return None
+    ctx = manager.screen3Drefs.get('ctx')
+    if ctx is None:
+        return None
+    if id(ctx) not in _hardware:
+        renderer = ctx.info.get("GL_RENDERER", "")
+        _hardware[id(ctx)] = not any(name in renderer for name in SOFTWARE_RENDERERS)
+    return ctx if _hardware[id(ctx)] else None
+
+
+class ChartRenderer:
+    def __init__(self, ctx, size):
+        """
+        Draws chart geometry on the GPU: anti-aliased lines, data points and pie sectors
+        (chart_*.frag). Series are uploaded as vertex buffers once per draw, so thousands
+        of points cost one draw call instead of a Python loop of pygame draws.
+
+        Like MuscleHeatmap, the result is read back into a pygame surface for the GUI, so
+        draw again only when the chart changes. The surface has premultiplied alpha, blit
+        it with special_flags=pygame.BLEND_PREMULTIPLIED.
+
+        Usage:
+            renderer.begin()
+            renderer.lines(points, color)
+            surface = renderer.end()
+
+        Parameters:
+            ctx (moderngl.Context): Context of the main loop (see chart_context)
+            size (tuple): (width, height) of the drawing in pixels
+        """
+        self.ctx = ctx
+        self.size = (int(size[0]), int(size[1]))
+        self.target = ctx.texture(self.size, 4)
+        self.fbo = ctx.framebuffer(color_attachments=[self.target])
+        self.quad = ctx.buffer(QUAD_VERTICES.tobytes())
+        # chart_sector.frag works in gl_FragCoord, the quad's uv is skipped
+        self.sector_vao = ctx.vertex_array(_program(ctx, "sector"), [(self.quad, '2f 8x', 'in_vert')])
+        self._previous = None
+
+    def begin(self):
+        """Clear the drawing, following draws go into it until end()"""
+        ctx = self.ctx
+        self._previous = (ctx.fbo, ctx.viewport)
+        self.fbo.use()
+        self.fbo.clear(0.0, 0.0, 0.0, 0.0)
+        ctx.enable(moderngl.BLEND | moderngl.PROGRAM_POINT_SIZE)
+        ctx.blend_func = moderngl.ONE, moderngl.ONE_MINUS_SRC_ALPHA  # shaders output premultiplied alpha
+
+    def end(self):
+        """
+        Returns:
+            pygame.Surface (RGBA, premultiplied alpha) of the drawing
+        """
+        ctx = self.ctx
+        data = self.fbo.read(components=4)
+        ctx.blend_func = moderngl.DEFAULT_BLENDING
+        ctx.disable(moderngl.BLEND | moderngl.PROGRAM_POINT_SIZE)
+        # Leave the main loop's state as it was (a fresh standalone context has no framebuffer yet)
+        previous_fbo, previous_viewport = self._previous
+        if previous_fbo is not None:
+            previous_fbo.use()
+            ctx.viewport = previous_viewport
+
+        surface = pygame.image.frombytes(data, self.size, "RGBA")
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    def lines(self, points, color, width=2):
+        """
+        Connected line through points.
+
+        Parameters:
+            points (np.ndarray): (n, 2) pixel positions, top-left origin
+            color (tuple): RGB 0-255
+            width (float): Line width in pixels
+        """
+        points = np.asarray(points, dtype=np.float32) + 0.5  # through pixel centers
+        if len(points) < 2:
+            return
+        start, end = points[:-1], points[1:]
+        direction = end - start
+        length = np.linalg.norm(direction, axis=1, keepdims=True)
+        keep = length[:, 0] > 0
+        start, end = start[keep], end[keep]
+        direction = direction[keep] / length[keep]
+        if not len(start):
+            return
+
+        # One quad per segment, widened by a pixel for the anti-aliased edge and
+        # lengthened by half the width so the joints overlap
+        half = width / 2 + 1.0
+        normal = np.column_stack((-direction[:, 1], direction[:, 0])) * half
+        start = start - direction * (width / 2)
+        end = end + direction * (width / 2)
+        corners = np.stack((start + normal, start - normal, end + normal,
+                            end - normal, start - normal, end + normal), axis=1)
+        dist = np.tile(np.array([half, -half, half, -half, -half, half], dtype=np.float32), (len(start), 1))
+        vertices = np.concatenate((corners, dist[:, :, None]), axis=2).astype(np.float32)
+
+        program = _program(self.ctx, "line")
+        program['size'] = self.size
+        program['color'] = tuple(c / 255.0 for c in color[:3])
+        program['half_width'] = width / 2
+        self._draw(program, vertices, '2f 1f', ['in_pos', 'in_dist'], moderngl.TRIANGLES)
+
+    def points(self, points, color, fill, radius=3, inner_radius=2):
+        """
+        Data point markers, a ring of color with a fill colored center.
+
+        Parameters:
+            points (np.ndarray): (n, 2) pixel positions, top-left origin
+            color (tuple): RGB 0-255 of the ring
+            fill (tuple): RGB 0-255 of the center
+        """
+        points = np.asarray(points, dtype=np.float32)
+        if not len(points):
+            return
+        program = _program(self.ctx, "point")
+        program['size'] = self.size
+        program['point_size'] = float(2 * radius + 2)
+        program['color'] = tuple(c / 255.0 for c in color[:3])
+        program['fill'] = tuple(c / 255.0 for c in fill[:3])
+        program['radius'] = float(radius)
+        program['inner_radius'] = float(inner_radius)
+        # Pixel centers, sprites are centered on the position
+        self._draw(program, points + 0.5, '2f', ['in_pos'], moderngl.POINTS)
+
+    def pie(self, center, radius, fractions, colors, start_angle=-np.pi / 2):
+        """
+        Pie chart drawn by chart_sector.frag in one quad.
+
+        Parameters:
+            center (tuple): Pixel position of the center
+            radius (float): Radius in pixels
+            fractions (list): Share of every slice (summing to 1), at most 16 slices
+            colors (list): RGB 0-255 of every slice
+            start_angle (float): Angle of the first slice's start (pygame orientation)
+        """
+        program = _program(self.ctx, "sector")
+        count = len(fractions)
+        ends = np.zeros(16, dtype=np.float32)
+        ends[:count] = np.cumsum(fractions) * 2 * np.pi
+        if count:
+            ends[count - 1] = 2 * np.pi  # rounding must not leave a gap at the start
+        slice_colors = np.zeros((16, 3), dtype=np.float32)
+        slice_colors[:count] = np.array([c[:3] for c in colors[:count]], dtype=np.float32) / 255.0
+        program['center'] = (float(center[0]), float(center[1]))
+        program['radius'] = float(radius)
+        program['start_angle'] = float(start_angle)
+        program['slice_count'] = count
+        program['slice_end'].write(ends.tobytes())
+        program['slice_color'].write(slice_colors.tobytes())
+        self.ctx.viewport = (0, 0, self.size[0], self.size[1])
+        self.sector_vao.render(moderngl.TRIANGLE_STRIP)
+
+    def _draw(self, program, vertices, layout, attributes, mode):
+        self.ctx.viewport = (0, 0, self.size[0], self.size[1])
+        vbo = self.ctx.buffer(np.ascontiguousarray(vertices, dtype=np.float32).tobytes())
+        vao = self.ctx.vertex_array(program, [(vbo, layout, *attributes)])
+        vao.render(mode)
+        vao.release()
+        vbo.release()
+
+    def release(self):
+        for resource in (self.sector_vao, self.quad, self.fbo, self.target):
+            resource.release()
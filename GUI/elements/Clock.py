@@ -47,11 +47,9 @@ class Clock(Element):
 
     def render(self, screen: pygame.Surface):
         """Draw the clock with current time and date"""
-        # Update time at most once per second
-        current_ticks = pygame.time.get_ticks()
-        if current_ticks - self.last_update > 1000:  # Update every second
-            self.update_time()
-            self.last_update = current_ticks
+        # Update time on every draw, frames can be a second apart when the GUI is idle
+        self.update_time()
+        self.last_update = pygame.time.get_ticks()
         
         # Draw background
         pygame.draw.rect(screen, self.style.bg_color, (self.x, self.y, self.width, self.height))
@@ -0,0 +1,69 @@
+import numpy as np
+
+
+def min_max_indices(columns, values):
+    """
+    Per pixel column decimation: keeps the points with the lowest and the highest value
+    of every column, plus the first and last point. Every peak survives and a line through
+    the kept points covers the same pixels vertically, at most 2 points per column remain.
+
+    Parameters:
+        columns (np.ndarray): Pixel column (x) of every point
+        values (np.ndarray): Value (or pixel y) of every point
+
+    Returns:
+        Sorted indices of the kept points
+    """
+    n = len(columns)
+    if n <= 2:
+        return np.arange(n)
+    # Sorted by column, then value: a column's first entry is its min, the last its max
+    order = np.lexsort((values, columns))
+    sorted_columns = columns[order]
+    starts = np.flatnonzero(np.r_[True, sorted_columns[1:] != sorted_columns[:-1]])
+    ends = np.r_[starts[1:], n] - 1
+    return np.unique(np.concatenate((order[starts], order[ends], [0, n - 1])))
+
+
+def lttb_indices(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets: picks threshold points that keep the visual shape
+    of the line. The points in between the first and last one are split into buckets,
+    from every bucket the point forming the largest triangle with the previously picked
+    point and the next bucket's average is kept. The global minimum and maximum are
+    always kept as well, so peaks survive even where LTTB would smooth them out.
+
+    Parameters:
+        x (np.ndarray): x values (e.g. day numbers)
+        y (np.ndarray): y values
+        threshold (int): Number of points to pick (at least 3)
+
+    Returns:
+        Sorted indices of the kept points
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    # LTTB walks the points in x order
+    order = np.argsort(x, kind="stable")
+    xs = x[order].astype(np.float64)
+    ys = y[order].astype(np.float64)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i == threshold - 3:
+            next_x, next_y = xs[n - 1], ys[n - 1]
+        else:
+            next_end = edges[i + 2]
+            next_x, next_y = xs[end:next_end].mean(), ys[end:next_end].mean()
+        areas = np.abs((xs[a] - next_x) * (ys[start:end] - ys[a]) - (xs[a] - xs[start:end]) * (next_y - ys[a]))
+        a = start + int(np.argmax(areas))
+        selected.append(a)
+    selected.append(n - 1)
+
+    kept = order[selected]
+    return np.unique(np.concatenate((kept, [np.argmin(y), np.argmax(y)])))
+
@@ -33,8 +33,15 @@ class Display3D(Element):
             target_size=target_size
         )
 
-        # Rotation angle for demo
+        # Rotation angle for demo (advanced on the frame clock, interpolated when drawn)
         self.angle = 0.0
+        self.previous_angle = 0.0
+        self.rotation_speed = 36.0  # degrees per second
+        self.back_side_speed = 60.0  # extra degrees per second while facing away
+        self.needs_animation = True
+        self.frame_clock = getattr(manager, 'frame_clock', None)
+        if self.frame_clock is not None:
+            self.frame_clock.subscribe(self.advance)
 
     def release(self):
         """
@@ -48,6 +55,23 @@ class Display3D(Element):
         # Release model resources
         if hasattr(self, 'model'):
             self.model.release()
+        if self.frame_clock is not None:
+            self.frame_clock.unsubscribe(self.advance)
+        self.needs_animation = False
+
+    def advance(self, dt):
+        """Fixed-timestep update, dt in seconds"""
+        self.previous_angle = self.angle
+        self.angle = (self.angle + self.rotation_speed * dt) % 360
+        if self.angle > 90 and self.angle < 270:
+            self.angle += self.back_side_speed * dt
+
+    def interpolated_angle(self):
+        """Angle between the last two fixed steps, based on the clock's alpha"""
+        if self.frame_clock is None:
+            return self.angle
+        delta = (self.angle - self.previous_angle) % 360
+        return (self.previous_angle + delta * self.frame_clock.alpha) % 360
 
     def render3d(self):
         """
@@ -67,16 +91,16 @@ class Display3D(Element):
             target=[0, 0, 0],
             up=[0, 1, 0]
         )
-        model_matrix = Matrix44.from_y_rotation(np.radians(self.angle))
+        model_matrix = Matrix44.from_y_rotation(np.radians(self.interpolated_angle()))
 
         self.model.draw({
             "mvp": (projection * view * model_matrix),
             "model": model_matrix
         })
 
-        self.angle = (self.angle + 3.0) % 360
-        if self.angle % 360 > 90 and self.angle % 360 < 270:
-            self.angle += 5
+        if self.frame_clock is None:
+            # No clock to subscribe to, fall back to a fixed step per drawn frame
+            self.advance(1 / 12)
 
     def render(self,screen):
         pass
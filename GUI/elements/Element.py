@@ -11,7 +11,7 @@ class Element(ABC):
         manager,
         parent_panel=None,
         selectable: bool = True,
-        neighbors: dict = None,  # {"up": Element, "down": Element, ...}
+        neighbors: dict = None,  # {"up": Element, ...}, overrides the menu's FocusIndex
         layer: int = 0  # Z-ordering layer for rendering
     ):
         self.x = x
@@ -21,9 +21,11 @@ class Element(ABC):
         self.manager = manager
         self.parent_panel = parent_panel  # Reference to containing panel
         self.selectable = selectable
-        self.neighbors = neighbors or {}  # Explicit navigation graph
+        self.neighbors = neighbors or {}  # Explicit navigation, directions not in it are found spatially
         self.is_focused = False
         self.layer = layer
+        self.needs_animation = False  # True if element changes on its own and needs continuous frames
+        self.redraw_at = None  # time.perf_counter() of the element's next change on its own, if it only changes now and then
 
     @abstractmethod
     def render(self, screen: pygame.Surface):
@@ -35,13 +37,19 @@ class Element(ABC):
         """Triggered when ENTER/SPACE is pressed on this element."""
         pass
 
+    def release(self):
+        """Free what the element holds outside Python (GL objects, clock subscriptions), called
+        when its menu is dropped (see Menu.release). Nothing by default."""
+        pass
+
     def position_from_center(self, center_x, center_y):
         """Position element relative to desired center point"""
         self.x = center_x - self.width//2
         self.y = center_y - self.height//2
 
     def set_neighbor(self, direction: str, element: 'Element'):
-        """Updates a neighbor (e.g., set_neighbor("up", other_button))."""
+        """Overrides a neighbor (e.g., set_neighbor("up", other_button)), the nearest selectable
+        element in the direction is used otherwise (see FocusIndex)."""
         self.neighbors[direction] = element
 
     def handle_event(self, event: pygame.event.Event) -> bool:
@@ -64,8 +72,14 @@ class Element(ABC):
                     pygame.K_RIGHT: "right",
                 }[event.key]
                 neighbor = self.neighbors.get(direction)
+                menu = getattr(self.manager, 'current_menu', None)
+                if neighbor is None and menu is not None:
+                    neighbor = menu.focus_index.find(self, direction)
                 if neighbor and neighbor.selectable:
                     self.manager.focus_manager.set_focus(neighbor)
+                    # Rows of a scrolling table follow the focus
+                    if hasattr(neighbor.parent_panel, 'scroll_into_view'):
+                        neighbor.parent_panel.scroll_into_view(neighbor)
                     return True
                     
         return False
\ No newline at end of file
@@ -1,6 +1,10 @@
+import os
+import zlib
 import pygame
+import numpy as np
 from GUI.elements.Element import Element
 from GUI.style import StyleManager
+from GUI.elements.Image.MuscleHeatmap import MuscleHeatmap
 
 class Image2D_Graph(Element):
     def __init__(
@@ -30,65 +34,61 @@ class Image2D_Graph(Element):
         self.muscleGroups = [] #List of muscle grups displayed on the image, roughly keep the order of how they appear on the image for better readability
         self.specificMuscleGroup = specificMuscleGroup  # If exist, such muscle target will be higlighted (the rest will be grayed out)
         self.style = StyleManager.current_style
-        self.original_image = pygame.image.load(image_path).convert_alpha()
-        self.processed_image = self._process_image(self.original_image)
-        self.image = pygame.transform.scale(self.processed_image, (self.width, self.height))
-
-    def _get_mapped_color(self, pixel_color):
-        """Return the appropriate color based on the exact pixel color."""
-        # Define our color mapping with target colors and muscle groups
-        color_mapping = {
-            (255, 0, 0): "Chest",        # #FF0000
-            (255, 52, 0): "Back",         # #FF3400
-            (0, 0, 255): "Quads",         # #0000FF
-            (52, 52, 255): "Hamstrings",  # #3434FF
-            (0, 255, 0): "Biceps",       # #00FF00
-            (52, 255, 52): "Triceps",    # #34FF34
-            (125, 255, 125): "Shoulders", # #7DFF7D
-            (255, 255, 155): "Forearms",  # #FFFF9B
-            (255, 125, 55): "Calves",     # #FF7D37
-            (125, 52, 255): "Glutes",     # #7D34FF
-            (255, 255, 125): "Abs",       # #FFFF7D
-        }
-        
-        # Check for exact color matches
-        rgb = (pixel_color.r, pixel_color.g, pixel_color.b)
-        if rgb in color_mapping:
-            if self.specificMuscleGroup is not None:
-                if color_mapping[rgb] != self.specificMuscleGroup:
-                    muscle_color = StyleManager.gray_out_color( StyleManager.get_muscle_group_color(color_mapping[rgb])["bg_color"], 0.8 ) 
-                    return muscle_color
-            muscle_color = StyleManager.get_muscle_group_color(color_mapping[rgb])["bg_color"]
-            return muscle_color
-        
-        # Keep black pixels as-is (for lines)
-        if rgb == (0, 0, 0):
-            return (200, 200, 200, 255)
-        if rgb == (160,160,160):
-            return (160,160,160, 255)    
-        # Make everything else transparent
-        return (0, 0, 0, 0)
-
-    def _process_image(self, image):
-        """Process the image to replace colors according to our exact color mapping."""
-        processed_surface = pygame.Surface(image.get_size(), pygame.SRCALPHA)
-        
-        # Lock the surface for pixel access
-        processed_surface.lock()
-        image.lock()
-        
-        for x in range(image.get_width()):
-            for y in range(image.get_height()):
-                pixel_color = image.get_at((x, y))
-                mapped_color = self._get_mapped_color(pixel_color)
-                processed_surface.set_at((x, y), mapped_color)
-        
-        # Unlock the surfaces
-        image.unlock()
-        processed_surface.unlock()
-        
+        self.image_path = image_path
+        self.labels = _label_maps(image_path)[None]
+        self.image = None
+        self.workload = None  # 0-1 per muscle (LABEL_COLORS order) while shown as a heatmap
+        self._workload_key = None
+        self._heatmap = None  # MuscleHeatmap, created on the first set_workload() with a GL context
+        self._apply_variant()
+
+    def _get_mapped_color(self, muscle):
+        """Return the color of a muscle region, grayed out if another muscle is highlighted."""
+        muscle_color = StyleManager.get_muscle_group_color(muscle)["bg_color"]
+        if self.specificMuscleGroup is not None and muscle != self.specificMuscleGroup:
+            return StyleManager.gray_out_color(muscle_color, 0.8)
+        return muscle_color
+
+    def _palette(self):
+        """RGBA color for every label of the label map (see LABEL_COLORS)"""
+        palette = np.zeros((len(LABEL_COLORS) + len(FIXED_COLORS) + 1, 4), dtype=np.uint8)  # 0: transparent
+        for label, color in enumerate(FIXED_COLORS.values(), start=1):
+            palette[label] = color
+        for label, muscle in enumerate(LABEL_COLORS.values(), start=len(FIXED_COLORS) + 1):
+            palette[label] = (*self._get_mapped_color(muscle), 255)
+        return palette
+
+    def _process_image(self, size=None):
+        """
+        Recolor a label map with one palette lookup.
+
+        Parameters:
+            size (tuple): (width, height) of the pre-scaled label map to use, None for full size
+        """
+        rgba = self._palette()[_scaled_labels(self.image_path, size)]  # (h, w, 4)
+        processed_surface = pygame.image.frombytes(rgba.tobytes(), (rgba.shape[1], rgba.shape[0]), "RGBA")
+        if pygame.display.get_surface() is not None:
+            processed_surface = processed_surface.convert_alpha()
         return processed_surface
 
+    def _variant(self, size):
+        """Recolored surface for the current muscle and theme, cached per (image, muscle, theme, size)"""
+        key = (self.image_path, self.specificMuscleGroup, id(StyleManager.current_style), size)
+        surface = _variant_cache.get(key)
+        if surface is None:
+            surface = self._process_image(size)
+            _variant_cache[key] = surface
+        return surface
+
+    def _apply_variant(self):
+        """Set image for the current muscle and theme, switching back is a dict lookup."""
+        self.image = self._variant((int(self.width), int(self.height)))
+
+    @property
+    def processed_image(self):
+        """Full size recolored image"""
+        return self._variant(None)
+
     def render(self, screen: pygame.Surface):
         """Draw the image on the screen."""
         screen.blit(self.image, (self.x, self.y))
@@ -118,5 +118,160 @@ class Image2D_Graph(Element):
     def updateSpecyficMuscleGroup(self, specificMuscleGroup):
         """Update the specificMuscleGroup attribute."""
         self.specificMuscleGroup = specificMuscleGroup
-        self.processed_image = self._process_image(self.original_image)
-        self.image = pygame.transform.scale(self.processed_image, (self.width, self.height))
\ No newline at end of file
+        self.workload = None
+        self._apply_variant()
+
+    def set_workload(self, values):
+        """
+        Show the image as a heatmap: every muscle colored by its share of the largest value,
+        from its grayed out color (no work) over blue and yellow to red (most work).
+
+        Rendered on the GPU when the manager has a GL context (see MuscleHeatmap), the label
+        map stays there and new data only changes 11 floats. Same values as last time do nothing.
+
+        Parameters:
+            values (dict): muscle name -> workload (e.g. total_sets of Query.get_muscle_workload),
+                           missing muscles count as 0
+        """
+        peak = max(values.values(), default=0)
+        workload = tuple(values.get(muscle, 0) / peak if peak > 0 else 0.0 for muscle in LABEL_COLORS.values())
+        key = (workload, id(StyleManager.current_style))
+        if key == self._workload_key and self.workload is not None:
+            return
+        self.workload = workload
+        self._workload_key = key
+
+        gray_colors = [StyleManager.gray_out_color(StyleManager.get_muscle_group_color(muscle)["bg_color"], 0.8)
+                       for muscle in LABEL_COLORS.values()]
+        size = (int(self.width), int(self.height))
+        ctx = self.manager.screen3Drefs.get('ctx') if self.manager is not None else None
+        if ctx is None:
+            self.image = self._process_heatmap(size, gray_colors)
+            return
+        if self._heatmap is None:
+            self._heatmap = MuscleHeatmap(ctx, _scaled_labels(self.image_path, size),
+                                          line_color=FIXED_COLORS[(0, 0, 0)][:3],
+                                          detail_color=FIXED_COLORS[(160, 160, 160)][:3])
+        self.image = self._heatmap.render(workload, gray_colors)
+
+    def release(self):
+        """Free the heatmap's GL textures"""
+        if self._heatmap is not None:
+            self._heatmap.release()
+            self._heatmap = None
+
+    def _process_heatmap(self, size, gray_colors):
+        """CPU version of heatmap.frag (no GL context), one palette lookup like _process_image"""
+        t = np.clip(np.array(self.workload, dtype=np.float32), 0.0, 1.0)[:, None]
+        cold, warm, hot = (np.array(c, dtype=np.float32) for c in HEATMAP_RAMP)
+        ramp = np.where(t < 0.5, cold + (warm - cold) * (t * 2), warm + (hot - warm) * (t * 2 - 1))
+        fade = np.minimum(1.0, t * 4)
+        muscle_colors = np.array(gray_colors, dtype=np.float32) / 255 * (1 - fade) + ramp * fade
+
+        palette = self._palette()
+        palette[len(FIXED_COLORS) + 1:, :3] = np.round(muscle_colors * 255).astype(np.uint8)
+        rgba = palette[_scaled_labels(self.image_path, size)]
+        processed_surface = pygame.image.frombytes(rgba.tobytes(), (rgba.shape[1], rgba.shape[0]), "RGBA")
+        if pygame.display.get_surface() is not None:
+            processed_surface = processed_surface.convert_alpha()
+        return processed_surface
+
+
+# Exact colors of the muscle regions in the source images (see ColourMap.txt)
+LABEL_COLORS = {
+    (255, 0, 0): "Chest",        # #FF0000
+    (255, 52, 0): "Back",         # #FF3400
+    (0, 0, 255): "Quads",         # #0000FF
+    (52, 52, 255): "Hamstrings",  # #3434FF
+    (0, 255, 0): "Biceps",       # #00FF00
+    (52, 255, 52): "Triceps",    # #34FF34
+    (125, 255, 125): "Shoulders", # #7DFF7D
+    (255, 255, 155): "Forearms",  # #FFFF9B
+    (255, 125, 55): "Calves",     # #FF7D37
+    (125, 52, 255): "Glutes",     # #7D34FF
+    (255, 255, 125): "Abs",       # #FFFF7D
+}
+# Source color -> color it is always drawn with (outlines)
+FIXED_COLORS = {
+    (0, 0, 0): (200, 200, 200, 255),
+    (160, 160, 160): (160, 160, 160, 255),
+}
+
+# Heatmap colors (0-1 RGB) for little, medium and most work, must match ramp() in heatmap.frag
+HEATMAP_RAMP = ((0.20, 0.40, 1.00), (1.00, 0.90, 0.20), (1.00, 0.20, 0.10))
+
+_label_cache = {}  # image path -> {None: label map, (w, h): pre-scaled label map}
+_variant_cache = {}  # (image path, muscle, theme, size) -> surface
+
+
+def compute_labels(image_path):
+    """
+    Decode an image into its label map, (h, w) uint8: 0 = transparent,
+    then FIXED_COLORS, then LABEL_COLORS in order.
+    """
+    rgb = pygame.surfarray.array3d(pygame.image.load(image_path)).transpose(1, 0, 2).astype(np.uint32)
+    packed = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+    labels = np.zeros(packed.shape, dtype=np.uint8)
+    for label, (r, g, b) in enumerate(list(FIXED_COLORS) + list(LABEL_COLORS), start=1):
+        labels[packed == ((r << 16) | (g << 8) | b)] = label
+    return labels
+
+
+def scale_labels(labels, size):
+    """
+    Scale a label map to (width, height), sampling like pygame.transform.scale,
+    so recoloring the result equals scaling the recolored image.
+    """
+    height, width = labels.shape
+    surface = pygame.image.frombytes(np.ascontiguousarray(labels).tobytes(), (width, height), "P")
+    scaled = pygame.transform.scale(surface, size)
+    return np.frombuffer(pygame.image.tobytes(scaled, "P"), dtype=np.uint8).reshape(size[1], size[0]).copy()
+
+
+def baked_path(image_path):
+    """Label maps baked by build_assets.py are stored next to the image"""
+    return os.path.splitext(image_path)[0] + ".labels.npz"
+
+
+def source_checksum(image_path):
+    with open(image_path, "rb") as f:
+        return zlib.crc32(f.read())
+
+
+def _load_baked(image_path):
+    """Label maps from the baked file, None if missing or built from a different image"""
+    path = baked_path(image_path)
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as data:
+        if int(data["source_crc"]) != source_checksum(image_path):
+            return None
+        maps = {None: data["labels"]}
+        for name in data.files:
+            if name.startswith("size_"):
+                width, height = name[5:].split("x")
+                maps[(int(width), int(height))] = data[name]
+    return maps
+
+
+def _label_maps(image_path):
+    """All label maps of an image, baked ones if up to date, otherwise decoded from the image"""
+    maps = _label_cache.get(image_path)
+    if maps is None:
+        maps = _load_baked(image_path) or {None: compute_labels(image_path)}
+        _label_cache[image_path] = maps
+    return maps
+
+
+def preload_label_maps(*image_paths):
+    """Decode the label maps of images ahead of time (see Menu.preload), needs no display"""
+    for image_path in image_paths:
+        _label_maps(image_path)
+
+
+def _scaled_labels(image_path, size):
+    """Label map at the given size (None for full size), scaled once if it wasn't baked"""
+    maps = _label_maps(image_path)
+    if size not in maps:
+        maps[size] = scale_labels(maps[None], size)
+    return maps[size]
\ No newline at end of file
@@ -20,6 +20,7 @@ class ImageCarousel(Element):
         switch_interval: float = 12.0,  # seconds between switches (for random_timed)
         progress_bar_height: int = 5,  # Height of the progress bar in pixels
         progress_bar_color: tuple = (255, 255, 255),  # Color of the progress bar
+        progress_steps: int = 24,  # Steps the progress bar fills in, one redraw each (for random_timed)
     ):
         super().__init__(
             x=x,
@@ -36,11 +37,14 @@ class ImageCarousel(Element):
         self.style = StyleManager.current_style
         self.mode = mode
         self.switch_interval = switch_interval
-        self.last_switch_time = time.time()  # Initialize with current time
+        self.last_switch_time = self._now()  # Initialize with current time
         self.current_index = 0
         self.image_elements = []
         self.progress_bar_height = progress_bar_height
         self.progress_bar_color = progress_bar_color
+        self.progress_steps = progress_steps
+        # Timed mode only changes when the progress bar fills a step, frames are requested for
+        # those (redraw_at) instead of continuously, the GUI sleeps in between
         
         # Add initial images if provided
         if images:
@@ -51,6 +55,10 @@ class ImageCarousel(Element):
         if "random" in self.mode and self.image_elements:
             random.shuffle(self.image_elements)
     
+    def _now(self):
+        """Wall clock, the frame clock doesn't run while the GUI sleeps until redraw_at"""
+        return time.perf_counter()
+
     def add_image(self, image: Image2D_Graph):
         """Add an Image2D_Graph instance to the carousel"""
         self._center_image(image)
@@ -59,6 +67,11 @@ class ImageCarousel(Element):
         if "random" in self.mode:
             random.shuffle(self.image_elements)
     
+    def release(self):
+        """Release the images, they aren't in a panel of their own"""
+        for image in self.image_elements:
+            image.release()
+
     def _center_image(self, image: Image2D_Graph):
         """Center an image within the carousel's bounds"""
         image.set_position(
@@ -72,7 +85,7 @@ class ImageCarousel(Element):
             return
             
         self.current_index = (self.current_index + 1) % len(self.image_elements)
-        self.last_switch_time = time.time()
+        self.last_switch_time = self._now()
         #print("Switching")
         self.update()
     
@@ -83,16 +96,16 @@ class ImageCarousel(Element):
             while new_index == self.current_index and len(self.image_elements) > 1:
                 new_index = random.randint(0, len(self.image_elements)-1)
             self.current_index = new_index
-        self.last_switch_time = time.time()
+        self.last_switch_time = self._now()
         #print("Switching")
         self.update()
     
     def render(self, screen: pygame.Surface):
         """Draw the current image, progress bar, and handle automatic switching"""
-        current_time = time.time()
+        current_time = self._now()
         
         # Handle automatic switching for timed mode
-        if self.mode == "random_timed" and current_time - self.last_switch_time > self.switch_interval:
+        if self.mode == "random_timed" and current_time - self.last_switch_time >= self.switch_interval:
             self.random_image()
         
         # Draw current image if available
@@ -101,8 +114,11 @@ class ImageCarousel(Element):
         
         # Draw progress bar for random_timed mode
         if self.mode == "random_timed" and self.image_elements:
-            progress = min(1.0, (current_time - self.last_switch_time) / self.switch_interval)
+            step_time = self.switch_interval / self.progress_steps
+            steps = int((current_time - self.last_switch_time) / step_time)
+            progress = min(1.0, steps / self.progress_steps)
             bar_width = int(self.width * progress)
+            self.redraw_at = self.last_switch_time + (steps + 1) * step_time
             
             # Draw background (empty part of progress bar)
             pygame.draw.rect(
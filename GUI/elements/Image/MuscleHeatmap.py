@@ -0,0 +1,92 @@
+from pathlib import Path
+import numpy as np
+import moderngl
+import pygame
+from GUI.Distortions.PostProcess import QUAD_VERTICES, COMPOSITE_VERTEX_SHADER, _read
+
+FRAGMENT_SHADER = Path(__file__).parent.parent.parent / "ThreeDee" / "shaders" / "heatmap.frag"
+
+_programs = {}  # id(ctx) -> heatmap program, compiled once per context
+
+
+def _program(ctx):
+    program = _programs.get(id(ctx))
+    if program is None:
+        program = ctx.program(vertex_shader=_read(COMPOSITE_VERTEX_SHADER), fragment_shader=_read(FRAGMENT_SHADER))
+        _programs[id(ctx)] = program
+    return program
+
+
+class MuscleHeatmap:
+    def __init__(self, ctx, labels, line_color=(200, 200, 200), detail_color=(160, 160, 160)):
+        """
+        Colors a muscle map by per-muscle intensity on the GPU (see heatmap.frag).
+
+        The label map is uploaded once as an R8 texture, new workload data only rewrites
+        the 11 intensity floats and renders one quad into a small framebuffer. The GUI is
+        drawn on a pygame surface, so the result is read back once per data change, not
+        every frame.
+
+        Parameters:
+            ctx (moderngl.Context): Context of the main loop (MenuManager.screen3Drefs['ctx'])
+            labels (np.ndarray): (h, w) uint8 label map at display size (Image2D_Graph._scaled_labels)
+            line_color (tuple): RGB color of the outlines
+            detail_color (tuple): RGB color of the gray details
+        """
+        self.ctx = ctx
+        self.size = (labels.shape[1], labels.shape[0])
+        self.program = _program(ctx)
+
+        self.labels = ctx.texture(self.size, 1, np.ascontiguousarray(labels).tobytes())
+        self.labels.filter = (ctx.NEAREST, ctx.NEAREST)  # labels must never be blended
+        self.target = ctx.texture(self.size, 4)
+        self.fbo = ctx.framebuffer(color_attachments=[self.target])
+        self.vbo = ctx.buffer(QUAD_VERTICES.tobytes())
+        self.vao = ctx.vertex_array(self.program, [(self.vbo, '2f 2f', 'in_vert', 'in_uv')])
+
+        self.line_color = tuple(c / 255.0 for c in line_color)
+        self.detail_color = tuple(c / 255.0 for c in detail_color)
+
+    def render(self, intensities, gray_colors):
+        """
+        Render the heatmap.
+
+        Parameters:
+            intensities (list): 0-1 per muscle, in LABEL_COLORS order
+            gray_colors (list): RGB color (0-255) of every muscle with no workload, same order
+
+        Returns:
+            pygame.Surface (RGBA) of the label map's size
+        """
+        ctx = self.ctx
+        previous_fbo = ctx.fbo
+        previous_viewport = ctx.viewport
+
+        self.program['labels'] = 0
+        self.program['intensity'].write(np.asarray(intensities, dtype='f4').tobytes())
+        self.program['gray_color'].write((np.array(gray_colors, dtype='f4') / 255.0).tobytes())
+        self.program['line_color'] = self.line_color
+        self.program['detail_color'] = self.detail_color
+
+        # No depth attachment, so Display3D's DEPTH_TEST doesn't matter here
+        self.fbo.use()
+        self.fbo.clear(0.0, 0.0, 0.0, 0.0)
+        self.labels.use(0)
+        self.vao.render(moderngl.TRIANGLE_STRIP)
+        data = self.fbo.read(components=4)
+
+        # Leave the main loop's state as it was (a fresh standalone context has no framebuffer yet)
+        if previous_fbo is not None:
+            previous_fbo.use()
+            ctx.viewport = previous_viewport
+
+        # Rows come back bottom-up, the quad's flipped uv already put the image's top row first
+        surface = pygame.image.frombytes(data, self.size, "RGBA")
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    def release(self):
+        for resource in (self.vao, self.vbo, self.fbo, self.target, self.labels):
+            resource.release()
+
@@ -0,0 +1,47 @@
+import os
+import time
+import numpy as np
+from GUI.elements.Image.Image2D_Graph import compute_labels, scale_labels, baked_path, source_checksum
+
+IMAGES_DIR = os.path.join("GUI", "elements", "Image", "images")
+
+# Muscle map images and the (width, height) every one is displayed at
+ASSETS = {
+    "Front.png": [(210, 290)],  # MainMenu carousel
+    "Back.png": [(150, 280)],   # MainMenu carousel
+    "Arm.png": [(82, 175)],     # ProgramMenu, scale 0.5
+    "Leg.png": [(105, 175)],    # ProgramMenu, scale 0.5
+    "torso.png": [(145, 175)],  # ProgramMenu, scale 0.5
+}
+
+
+def build(images_dir=IMAGES_DIR, assets=ASSETS):
+    """
+    Bake the label map of every muscle map image, plus pre-scaled label maps for the
+    sizes it is shown at, into <image>.labels.npz next to the image.
+
+    Image2D_Graph then loads these instead of decoding the PNG, recoloring is a single
+    palette lookup at display size. Run again after changing an image (stale files are
+    detected by checksum and ignored until rebuilt).
+
+    Returns:
+        List of written file paths
+    """
+    written = []
+    for name, sizes in assets.items():
+        image_path = os.path.join(images_dir, name)
+        labels = compute_labels(image_path)
+        arrays = {"labels": labels, "source_crc": np.uint32(source_checksum(image_path))}
+        for width, height in sizes:
+            arrays[f"size_{width}x{height}"] = scale_labels(labels, (width, height))
+        np.savez_compressed(baked_path(image_path), **arrays)
+        written.append(baked_path(image_path))
+    return written
+
+
+# Example usage (from the repository root): python -m GUI.elements.Image.build_assets
+if __name__ == "__main__":
+    start = time.perf_counter()
+    for path in build():
+        print(f"{path} ({os.path.getsize(path) / 1024:.1f} KB)")
+    print(f"Built in {time.perf_counter() - start:.2f} s")
@@ -1,10 +1,14 @@
 import pygame
 import random
+import numpy as np
 from .Element import Element
 from GUI.style import StyleManager
 
 
 class LoadingConsole(Element):
+    GAP_X = 2  # horizontal gap between cells
+    GAP_Y = 1  # vertical gap between rows
+
     def __init__(
         self,
         x: int = 0,
@@ -44,6 +48,24 @@ class LoadingConsole(Element):
         self.lcd_row = 15
         self.lcd_grid = [[' ' for _ in range(self.lcd_col)] for _ in range(self.lcd_row)]
         self.current_row = 0
+        # Cells changed since the last render, set by _set_cell() and _advance_row()
+        self._dirty = np.ones((self.lcd_row, self.lcd_col), dtype=bool)
+        self._scrolled_rows = 0  # rows _advance_row() scrolled since the last render
+
+        # Glyph atlas: every printable ASCII character rendered once side by side,
+        # other characters get their own surface the first time they're printed
+        self._glyphs = {}  # char -> (source surface, area)
+        chars = [chr(i) for i in range(32, 127)]
+        rendered = [self.font.render(char, True, self._cell_fg) for char in chars]
+        self._atlas = pygame.Surface((sum(g.get_width() for g in rendered), max(g.get_height() for g in rendered)), pygame.SRCALPHA)
+        atlas_x = 0
+        for char, glyph in zip(chars, rendered):
+            self._atlas.blit(glyph, (atlas_x, 0))
+            self._glyphs[char] = (self._atlas, pygame.Rect(atlas_x, 0, glyph.get_width(), glyph.get_height()))
+            atlas_x += glyph.get_width()
+
+        # Console drawn so far, only dirty cells are redrawn into it (see render)
+        self._surface = None
 
         # Gibberish source
         self.giberishDict = [
@@ -108,7 +130,7 @@ class LoadingConsole(Element):
         progress_row = min(self.current_row + 1, grid_rows - 1)
         for col, char in enumerate(progress_bar, start=startingCol):
             if col < grid_cols:  # Prevent index overflow
-                self.lcd_grid[progress_row][col] = char
+                self._set_cell(progress_row, col, char)
 
     def getGiberishList(self,num_lines=3):
         """
@@ -142,7 +164,13 @@ class LoadingConsole(Element):
         # Clamp string length to grid width
         max_cols = len(self.lcd_grid[0])
         for col, char in enumerate(string[:max_cols]):
+            self._set_cell(row, col, char)
+
+    def _set_cell(self, row, col, char):
+        """Write one character into lcd_grid, marking the cell for redraw if it changed"""
+        if self.lcd_grid[row][col] != char:
             self.lcd_grid[row][col] = char
+            self._dirty[row, col] = True
 
 
     def _advance_row(self):
@@ -168,55 +196,93 @@ class LoadingConsole(Element):
             # Keep current_row fixed at max_row
             self.current_row = max_row
 
+            # The drawn console scrolls with the grid (see render), pending redraws move along
+            # and the cleared rows are drawn fresh
+            self._scrolled_rows += 1
+            self._dirty = np.roll(self._dirty, -1, axis=0)
+            self._dirty[rows - buffer_rows:] = True
+
 
     # -----------------------
     # Render
     # -----------------------
 
     def render(self, screen: pygame.Surface):
-        """Draws the whole lcd_grid as an LCD panel with gaps."""
+        """
+        Draws the lcd_grid as an LCD panel with gaps. The panel is kept on a surface
+        between frames: scrolled rows are moved with a surface scroll and only the
+        cells changed since the last frame are drawn again.
+        """
         rows = len(self.lcd_grid)
         cols = len(self.lcd_grid[0]) if rows else 0
         if rows == 0 or cols == 0:
             return
 
-        # Define gaps
-        gap_x = 2  # horizontal gap
-        gap_y = 1  # vertical gap
-
         # Effective drawable area (excluding total gaps)
-        total_gap_w = (cols - 1) * gap_x
-        total_gap_h = (rows - 1) * gap_y
+        total_gap_w = (cols - 1) * self.GAP_X
+        total_gap_h = (rows - 1) * self.GAP_Y
 
         self.cell_w = (self.width - total_gap_w) // cols
         self.cell_h = (self.height - total_gap_h) // rows
 
-        # Draw background
-        pygame.draw.rect(screen, self._bg_color,
-                        (self.x, self.y, self.width, self.height))
-
-        # Draw each cell
-        for r in range(rows):
-            for c in range(cols):
-                char = self.lcd_grid[r][c]
-
-                # Calculate position with gaps
-                draw_x = self.x + c * (self.cell_w + gap_x)
-                draw_y = self.y + r * (self.cell_h + gap_y)
-
-                self.drawLcdCell(screen, r, c, char, draw_x, draw_y)
+        size = (int(self.width), int(self.height))
+        if self._surface is None or self._surface.get_size() != size:
+            # Draw background, every cell is drawn on it below
+            self._surface = pygame.Surface(size)
+            self._surface.fill(self._bg_color)
+            self._dirty[:] = True
+            self._scrolled_rows = 0
+        elif self._scrolled_rows:
+            # Move the drawn rows up, the rows left at the bottom are dirty
+            shift = min(self._scrolled_rows * (self.cell_h + self.GAP_Y), size[1])
+            self._surface.scroll(0, -shift)
+            self._surface.fill(self._bg_color, (0, size[1] - shift, size[0], shift))
+            self._scrolled_rows = 0
+
+        # Draw each changed cell
+        for r, c in zip(*np.nonzero(self._dirty)):
+            draw_x = c * (self.cell_w + self.GAP_X)
+            draw_y = r * (self.cell_h + self.GAP_Y)
+            self.drawLcdCell(self._surface, r, c, self.lcd_grid[r][c], draw_x, draw_y)
+        self._dirty[:] = False
+
+        screen.blit(self._surface, (self.x, self.y))
 
     def drawLcdCell(self, screen, r, c, char, draw_x, draw_y):
-        """Draw one LCD cell at given pixel position."""
+        """
+        Draw one LCD cell at given pixel position, with the gaps beside it. Wide glyphs
+        reach into the gaps, so the neighbors' glyphs are drawn into them again.
+        """
         rect = pygame.Rect(draw_x, draw_y, self.cell_w, self.cell_h)
+        left_gap = pygame.Rect(draw_x - self.GAP_X, draw_y, self.GAP_X, self.cell_h)
+        right_gap = pygame.Rect(rect.right, draw_y, self.GAP_X, self.cell_h)
+        row = self.lcd_grid[r]
 
         # background
+        screen.fill(self._bg_color, left_gap.union(right_gap))
+        if c > 0:
+            self._blit_glyph(screen, row[c - 1], rect.move(-(self.cell_w + self.GAP_X), 0), left_gap)
         pygame.draw.rect(screen, self._cell_bg, rect)
 
-        # text (centered)
-        text_surface = self.font.render(char, True, self._cell_fg)
-        text_rect = text_surface.get_rect(center=rect.center)
-        screen.blit(text_surface, text_rect)
+        # text (centered), then the next cell's glyph where it reaches into the gap
+        self._blit_glyph(screen, char, rect, left_gap.union(right_gap))
+        if c + 1 < len(row):
+            self._blit_glyph(screen, row[c + 1], rect.move(self.cell_w + self.GAP_X, 0), right_gap)
+
+    def _blit_glyph(self, screen, char, rect, clip):
+        """Blit char from the glyph atlas centered on rect, only inside clip"""
+        if char == ' ':
+            return
+        if char not in self._glyphs:
+            glyph = self.font.render(char, True, self._cell_fg)
+            self._glyphs[char] = (glyph, glyph.get_rect())
+        source, area = self._glyphs[char]
+        text_rect = pygame.Rect((0, 0), area.size)
+        text_rect.center = rect.center
+        previous_clip = screen.get_clip()
+        screen.set_clip(clip.clip(previous_clip))
+        screen.blit(source, text_rect, area)
+        screen.set_clip(previous_clip)
 
     # -----------------------
     # Overrides
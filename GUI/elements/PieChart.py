@@ -1,7 +1,12 @@
 import pygame
 import math
+import numpy as np
 from .Element import Element
 from GUI.style import StyleManager
+from .ChartRenderer import ChartRenderer, chart_context
+
+# Seconds the slices and labels take to move to a new distribution (see update)
+TRANSITION_TIME = 0.35
 
 class PieChart(Element):
     def __init__(
@@ -32,6 +37,7 @@ class PieChart(Element):
         self.height = height
         # Calculate total
         self.font_size = font_size
+        self.font = pygame.font.SysFont(None, self.font_size)
         self.distribution = distribution
         self.total = sum(self.distribution.values())
 
@@ -43,17 +49,25 @@ class PieChart(Element):
         #|=======|=======| }/
         #{height }
         #{     width     }
-     
+
         self.center = (width // 4, height // 2)
         self.radius = height // 2 - 10
         self.colours = self.getColors()
 
+        # Slice fractions of the shown distribution, geometry is derived from them once per update()
+        self._layout = self._make_layout()
+        self._transition = None  # (from layout, to layout, elapsed seconds) while animating
+        self._label_surfaces = {}  # (label, color) -> rendered text
+        self._surface = None  # finished chart, premultiplied alpha, blitted every frame
+        self._surface_gpu = None  # backend the surface was drawn with
+        self._chart = None  # ChartRenderer, created on the first GPU draw
+
     def getColors(self):
         color_list = []
         for muscle in self.distribution.keys():
             color_info = StyleManager.get_muscle_group_color(muscle)
             color_list.append(color_info['bg_color'])
-        return color_list    
+        return color_list
 
 
     def on_press(self):
@@ -61,69 +75,170 @@ class PieChart(Element):
         pass
 
     def render(self, screen: pygame.Surface):
-        midpoints = []  # List to store (x1, y1) tuples
-
-        # Pass 1: Draw slices and store midpoints
-        start_angle = -math.pi / 2
-        for i, (label, value) in enumerate(self.distribution.items()):
-            slice_angle = (value / self.total) * (2 * math.pi)
-
-            # Draw the slice
-            self.draw_pie_slice(
-                screen,
-                self.colours[i % len(self.colours)],
-                self.center,
-                self.radius,
-                start_angle,
-                start_angle + slice_angle
-            )
-
-            # Midpoint of the slice
-            mid_angle = start_angle + slice_angle / 2
-            x1 = self.center[0] + math.cos(mid_angle) * (self.radius / 2)
-            y1 = self.center[1] + math.sin(mid_angle) * (self.radius / 2)
-
-            midpoints.append((x1, y1, i))  # Keep track of original slice index
-
-            start_angle += slice_angle
-
-        # Sort midpoints by y-coordinate
-        midpoints.sort(key=lambda p: p[1])
-
-        # Pass 2: Draw connecting lines in sorted order
-        for sorted_index, (x1, y1, original_i) in enumerate(midpoints):
-            x2 = self.height
-            y2 = self.height // len(self.distribution) * sorted_index + (self.height // len(self.distribution)) // 2
-
-            # Draw line
-            pygame.draw.line(
-                screen,
-                self.colours[original_i % len(self.colours)],
-                (x1, y1),
-                (x2, y2),
-                4
-            )
-
-            # Draw label text
-            font = pygame.font.SysFont(None, self.font_size)
-            label_text = list(self.distribution.keys())[original_i]
-            text_surf = font.render(label_text, True, self.colours[original_i % len(self.colours)])
-            screen.blit(text_surf, (x2 + 5, y2 - text_surf.get_height() // 2))
-
-
-
-        
+        ctx = chart_context(self.manager)
+        if self._transition is not None:
+            self._advance_transition(ctx)
+        elif self._surface is None or self._surface_gpu != (ctx is not None):
+            self._surface = self._draw(self._geometry(self._layout), ctx)
+            self._surface_gpu = ctx is not None
+        screen.blit(self._surface, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+
+    # === Geometry ===
+    def _make_layout(self):
+        """Labels, slice fractions and colors of the current distribution"""
+        labels = list(self.distribution.keys())
+        values = np.array(list(self.distribution.values()), dtype=np.float64)
+        fractions = values / self.total if self.total else np.zeros(len(labels))
+        colours = [self.colours[i % len(self.colours)] for i in range(len(labels))]
+        return {"labels": labels, "fractions": fractions, "colours": colours}
+
+    def _geometry(self, layout, label_y=None):
+        """
+        Slice polygons, leader line starts and label rows of a layout, all slices at once.
+
+        Parameters:
+            layout (dict): See _make_layout
+            label_y (np.ndarray): Label rows to use instead of laying them out (transitions)
+        """
+        count = len(layout["labels"])
+        slice_angles = layout["fractions"] * (2 * math.pi)
+        # Slices follow each other clockwise from the top (cumsum adds up like the old loop did)
+        starts = np.cumsum(np.r_[-math.pi / 2, slice_angles])[:-1]
+        stops = starts + slice_angles
+        mids = starts + slice_angles / 2
+
+        cx, cy = self.center
+        midpoints = np.column_stack((cx + np.cos(mids) * (self.radius / 2), cy + np.sin(mids) * (self.radius / 2)))
+
+        # Slice outlines: center and 101 points along the arc
+        steps = 100
+        angles = starts[:, None] + (stops - starts)[:, None] * (np.arange(steps + 1) / steps)
+        arcs = np.stack((cx + np.cos(angles) * self.radius, cy + np.sin(angles) * self.radius), axis=2)
+        polygons = np.concatenate((np.broadcast_to(np.array(self.center, dtype=np.float64), (count, 1, 2)), arcs), axis=1)
+
+        if label_y is None:
+            label_y = self._label_rows(midpoints)
+        return {**layout, "polygons": polygons, "midpoints": midpoints, "label_y": label_y}
+
+    def _label_rows(self, midpoints):
+        """Labels are stacked top to bottom in the order of their slice's midpoint height"""
+        count = len(midpoints)
+        label_y = np.zeros(count)
+        if count == 0:
+            return label_y
+        row_height = self.height // count
+        for sorted_index, i in enumerate(np.argsort(midpoints[:, 1], kind="stable")):
+            label_y[i] = row_height * sorted_index + row_height // 2
+        return label_y
+
+    def _draw(self, geometry, ctx):
+        """The whole chart onto a transparent surface (premultiplied alpha)"""
+        labels = geometry["labels"]
+        texts = [self._label_surface(label, colour) for label, colour in zip(labels, geometry["colours"])]
+        x2 = self.height
+        width = max([int(self.width)] + [int(x2 + 5 + text.get_width()) + 1 for text in texts])
+        height = max([int(self.height)] + [int(y + text.get_height()) + 1 for y, text in zip(geometry["label_y"], texts)])
+        if self._surface is not None and self._surface.get_size() == (width, height):
+            surface = self._surface
+        else:
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+
+        # Slices, on the GPU when there is a GL context
+        if ctx is not None:
+            self._draw_slices_gpu(surface, geometry, ctx)
+        else:
+            for polygon, colour in zip(geometry["polygons"], geometry["colours"]):
+                pygame.draw.polygon(surface, colour, polygon.tolist())
+
+        # Leader lines and labels, top label first
+        for i in np.argsort(geometry["label_y"], kind="stable"):
+            x1, y1 = geometry["midpoints"][i]
+            y2 = geometry["label_y"][i]
+            pygame.draw.line(surface, geometry["colours"][i], (x1, y1), (x2, y2), 4)
+            surface.blit(texts[i], (x2 + 5, y2 - texts[i].get_height() // 2), special_flags=pygame.BLEND_PREMULTIPLIED)
+        return surface
+
+    def _draw_slices_gpu(self, surface, geometry, ctx):
+        """All slices with ChartRenderer.pie() in one pass"""
+        if self._chart is None:
+            self._chart = ChartRenderer(ctx, (self.center[0] + self.radius + 2, self.center[1] + self.radius + 2))
+        self._chart.begin()
+        if len(geometry["labels"]):
+            self._chart.pie(self.center, self.radius, geometry["fractions"], geometry["colours"])
+        surface.blit(self._chart.end(), (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+
+    def release(self):
+        """Free the GPU chart and stop a running transition"""
+        if self.manager is not None and hasattr(self.manager, 'frame_clock'):
+            self.manager.frame_clock.unsubscribe(self._step_transition)
+        if self._chart is not None:
+            self._chart.release()
+            self._chart = None
+
+    def _label_surface(self, label, colour):
+        key = (label, tuple(colour))
+        if key not in self._label_surfaces:
+            # Premultiplied like the rest of the cached chart. Rendered text has padded rows
+            # premul_alpha() doesn't skip, the copy packs them
+            self._label_surfaces[key] = self.font.render(label, True, colour).copy().premul_alpha()
+        return self._label_surfaces[key]
+
+    # === Transition ===
+    def _step_transition(self, dt):
+        """Fixed-timestep update of the transition's elapsed time, until it's done"""
+        start, end, elapsed = self._transition
+        self._transition = (start, end, elapsed + dt)
+        if elapsed + dt >= TRANSITION_TIME:
+            self.manager.frame_clock.unsubscribe(self._step_transition)
+
+    def _advance_transition(self, ctx):
+        """One frame of the transition: slice fractions and label rows are interpolated"""
+        start, end, elapsed = self._transition
+        if elapsed >= TRANSITION_TIME:
+            self._transition = None
+            self.needs_animation = False
+            self._surface = self._draw(self._geometry(self._layout), ctx)
+            return
+
+        t = elapsed / TRANSITION_TIME
+        t = t * t * (3 - 2 * t)  # smoothstep
+        # Slices of both distributions, the new order first, removed ones shrink at the end
+        labels = end["labels"] + [label for label in start["labels"] if label not in end["labels"]]
+        fractions, colours, label_y = [], [], []
+        for label in labels:
+            a = start["labels"].index(label) if label in start["labels"] else None
+            b = end["labels"].index(label) if label in end["labels"] else None
+            fractions.append((1 - t) * (start["fractions"][a] if a is not None else 0.0)
+                             + t * (end["fractions"][b] if b is not None else 0.0))
+            colours.append(end["colours"][b] if b is not None else start["colours"][a])
+            # New labels appear at their final row, removed ones stay on theirs
+            y_from = start["label_y"][a] if a is not None else end["label_y"][b]
+            y_to = end["label_y"][b] if b is not None else start["label_y"][a]
+            label_y.append((1 - t) * y_from + t * y_to)
+        layout = {"labels": labels, "fractions": np.array(fractions), "colours": colours}
+        self._surface = self._draw(self._geometry(layout, np.array(label_y)), ctx)
+        self._surface_gpu = ctx is not None
+
     def draw_pie_slice(self,surface, color, center, radius, start_angle, stop_angle, steps=100):
-        points = [center]
-        for step in range(steps + 1):
-            angle = start_angle + (stop_angle - start_angle) * (step / steps)
-            x = center[0] + math.cos(angle) * radius
-            y = center[1] + math.sin(angle) * radius
-            points.append((x, y))
-        pygame.draw.polygon(surface, color, points)
+        angles = start_angle + (stop_angle - start_angle) * (np.arange(steps + 1) / steps)
+        points = np.column_stack((center[0] + np.cos(angles) * radius, center[1] + np.sin(angles) * radius))
+        pygame.draw.polygon(surface, color, [center] + points.tolist())
 
     def update(self, newDistribution):
+        """
+        Show a new distribution. Once the chart is on screen the slices and labels move
+        there over TRANSITION_TIME, interpolated from the cached geometry of both.
+        """
+        previous = self._geometry(self._layout)
         self.distribution = newDistribution
         self.total = sum(self.distribution.values())
         self.colours = self.getColors()
-        
\ No newline at end of file
+        self._layout = self._make_layout()
+        if self._surface is not None and self.manager is not None and hasattr(self.manager, 'frame_clock'):
+            self._transition = (previous, self._geometry(self._layout), 0.0)
+            self.needs_animation = True
+            # Advanced on the frame clock like Display3D, a pause before the update doesn't count
+            self.manager.frame_clock.subscribe(self._step_transition)
+        else:
+            self._surface = None
@@ -1,8 +1,17 @@
+import numpy as np
 import pygame
 from .Element import Element
+from .Decimation import min_max_indices, lttb_indices
+from .ChartRenderer import ChartRenderer, chart_context
 from GUI.style import StyleManager
+from workout_db_r.Target import Target
 from datetime import datetime, timedelta
 
+# Decimation of long histories before drawing (see Decimation.py), None draws every point
+DECIMATION_MODES = (None, "minmax", "lttb")
+# Series set by update_data(), colored with change_plot_color()
+MAIN_SERIES = "main"
+
 class Plotter(Element):
     def __init__(
         self,
@@ -20,7 +29,17 @@ class Plotter(Element):
         layer: int = 0,
         y_label: str = "",
         x_label: str = "Date",
+        decimation: str = "minmax",
+        max_points: int = None,
     ):
+        """
+        Line plot of values over dates.
+
+        Histories with more points than max_points (default: one per pixel column of the
+        plot) are decimated once per update_data, so drawing cost is bounded by the plot
+        width: "minmax" keeps the lowest and highest point of every pixel column, "lttb"
+        picks max_points points with Largest-Triangle-Three-Buckets. Both keep the peaks.
+        """
         super().__init__(
             x=x,
             y=y,
@@ -33,13 +52,14 @@ class Plotter(Element):
             layer=layer
         )
         
-        self.x_values = x_values
-        self.y_values = y_values
         self.font = pygame.font.SysFont("Arial", font_size)
         self.style = StyleManager.current_style
         self.y_label = y_label
         self.x_label = x_label
         self.plotDataColor = self.style.highlight_color
+        if decimation not in DECIMATION_MODES:
+            raise ValueError(f"Unknown decimation mode: {decimation}")
+        self.decimation = decimation
         
         # Calculate padding for axis labels
         self.padding = {
@@ -52,43 +72,128 @@ class Plotter(Element):
         # Calculate plot area dimensions
         self.plot_width = self.width - self.padding['left'] - self.padding['right']
         self.plot_height = self.height - self.padding['top'] - self.padding['bottom']
+        self.max_points = max_points or max(3, self.plot_width)
         
-        # Convert date strings to datetime objects for processing
-        self.date_objects = [datetime.strptime(date, '%d-%m-%Y') for date in x_values] if x_values else []
-        
-        # Initialize date range
+        # Cached layers, rebuilt only when their inputs change (see render)
+        self._static_layer = None  # background, y label, axes and ticks
+        self._static_key = None
+        self._plot_layer = None  # static layer + data + x label, blitted every frame
+        self._plot_key = None
+        self._data_version = 0
+        self._chart = None  # ChartRenderer, created on the first GPU draw
+        self.loading = False  # "Loading..." over the plot until new data is set (see set_loading)
+
+        # Shared axis ranges of all series (see _update_ranges)
+        self.date_min = self.date_max = None
+        self.total_days = 0
+        self._day_min = 0
+        self.y_min, self.y_max = 0, 1
+
+        # Series share the axes, drawn in the order they were added
+        self.series = {MAIN_SERIES: PlotSeries(MAIN_SERIES, self.plotDataColor)}
+        self.update_data(x_values, y_values)
+
+    # === Data ===
+    def set_series(self, name, x_values, y_values, color=None):
+        """
+        Add a series (or replace its data) on the shared axes.
+
+        Parameters:
+            name (str): Series name, MAIN_SERIES is the one update_data() sets
+            x_values (list): Date strings 'DD-MM-YYYY'
+            y_values (list): Values, same length (mismatched lengths are plotted as empty)
+            color (tuple): RGB color, default: the next one of Target.COLOR_PALETTE
+        """
+        series = self.series.get(name)
+        if series is None:
+            if color is None:
+                color = Target.COLOR_PALETTE[(len(self.series) - 1) % len(Target.COLOR_PALETTE)]
+            series = self.series[name] = PlotSeries(name, color)
+        elif color is not None:
+            series.color = color
+        series.clear()
+        if x_values and len(x_values) == len(y_values):
+            series.append(_parse_dates(x_values), y_values)
+        self.loading = False
+        self._data_changed(series)
+
+    def set_loading(self, loading=True):
+        """Show a placeholder over the plot while its data is queried, the next set_series() removes it"""
+        self.loading = loading
+
+    def append_data(self, x_values, y_values, name=MAIN_SERIES):
+        """
+        Append points to a series. If the axis ranges don't change, only the new points are
+        projected (the usual case of newer sessions), otherwise everything is.
+        """
+        if not x_values or len(x_values) != len(y_values):
+            return
+        series = self.series[name]
+        days = _parse_dates(x_values)
+        # Only points after the series' last day keep the existing points valid
+        # (same-day points take that day's last value, decimated series are redone)
+        incremental = (series.count == len(series.points) and (series.count == 0 or days[0] > series.day_max)
+                       and bool(np.all(np.diff(days) > 0))
+                       and (self.decimation is None or series.count + len(days) <= self.max_points))
+        start = series.count
+        series.append(days, y_values)
+        ranges_changed = self._update_ranges()
+        if incremental and not ranges_changed:
+            series.points = np.concatenate((series.points, self._project(series.days[start:], series.values[start:])))
+            self._data_version += 1
+        else:
+            self._data_changed(series, ranges_changed)
+
+    def remove_series(self, name):
+        """Remove a series (MAIN_SERIES is only emptied)"""
+        if name == MAIN_SERIES:
+            self.series[name].clear()
+        else:
+            del self.series[name]
+        self._data_changed()
+
+    def _data_changed(self, series=None, ranges_changed=False):
+        """Ranges changed or a series was replaced: project again what is needed"""
+        if self._update_ranges() or ranges_changed or series is None:
+            for other in self.series.values():
+                other.points = self._project_series(other)
+        else:
+            series.points = self._project_series(series)
+        self._data_version += 1
+
+    def _update_ranges(self):
+        """Shared date and Y range of all series, returns True if they changed"""
+        previous = (self.date_min, self.total_days, self.y_min, self.y_max)
         self._update_date_range()
-        
-        # Calculate Y data range
         self._update_y_range()
+        return previous != (self.date_min, self.total_days, self.y_min, self.y_max)
 
     def _update_date_range(self):
-        """Calculate the full date range from min to max date"""
-        if not self.date_objects:
+        """Calculate the date range from min to max date"""
+        filled = [s for s in self.series.values() if s.count]
+        if not filled:
             self.date_min = None
             self.date_max = None
-            self.all_dates = []
+            self.total_days = 0
+            self._day_min = 0
             return
-            
-        self.date_min = min(self.date_objects)
-        self.date_max = max(self.date_objects)
-        
-        # Generate all dates in the range
-        self.all_dates = []
-        current_date = self.date_min
-        while current_date <= self.date_max:
-            self.all_dates.append(current_date)
-            current_date += timedelta(days=1)
+
+        self._day_min = min(s.day_min for s in filled)
+        day_max = max(s.day_max for s in filled)
+        self.total_days = day_max - self._day_min
+        self.date_min = _to_datetime(self._day_min)
+        self.date_max = _to_datetime(day_max)
 
     def _update_y_range(self):
         """Calculate the Y-axis range"""
-        if not self.y_values:
+        filled = [s for s in self.series.values() if s.count]
+        if not filled:
             self.y_min = 0
             self.y_max = 1
             return
             
-        self.y_min = min(self.y_values)*0.9 if self.y_values else 0
-        self.y_max = max(self.y_values)*1.1 if self.y_values else 1
+        self.y_min = min(s.value_min for s in filled)*0.9
+        self.y_max = max(s.value_max for s in filled)*1.1
         
         # Handle case where all Y values are identical
         if self.y_max == self.y_min:
@@ -99,30 +204,101 @@ class Plotter(Element):
                 self.y_min = self.y_min - abs(self.y_min * 0.1)
                 self.y_max = self.y_max + abs(self.y_max * 0.1)
 
+    def _project(self, days, values):
+        """Pixel positions (n, 2) of days/values relative to the plot's top-left corner"""
+        # Calculate Y scaling factor
+        if self.y_max == self.y_min:
+            y_scale = 0.5 * self.plot_height
+            y_offset = 0
+        else:
+            y_scale = self.plot_height / (self.y_max - self.y_min)
+            y_offset = self.y_min
+
+        # X position from the date's position in the full range (int() truncates like astype)
+        if self.total_days > 0:
+            xs = ((days - self._day_min) / self.total_days * self.plot_width).astype(np.int64)
+        else:
+            xs = np.zeros(len(days), dtype=np.int64)
+        ys = self.plot_height - ((values - y_offset) * y_scale).astype(np.int64)
+        return np.column_stack((xs + self.padding['left'], ys + self.padding['top']))
+
+    def _project_series(self, series):
+        """
+        Pixel positions of a series' points, an (n, 2) int array (empty if there is
+        nothing to plot), decimated if longer than max_points
+        """
+        if series.count == 0:
+            return np.empty((0, 2), dtype=np.int64)
+        days = series.days
+
+        # Sessions on the same day all take that day's last value
+        _, day_index = np.unique(days, return_inverse=True)
+        last = np.zeros(day_index.max() + 1, dtype=np.int64)
+        np.maximum.at(last, day_index, np.arange(len(days)))
+        values = series.values[last[day_index]]
+        points = self._project(days, values)
+
+        # Long histories: bounded by the plot width instead of the number of sessions
+        if self.decimation is not None and len(points) > self.max_points:
+            if self.decimation == "minmax":
+                kept = min_max_indices(points[:, 0], points[:, 1])
+            else:
+                kept = lttb_indices(days, values, self.max_points)
+            points = points[kept]
+        return points
+
     def render(self, screen):
-        """Render the plot with axes and data points"""
+        """Render the plot with axes and data points (cached, one blit unless something changed)"""
+        static_key = (self.width, self.height, self.style.bg_color, self.style.text_color,
+                      self.y_label, self.x_label, self.y_min, self.y_max, self.date_min, self.total_days)
+        if static_key != self._static_key:
+            self._static_layer = self._render_static_layer()
+            self._static_key = static_key
+            self._plot_key = None
+        plot_key = (self._data_version, self.loading, tuple(series.color for series in self.series.values()))
+        if plot_key != self._plot_key:
+            self._plot_layer = self._render_plot_layer()
+            self._plot_key = plot_key
+        screen.blit(self._plot_layer, (self.x, self.y))
+
+    def _render_static_layer(self):
+        """Background, y label, axes and ticks in local coordinates"""
+        surface = pygame.Surface((self.width, self.height))
         # Draw background
-        pygame.draw.rect(screen, self.style.bg_color, (self.x, self.y, self.width, self.height))
-        
-        # Calculate plot area position
-        plot_x = self.x + self.padding['left']
-        plot_y = self.y + self.padding['top']
+        surface.fill(self.style.bg_color)
         
         # Draw y_label
         if self.y_label:
             title_text = self.font.render(self.y_label, True, self.style.text_color)
-            title_x = self.x 
-            screen.blit(title_text, (title_x, self.y + 5))
+            surface.blit(title_text, (0, 5))
         
         # Draw axes first so they appear behind the data
-        self._draw_axes(screen, plot_x, plot_y)
-        
-        # Plot data points if we have values
-        if self.x_values and self.y_values and len(self.x_values) == len(self.y_values):
-            self._plot_data(screen, plot_x, plot_y)
-        
+        self._draw_axes(surface, self.padding['left'], self.padding['top'])
+        return surface
+
+    def _render_plot_layer(self):
+        """Static layer with the data and the x label on top"""
+        surface = self._static_layer.copy()
+        plot_x = self.padding['left']
+        plot_y = self.padding['top']
+
+        # Plot data points if we have values (on the GPU when there is a GL context)
+        ctx = chart_context(self.manager)
+        if ctx is not None:
+            self._plot_data_gpu(surface, ctx)
+        else:
+            for series in self.series.values():
+                if len(series.points):
+                    self._plot_data(surface, series.points, series.color)
+
         # Draw labels last so they appear on top
-        self._draw_labels(screen, plot_x, plot_y)
+        self._draw_labels(surface, plot_x, plot_y)
+        if self.loading:
+            loading_text = self.font.render("Loading...", True, self.style.text_color)
+            surface.blit(loading_text, loading_text.get_rect(center=(plot_x + self.plot_width // 2, plot_y + self.plot_height // 2)))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
 
     def _draw_axes(self, screen, plot_x, plot_y):
         """Draw the X and Y axes with tick marks"""
@@ -140,16 +316,16 @@ class Plotter(Element):
             2  # Y-axis
         )
         
-        # Draw X-axis ticks (date labels)
-        if self.all_dates:
-            num_x_ticks = min(5, len(self.all_dates))
-            step = max(1, len(self.all_dates) // num_x_ticks)
+        # Draw X-axis ticks (date labels), every step days from the first date
+        if self.date_min is not None:
+            day_count = self.total_days + 1
+            num_x_ticks = min(5, day_count)
+            step = max(1, day_count // num_x_ticks)
             
-            for i in range(0, len(self.all_dates), step):
-                date = self.all_dates[i]
+            for days_since_min in range(0, day_count, step):
+                date = self.date_min + timedelta(days=days_since_min)
                 # Calculate X position based on date's position in the full range
-                days_since_min = (date - self.date_min).days
-                total_days = (self.date_max - self.date_min).days
+                total_days = self.total_days
                 x_pos = plot_x + int((days_since_min / total_days) * self.plot_width) if total_days > 0 else plot_x
                 
                 # Draw tick mark
@@ -195,60 +371,108 @@ class Plotter(Element):
         x_label_text = self.font.render(self.x_label, True, self.style.text_color)
         screen.blit(x_label_text, (plot_x + (self.plot_width - x_label_text.get_width()) // 2, plot_y + self.plot_height + 25))
 
-    def _plot_data(self, screen, plot_x, plot_y):
-        """Plot the actual data points"""
-        if not self.date_objects or not self.all_dates:
-            return
-            
-        # Calculate Y scaling factor
-        if self.y_max == self.y_min:
-            y_scale = 0.5 * self.plot_height
-            y_offset = 0
-        else:
-            y_scale = self.plot_height / (self.y_max - self.y_min)
-            y_offset = self.y_min
-        
-        # Create a mapping from dates to their indices in the original data
-        date_to_index = {date: i for i, date in enumerate(self.date_objects)}
-        
-        # Plot as connected line
-        points = []
-        for i, date in enumerate(self.date_objects):
-            # Calculate X position based on date's position in the full range
-            days_since_min = (date - self.date_min).days
-            total_days = (self.date_max - self.date_min).days
-            x = plot_x + int((days_since_min / total_days) * self.plot_width) if total_days > 0 else plot_x
-            
-            # Get the corresponding Y value
-            y_value = self.y_values[date_to_index[date]]
-            y = plot_y + self.plot_height - int((y_value - y_offset) * y_scale)
-            points.append((x, y))
-        
+    def _plot_data(self, screen, points, color):
+        """Plot the data points of one series (projected when its data changed)"""
+        points = points.tolist()
+
         # Draw connecting lines
         if len(points) > 1:
-            pygame.draw.lines(screen, self.plotDataColor, False, points, 2)
+            pygame.draw.lines(screen, color, False, points, 2)
         
         # Draw points
         point_radius = 3
         for x, y in points:
-            pygame.draw.circle(screen, self.plotDataColor, (x, y), point_radius)
+            pygame.draw.circle(screen, color, (x, y), point_radius)
             pygame.draw.circle(screen, self.style.bg_color, (x, y), point_radius - 1)
 
+    def _plot_data_gpu(self, screen, ctx):
+        """_plot_data of every series with ChartRenderer: one draw call per series for lines and points"""
+        if self._chart is None or self._chart.size != (self.width, self.height):
+            if self._chart is not None:
+                self._chart.release()
+            self._chart = ChartRenderer(ctx, (self.width, self.height))
+        self._chart.begin()
+        for series in self.series.values():
+            self._chart.lines(series.points, series.color)
+            self._chart.points(series.points, series.color, self.style.bg_color)
+        screen.blit(self._chart.end(), (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+
+    def release(self):
+        """Free the GPU chart"""
+        if self._chart is not None:
+            self._chart.release()
+            self._chart = None
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Plotter typically doesn't handle events as it's not selectable"""
         return False
 
     def update_data(self, x_values, y_values):
         """Update the plot data and recalculate ranges"""
-        self.x_values = x_values
-        self.y_values = y_values
-        self.date_objects = [datetime.strptime(date, '%d-%m-%Y') for date in x_values] if x_values else []
-        
-        # Update date range
-        self._update_date_range()
-        self._update_y_range()
+        self.set_series(MAIN_SERIES, x_values, y_values)
+
     def on_press(self):
         pass
 
     def change_plot_color(self, color):
-        self.plotDataColor = color
\ No newline at end of file
+        self.plotDataColor = color
+        self.series[MAIN_SERIES].color = color
+
+
+class PlotSeries:
+    def __init__(self, name, color):
+        """
+        One series of a Plotter: dates as day numbers and values in numpy arrays that grow
+        by doubling, so appending a few points doesn't copy the whole history. The min/max
+        are kept up to date for the Plotter's shared axes.
+        """
+        self.name = name
+        self.color = color
+        self.points = np.empty((0, 2), dtype=np.int64)  # projected by the Plotter
+        self.clear()
+
+    def clear(self):
+        self._days = np.empty(0, dtype=np.int64)
+        self._values = np.empty(0, dtype=np.float64)
+        self.count = 0
+        self.day_min = self.day_max = None
+        self.value_min = self.value_max = None
+
+    @property
+    def days(self):
+        return self._days[:self.count]
+
+    @property
+    def values(self):
+        return self._values[:self.count]
+
+    def append(self, days, values):
+        values = np.asarray(values, dtype=np.float64)
+        count = self.count + len(days)
+        if count > len(self._days):
+            capacity = max(count, 2 * len(self._days), 16)
+            self._days = np.resize(self._days, capacity)
+            self._values = np.resize(self._values, capacity)
+        self._days[self.count:count] = days
+        self._values[self.count:count] = values
+        self.count = count
+
+        # Python numbers, so the axis ranges compare and format like plain lists did
+        day_min, day_max = int(days.min()), int(days.max())
+        value_min, value_max = values.min().item(), values.max().item()
+        if self.day_min is None:
+            self.day_min, self.day_max = day_min, day_max
+            self.value_min, self.value_max = value_min, value_max
+        else:
+            self.day_min, self.day_max = min(self.day_min, day_min), max(self.day_max, day_max)
+            self.value_min, self.value_max = min(self.value_min, value_min), max(self.value_max, value_max)
+
+
+def _parse_dates(x_values):
+    """'DD-MM-YYYY' strings -> day numbers since the epoch (reordered into ISO dates for numpy)"""
+    return np.array([f"{d[6:]}-{d[3:5]}-{d[:2]}" for d in x_values], dtype='datetime64[D]').astype(np.int64)
+
+
+def _to_datetime(day):
+    """numpy day number (days since 1970-01-01) -> datetime"""
+    return datetime(1970, 1, 1) + timedelta(days=int(day))
\ No newline at end of file
@@ -18,7 +18,9 @@ class SessionCell(Element):
         weight_previous: float = 0,
         reps_previous: int = 1,
         rep_range: tuple = (1, 2),
-        exercise: str = "Squat"
+        exercise: str = "Squat",
+        target: str = None,
+        weight_inc: float = None
     ):
         super().__init__(
             x=x,
@@ -31,14 +33,26 @@ class SessionCell(Element):
             neighbors=neighbors,
             layer=layer
         )
+        self.font = pygame.font.SysFont("Arial", font_size)
+        self.load_set(weight_previous, reps_previous, rep_range, exercise, target, weight_inc)
+
+    def load_set(self, weight_previous, reps_previous, rep_range, exercise, target=None, weight_inc=None):
+        """
+        (Re)start the cell with a set from the previous session, dropping anything entered,
+        lets a table reuse its cells when it loads another program.
+        target and weight_inc are looked up from the exercise when not given.
+        """
         self.weightFromPreviousSession = weight_previous
         self.weightFromThisSession = weight_previous
         self.repsFromPreviousSession = reps_previous
         self.repsFromThisSession = reps_previous
         self.repRange = rep_range
         self.exercise = exercise
-        self.excerciseTargetMuscle = self.manager.queryTool.get_exercise_by_name( self.exercise ).target # Get based on excercise
-        self.font = pygame.font.SysFont("Arial", font_size)
+        if target is None or weight_inc is None:
+            exercise_data = self.manager.queryTool.get_exercise_by_name( self.exercise )
+            target = exercise_data.target if target is None else target
+            weight_inc = exercise_data.weight_inc if weight_inc is None else weight_inc
+        self.excerciseTargetMuscle = target # Get based on excercise
         self.edit_state = "notEdited"  # 'notEdited', 'editReps', 'editWeight', 'hasBeenEdited'
         self.has_been_edited = False
         self.is_active = False  # For input mode
@@ -48,7 +62,7 @@ class SessionCell(Element):
         self.input_min = 0
         self.input_max = 100
         self.input_step_reps = 1
-        self.input_step_weight = self.manager.queryTool.get_exercise_by_name( self.exercise ).weight_inc
+        self.input_step_weight = weight_inc
         if self.input_step_weight is None or self.input_step_weight == 0:
             self.input_step_weight = 1.25
         self.style = StyleManager.current_style
@@ -24,9 +24,6 @@ class FormGetExerciseOptions(Form):
         self.exerciseDropDown = SelectDropDown(x=250,y=40,options=self.manager.queryTool.get_exercise_names_by_target(self.selected_query),manager=self.manager)
         self.exercise_selection_panel.add_element(self.exerciseDropDown)
         
-        # Connect navigation 
-        self.exercise_selection_panel.setNeighbors()       
-        
         # Set up actions
         self.setup_actions()
         
@@ -24,9 +24,6 @@ class FormYesNo(Form):
         self.choice_buttons_panel.add_element(self.yes_btn)
         self.choice_buttons_panel.add_element(self.no_btn)
         
-        # Connect navigation 
-        self.choice_buttons_panel.setNeighbors()       
-        
         # Set up actions
         self.setup_actions()
         
@@ -20,9 +20,6 @@ class FormGetInputWeek(Form):
         self.weekInputField = InputField(initial_value=1, min_value=1, max_value=12, step=1, manager=self.manager,x=screenWidth//2-40,y=screenHeight//2) # Get max value from db?
         self.weekInputField_panel.add_element(self.weekInputField)
         
-        # Connect navigation 
-        self.weekInputField_panel.setNeighbors()       
-        
         # Set up actions
         self.setup_actions()
         
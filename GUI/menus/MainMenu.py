@@ -7,12 +7,29 @@ from GUI.elements.ValueDisplay import ValueDisplay
 from GUI.elements.Image.Image2D import Image2D
 from GUI.elements.Label import Label
 from GUI.elements.InputField import InputField
-from GUI.elements.Image.Image2D_Graph import Image2D_Graph
+from GUI.elements.Image.Image2D_Graph import Image2D_Graph, preload_label_maps
 from GUI.elements.Image.ImageCarousel import ImageCarousel
 from GUI.style import StyleManager
+from workout_db_r.Target import Target
 
 
 class MainMenu(Menu):
+    FRONT_IMAGE = "GUI/elements/Image/images/Front.png"
+    BACK_IMAGE = "GUI/elements/Image/images/Back.png"
+
+    @classmethod
+    def preload(cls, query):
+        preload_label_maps(cls.FRONT_IMAGE, cls.BACK_IMAGE)
+        return {
+            "bodyweight": query.get_last_bodyweight(),
+            "workload": cls.query_workload(query),
+        }
+
+    @staticmethod
+    def query_workload(query):
+        """Sets per muscle of the last 3 weeks"""
+        return {muscle: query.get_muscle_workload(muscle=muscle,weeks=3)["total_sets"] for muscle in Target.MUSCLES}
+
     def setup(self):
         """Setup panels, elements and actions"""
         screenWidth, screenHeight = pygame.display.get_surface().get_size() # Get screen size
@@ -45,7 +62,7 @@ class MainMenu(Menu):
 
         # Logo
         self.logoPanel = self.add_panel(Panel, x=0, y=self.MetaDataDisplayPanel.height , width=self.MetaDataDisplayPanel.width, height=self.LabelPanel.y-self.MetaDataDisplayPanel.height, drawBorder=True)
-        self.logo = Image2D(image_path="GUI\elements\Image\images\\Logo.png", height = 474//3 , width= 424//3, manager=self.manager,layer=2)
+        self.logo = Image2D(image_path="GUI/elements/Image/images/logo.png", height = 474//3 , width= 424//3, manager=self.manager,layer=2)
         self.logoPanel.add_element(self.logo)
 
         # Add elements (InputPanel panel)
@@ -59,7 +76,7 @@ class MainMenu(Menu):
         except (KeyError, AttributeError) as e:
             # Fallback 1: Try getting bodyweight from last session
             try:
-                last_bodyweight = self.manager.queryTool.get_last_bodyweight()
+                last_bodyweight = self.preloaded_or("bodyweight", self.manager.queryTool.get_last_bodyweight)
                 if last_bodyweight is not None:
                     bodyweight = last_bodyweight
                     if bodyweight is not None:
@@ -80,9 +97,9 @@ class MainMenu(Menu):
         self.InputPanel.add_element(self.btn)
 
         # Add elements (Carousel panel)
-        self.image1 = Image2D_Graph(image_path="GUI\elements\Image\images\\Front.png", height = 290 , width= 300*0.7, manager=self.manager,layer=2)
+        self.image1 = Image2D_Graph(image_path=self.FRONT_IMAGE, height = 290 , width= 300*0.7, manager=self.manager,layer=2)
         self.image1.muscleGroups = ["Forearms", "Biceps", "Triceps","Shoulders","Chest","Back","Abs","Quads","Calves"]
-        self.image2 = Image2D_Graph(image_path="GUI\elements\Image\images\\Back.png", height = 280 , width= 300*0.5, manager=self.manager,layer=2)
+        self.image2 = Image2D_Graph(image_path=self.BACK_IMAGE, height = 280 , width= 300*0.5, manager=self.manager,layer=2)
         self.image2.muscleGroups = ["Back","Shoulders","Triceps","Forearms","Glutes","Hamstrings","Calves"]
         self.imageImageCarousel = ImageCarousel(images=[], manager=self.manager, mode="random_timed", height = 300 , width= 300*0.7,layer=2)
         self.CarouselPanel.add_element(self.imageImageCarousel)
@@ -92,6 +109,8 @@ class MainMenu(Menu):
         # Create volumeSummary panel
         volSumPanelWidth = self.CarouselPanel.x - self.InputPanel.width
         self.volumeSummary = self.add_panel(Panel, x=self.CarouselPanel.x - volSumPanelWidth, y=self.CarouselPanel.y,width=volSumPanelWidth, height=self.CarouselPanel.height)
+        self.volumeSummary.navigable = False  # the counts are only shown, arrow keys skip them
+        self.workload = None  # sets per muscle of the last workload query
         self.update_carousel()
 
         # Create volumeLabel panel
@@ -99,21 +118,7 @@ class MainMenu(Menu):
         self.volumeLabel = Label(text="Volume summary of 3 weeks", width=200, height=40, manager=self.manager)
         self.volumeLabelPanel.add_element(self.volumeLabel)
         
-        # Connect navigation between nav bar and InputPanel
-        for nav_btn in self.nav_bar.buttons:
-            nav_btn.set_neighbor("up", self.InputPanel.getElements()[-1])  # Last element in InputPanel
-        for btn in self.InputPanel.getSelectableElements():
-            btn.set_neighbor("down", self.nav_bar.buttons[0])
         self.nav_bar.buttons[0].activate()
-
-        # Connect navigation between InputPanel and table
-        for InputPanel_btn in self.InputPanel.getElements():
-            InputPanel_btn.set_neighbor("right", self.CarouselPanel.getElements()[0])  # First element in table
-        self.CarouselPanel.getElements()[0].set_neighbor("left", self.InputPanel.getElements()[1])
-
-        # Connect neighbors within (can be done via panel or manualy)
-        self.InputPanel.setNeighbors()
-        self.CarouselPanel.setNeighbors()
         
         # Set up actions
         self.setup_actions()
@@ -133,11 +138,24 @@ class MainMenu(Menu):
         # Delete existing elements in volumeSummary panel
         #print("Update carousel")
         self.volumeSummary.clear_elements()
-        # Add elements (volumeSummary panel)
+        # Add elements (volumeSummary panel), showing the last counts until the new query is done
+        self.workloadButtons = {}
         for targetMuscle in self.imageImageCarousel.get_image().muscleGroups:
-            btn = Button(text=f"{targetMuscle}: {self.manager.queryTool.get_muscle_workload(muscle=targetMuscle,weeks=3)["total_sets"]}", width=150, height=30, manager=self.manager)
+            count = self.workload[targetMuscle] if self.workload is not None else "..."
+            btn = Button(text=f"{targetMuscle}: {count}", width=150, height=30, manager=self.manager)
             btn.set_style_override({'bg_color': StyleManager.get_muscle_group_color(targetMuscle)['bg_color']})
             self.volumeSummary.add_element(btn)
+            self.workloadButtons[targetMuscle] = btn
+        # Sets per muscle, queried in the background
+        self.query_async("workload", self.query_workload, self.show_workload, preloaded_key="workload")
+
+    def show_workload(self, workload):
+        """Colors the images as a heatmap (re-rendered only when the numbers change) and fills in the counts"""
+        self.workload = workload
+        self.image1.set_workload(workload)
+        self.image2.set_workload(workload)
+        for targetMuscle, btn in self.workloadButtons.items():
+            btn.text = f"{targetMuscle}: {workload[targetMuscle]}"
 
     def set_initial_focus_on_switch(self):
         # Set focus to the first nav bar button or any default element
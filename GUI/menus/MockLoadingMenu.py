@@ -1,6 +1,7 @@
 import pygame
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from GUI.Menu import Menu
 from GUI.Panel import Panel
 from GUI.elements.Button import Button
@@ -32,6 +33,7 @@ class MockLoadingMenu(Menu):
         self.wipModule2.selectable = False
 
         self.panel3D = Panel(x=0,y=0,width=screenWidth*0.4,height=screenHeight-self.buttonsPanel.height,manager=self.manager)
+        self.panel3D.navigable = False  # the model only spins, arrow keys stay on the buttons
 
         self.display_3d = Display3D(
             x=0, y=0, width=self.panel3D.width, height=self.panel3D.height,
@@ -39,9 +41,9 @@ class MockLoadingMenu(Menu):
             ctx=self.manager.screen3Drefs['ctx'],
             fbo_3d=self.manager.screen3Drefs['fbo'],
             tex_3d=self.manager.screen3Drefs['tex'],
-            model_path="GUI\ThreeDee\models\Mat.obj",
-            vertex_shader_path="GUI\ThreeDee\shaders\\basic.vert",
-            fragment_shader_path="GUI\ThreeDee\shaders\\basic.frag",
+            model_path="GUI/ThreeDee/models/Mat.obj",
+            vertex_shader_path="GUI/ThreeDee/shaders/basic.vert",
+            fragment_shader_path="GUI/ThreeDee/shaders/basic.frag",
             target_size=2
         )
         self.panel3D.add_element(self.display_3d)
@@ -57,12 +59,12 @@ class MockLoadingMenu(Menu):
         self.add_panel_instance(self.consolePanel)
         self.add_panel_instance(self.buttonsPanel)
         
-        self.connectNeighbors()
-        
         # Set up actions
         self.setup_actions()
 
         # Stores actual steps in loading (classes that will be instantiated)
+        # Only the menu the module opens on is built here, the rest on first use (see MenuManager.register_menu)
+        self.start_menu = "MainMenu"
         self.ExerciseModuleLoading_steps = [
             ("MainMenu", MainMenu),
             ("SessionMenu", SessionMenu),
@@ -74,24 +76,26 @@ class MockLoadingMenu(Menu):
         self.previous_time = time.time()
         self.next_delay = random.uniform(0.5, 1.5)  # random time interval for step
 
+        # Menus' preload() (queries, image decoding) runs here while frames keep coming
+        self.loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MenuLoader")
+        self.step_future = None
+        self.step_phase = "data"
+
 
     def setup_actions(self):
         """Configure all element actions"""
         self.exerciseModuleBtn.on_press = self.exerciseModuleAction
         
 
-    def connectNeighbors(self):
-        pass
-
     def exerciseModuleAction(self):
         # Start mock loading (menus will load gradually in update loop)
         self.update = self.loadUpdate
         self.current_step = 0
-        self.start_load_time = time.time()
+        self.step_elapsed = 0.0 # seconds spent in current loading step, summed from update dt
         self.delays = []
         for i in range(1,18): #4loading bars, for each 3giberish lines
             if i%4 == 1:
-                self.delays.append(random.uniform(0.3, 1))
+                self.delays.append(None) # loading bars take as long as loading the menu does
             else:
                 self.delays.append(random.uniform(0.1, 0.3))
         #print(self.next_delays)
@@ -102,6 +106,7 @@ class MockLoadingMenu(Menu):
     def loadUpdate(self, dt):
         """Called every frame, dt = delta time in seconds"""
         # this will replace usual Menu update which gets called each frame with delta time
+        self.step_elapsed += dt
         if self.queue_iterator >= len(self.delays)-1:
             # when finished
             self.exerciseModuleBtn.activate()
@@ -110,24 +115,25 @@ class MockLoadingMenu(Menu):
             self.console.printText("    ===  Exercise Module loaded  ===")
             # revert the menu.update function to do nothing, so that this case is not processed
             self.update = lambda dt : None
+            self.loader.shutdown(wait=False)
         elif self.queue_iterator % 4 == 0:
             #ProgressBar
-            prog = min((time.time() - self.start_load_time)/self.delays[self.queue_iterator] , 1)
             name, cls = self.ExerciseModuleLoading_steps[self.queue_iterator//4]
-            menu_instance = cls(self.manager.gui_surface, self.manager)
-            self.manager.register_menu(name, menu_instance)
+            prog = self.loadStep(name, cls)
             self.console.drawProgressBar(prompt=f"  Loading menu -> {self.ExerciseModuleLoading_steps[self.queue_iterator//4][0]}   ({self.queue_iterator//4+1}/{len(self.ExerciseModuleLoading_steps)})",startingCol=0,progress=prog)
             if prog >= 1:
                 #Gen Gib list that will be used for next 3
                 self.gibList = self.console.getGiberishList()
                 self.queue_iterator += 1
-                self.start_load_time = time.time()
+                self.step_elapsed = 0.0
                 self.console._advance_row()
                 self.console._advance_row()
+                self.console.printText(self.step_timing)
+                self.console._advance_row()
                 self.console._advance_row()
             
         elif self.queue_iterator < len(self.delays):
-            prog = min((time.time() - self.start_load_time)/self.delays[self.queue_iterator] , 1)
+            prog = min(self.step_elapsed/self.delays[self.queue_iterator] , 1)
             #Giberish line
             if self.printed_flag == False:
                 self.console.printText(self.gibList[self.queue_iterator%4 - 1])
@@ -137,12 +143,55 @@ class MockLoadingMenu(Menu):
                 self.printed_flag = False
                 self.gibList = self.console.getGiberishList()
                 self.queue_iterator += 1
-                self.start_load_time = time.time()    
+                self.step_elapsed = 0.0    
             
                 
 
+    def loadStep(self, name, cls):
+        """
+        One frame of loading a menu, returns the step's progress. Menus other than
+        start_menu are only registered, MenuManager runs their preload() on its
+        QueryExecutor and builds them from the result when first needed.
+        The start menu's preload() runs on the loader thread (bar at 0 until it's done,
+        then 0.5), then the menu is built from its result on this thread, where pygame
+        and GL live (bar full).
+        """
+        if name != self.start_menu:
+            self.manager.register_menu(name, lambda preloaded: cls(self.manager.gui_surface, self.manager, preloaded=preloaded),
+                                       preload=cls.preload)
+            self.step_timing = "    registered, data preloading, built on first use"
+            return 1.0
+
+        if self.step_phase == "data":
+            if self.step_future is None:
+                self.step_future = self.loader.submit(self._timed, cls.preload, self.manager.queryTool)
+            if not self.step_future.done():
+                return 0.0
+            # Show the half full bar for a frame before the build blocks one
+            self.step_phase = "build"
+            return 0.5
+
+        preloaded, data_time = self.step_future.result()  # raises here if preload() failed
+        menu_instance, build_time = self._timed(cls, self.manager.gui_surface, self.manager, preloaded=preloaded)
+        self.manager.register_menu(name, menu_instance)
+        self.step_timing = f"    preload {data_time * 1000:.0f} ms, build {build_time * 1000:.0f} ms"
+        self.step_future = None
+        self.step_phase = "data"
+        return 1.0
+
+    @staticmethod
+    def _timed(function, *args, **kwargs):
+        """function's result and the seconds it took"""
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        return result, time.perf_counter() - start
+
+    def is_animating(self):
+        # Progress bars are advanced from update(), keep frames coming while loading
+        return self.update == self.loadUpdate or super().is_animating()
+
     def switch_to_exercise_module(self):
-        self.manager.switch_to("MainMenu")
+        self.manager.switch_to(self.start_menu)
         self.display_3d.release()
 
     def set_initial_focus_on_switch(self):
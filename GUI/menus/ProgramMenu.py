@@ -6,7 +6,7 @@ from GUI.elements.Button import Button
 from GUI.elements.SelectDropDown import SelectDropDown
 from GUI.Table import Table
 from GUI.panels.ProgramMenu_ex_selection import TargetSelectionPanel
-from GUI.elements.Image.Image2D_Graph import Image2D_Graph
+from GUI.elements.Image.Image2D_Graph import Image2D_Graph, preload_label_maps
 from GUI.panels.ProgramMenu_stats_exercise import ExerciseStatsPanel
 from workout_db_r.Target import Target
 from GUI.elements.PieChart import PieChart
@@ -14,10 +14,53 @@ from GUI.elements.ValueDisplay import ValueDisplay
 from GUI.style import StyleManager
 
 class ProgramMenu(Menu):
+    ARM_IMAGE = "GUI/elements/Image/images/Arm.png"
+    LEG_IMAGE = "GUI/elements/Image/images/Leg.png"
+    TORSO_IMAGE = "GUI/elements/Image/images/torso.png"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.current_mode = "programs"  # Default mode, either "programs" or "exercises"
 
+    @classmethod
+    def preload(cls, query):
+        preload_label_maps(cls.ARM_IMAGE, cls.LEG_IMAGE, cls.TORSO_IMAGE)
+        programNames = query.get_all_program_names()
+        # Exercise mode starts on the first exercise of TargetSelectionPanel's default target
+        exerciseNames = query.get_exercise_names_by_target("Chest")
+        return {
+            "program_names": programNames,
+            "program": cls.query_program(query, programNames[0]),
+            ("exercise_names", "Chest"): exerciseNames,
+            ("exercise_stats", exerciseNames[0]): ExerciseStatsPanel.query_stats(query, exerciseNames[0]),
+        }
+
+    @staticmethod
+    def query_program(query, program):
+        """All database values the program mode shows for a program"""
+        return {
+            "table_data": query.get_program_table_data(program),
+            "distribution": query.get_program_target_distribution(program),
+            "session_count": query.get_program_session_count(program),
+            "session_count_year": query.get_program_session_count(program,52),
+        }
+
+    @staticmethod
+    def program_stats_text(program):
+        """Texts of the Muscles Hit and Sessions Performed displays"""
+        distribution = program["distribution"]
+        dist_str=""
+        i = 1
+        for key in distribution.keys():
+            if i%4==0:
+                dist_str+=f"\n   {key[:3]}: {distribution[key]}"
+                i+=1
+            else:
+                dist_str+=f"   {key[:3]}: {distribution[key]}"
+                i+=1
+        stats_str = f"   Last 3 Weeks:   {program['session_count']}\n   Last Year:          {program['session_count_year']}"
+        return dist_str, stats_str
+
     def setup(self):
         """Setup panels, elements and actions"""
         screenWidth, screenHeight = pygame.display.get_surface().get_size() # Get screen size
@@ -41,26 +84,17 @@ class ProgramMenu(Menu):
         self.table = Table(x=self.programsPanel.width,y=0,width=screenWidth*3//4,height=self.programs_excercieses_panel.y,rows=3,cols=3,manager=self.manager,drawBorder=True)
         
         # Add elements
-        programNames = self.manager.queryTool.get_all_program_names()
+        programNames = self.preloaded_or("program_names", self.manager.queryTool.get_all_program_names)
         self.selectProgram = SelectDropDown(options=programNames[::-1], width=self.programsPanel.width - 6, height=self.programsPanel.height-5, manager=self.manager, layer=2, drop_direction="up")
         self.programsPanel.add_element(self.selectProgram)
 
-        self.table.load_data_program(self.manager.queryTool.get_program_table_data(programNames[0]),manager=self.manager) # Load initial program data
+        program = self.preloaded_or("program", lambda: self.query_program(self.manager.queryTool, programNames[0]))
+        self.table.load_data_program(program["table_data"],manager=self.manager) # Load initial program data
         self.pieChartPanel = Panel(x=0,y=0,width=self.table.x,height=self.table.x*0.58,manager=self.manager)
-        distribution = self.manager.queryTool.get_program_target_distribution(programNames[0])
-        self.pieChart = PieChart(distribution=distribution ,x=0,y=0,width=self.pieChartPanel.width,height=self.pieChartPanel.width*0.58,manager=self.manager)
+        self.pieChart = PieChart(distribution=program["distribution"] ,x=0,y=0,width=self.pieChartPanel.width,height=self.pieChartPanel.width*0.58,manager=self.manager)
         self.pieChartPanel.add_element(self.pieChart)
         self.programStatsPanel = Panel(x=0,y=self.pieChartPanel.height,width=self.table.x,height=self.table.height-self.pieChartPanel.height-self.programsPanel.height,manager=self.manager)
-        dist_str=""
-        i = 1
-        for key in distribution.keys():
-            if i%4==0:
-                dist_str+=f"\n   {key[:3]}: {distribution[key]}"
-                i+=1
-            else:
-                dist_str+=f"   {key[:3]}: {distribution[key]}"
-                i+=1
-        stats_str = f"   Last 3 Weeks:   {self.manager.queryTool.get_program_session_count(programNames[0])}\n   Last Year:          {self.manager.queryTool.get_program_session_count(programNames[0],52)}"
+        dist_str, stats_str = self.program_stats_text(program)
         self.programStatsValueDisplay1 = ValueDisplay(prompt="Muscles Hit", value=dist_str,width=self.programStatsPanel.width,height=self.programStatsPanel.height//2, manager=self.manager)
         self.programStatsValueDisplay2 = ValueDisplay(prompt="Sessions Performed", value=stats_str,width=self.programStatsPanel.width,height=self.programStatsPanel.height//2, manager=self.manager)
         self.programStatsPanel.add_element(self.programStatsValueDisplay1)
@@ -71,35 +105,26 @@ class ProgramMenu(Menu):
         self.targetSelectionPanel.getElements()[0].activate()  # Activate first button by default
 
         self.selectExercisePanel = Panel(x=0,y=0,width=screenWidth,height=50,manager=self.manager)
-        self.selectExercise = SelectDropDown(options=self.manager.queryTool.get_exercise_names_by_target( self.targetSelectionPanel.active_target ), width=screenWidth//4, height=35, manager=self.manager, layer=3)
+        activeTarget = self.targetSelectionPanel.active_target
+        exerciseNames = self.preloaded_or(("exercise_names", activeTarget), lambda: self.manager.queryTool.get_exercise_names_by_target( activeTarget ))
+        self.selectExercise = SelectDropDown(options=exerciseNames, width=screenWidth//4, height=35, manager=self.manager, layer=3)
         self.selectExercisePanel.add_element(self.selectExercise)
 
         imagePanelWidth=self.targetSelectionPanel.x - 350 # 350 - stats panel width
         self.imagePanel = Panel(x=self.targetSelectionPanel.x - imagePanelWidth, y=self.targetSelectionPanel.y, width=imagePanelWidth, height=self.targetSelectionPanel.height,manager=self.manager)
         scale = 0.5
-        self.image1 = Image2D_Graph(image_path="GUI\elements\Image\images\\Arm.png", height = 350*scale , width= 165*scale, manager=self.manager,layer=2, specificMuscleGroup=self.targetSelectionPanel.active_target )
+        self.image1 = Image2D_Graph(image_path=self.ARM_IMAGE, height = 350*scale , width= 165*scale, manager=self.manager,layer=2, specificMuscleGroup=self.targetSelectionPanel.active_target )
         self.image1.muscleGroups = ["Shoulders","Biceps","Triceps","Forearms"]
-        self.image2 = Image2D_Graph(image_path="GUI\elements\Image\images\\Leg.png", height = 350*scale , width= 210*scale, manager=self.manager,layer=2, specificMuscleGroup=self.targetSelectionPanel.active_target )
+        self.image2 = Image2D_Graph(image_path=self.LEG_IMAGE, height = 350*scale , width= 210*scale, manager=self.manager,layer=2, specificMuscleGroup=self.targetSelectionPanel.active_target )
         self.image2.muscleGroups = ["Glutes","Quads","Hamstrings","Calves"]
-        self.image3 = Image2D_Graph(image_path="GUI\elements\Image\images\\Torso.png", height = 350*scale , width= 291*scale, manager=self.manager,layer=2, specificMuscleGroup=self.targetSelectionPanel.active_target )
+        self.image3 = Image2D_Graph(image_path=self.TORSO_IMAGE, height = 350*scale , width= 291*scale, manager=self.manager,layer=2, specificMuscleGroup=self.targetSelectionPanel.active_target )
         self.image3.muscleGroups = ["Shoulders","Chest","Back","Abs"]
         self.imagePanel.add_element(self.image3) # Defult, since chest is the defult target
 
-        self.statsPanel = ExerciseStatsPanel(x=0,y=self.targetSelectionPanel.y, width=350, height=self.programs_excercieses_panel.y-50,manager=self.manager,queriedExercise=self.selectExercise.getSelectedOption() )
-        
+        queriedExercise = self.selectExercise.getSelectedOption()
+        exerciseStats = self.preloaded.pop(("exercise_stats", queriedExercise), None)  # queried by the panel if not preloaded
+        self.statsPanel = ExerciseStatsPanel(x=0,y=self.targetSelectionPanel.y, width=350, height=self.programs_excercieses_panel.y-50,manager=self.manager,queriedExercise=queriedExercise, stats=exerciseStats )
         
-        
-        # Connect navigation between nav bar and PROGRAMS/EXERCISES panel
-        for nav_btn in self.nav_bar.buttons:
-            nav_btn.set_neighbor("up", self.programs_excercieses_panel.getElements()[0])  # First element in programs_excercieses_panel
-        for btn in self.programs_excercieses_panel.getSelectableElements():
-            btn.set_neighbor("down", self.nav_bar.buttons[2])
-
-        # Connect neighbors within (can be done via panel or manualy)
-        self.programs_excercieses_panel.setNeighbors()
-        self.programsPanel.setNeighbors()
-        self.table.setNeighbors()
-
         self.load_program_mode("programs")  # Load default mode
         
         # Set up actions
@@ -124,73 +149,35 @@ class ProgramMenu(Menu):
         self.remove_mode_panels()
         # Add panels relevant to program mode
         if mode == "programs":
-            # Detatch possible connection between excercise btn and excercise mode content
-            self.programs_excercieses_panel.getElements()[1].set_neighbor("up", None)
-
             # Add instances
             self.add_panel_instance(self.programsPanel)
             self.add_panel_instance(self.table)
             self.add_panel_instance(self.pieChartPanel)
             self.add_panel_instance(self.programStatsPanel)
 
-            # Connect navigation between programsPanel and table
-            for programsPanel_elem in self.programsPanel.getElements():
-                programsPanel_elem.set_neighbor("right", self.table.elements_grid[-1][0])  # First element in last row table
-            for row in range(len(self.table.elements_grid)):
-                for elem in self.table.getElementsInRow(row):
-                    if elem is not None:
-                        elem.set_neighbor("left", self.programsPanel.getElements()[0])
-                        break
-            # Connect PROGRAMS/EXERCISES panel and programsPanel
-            self.selectProgram.set_neighbor("down", self.programs_excercieses_panel.getElements()[0])
-            self.programs_excercieses_panel.getElements()[0].set_neighbor("up", self.selectProgram)
-
         elif mode == "exercises":
-            # Detatch possible connection between program btn and program mode content
-            self.programs_excercieses_panel.getElements()[0].set_neighbor("up", None)
-
             # Add instances
             self.add_panel_instance(self.targetSelectionPanel)
             self.add_panel_instance(self.selectExercisePanel)
             self.add_panel_instance(self.imagePanel)
             self.add_panel_instance(self.statsPanel)
-
-            # Connect PROGRAMS/EXERCISES panel and targetSelectionPanel
-            self.targetSelectionPanel.getElements()[-1].set_neighbor("down", self.programs_excercieses_panel.getElements()[1])
-            self.programs_excercieses_panel.getElements()[1].set_neighbor("up", self.targetSelectionPanel.getElements()[-1])
-
-            # Connect targetSelectionPanel panel and selectExercisePanel
-            self.selectExercisePanel.getElements()[-1].set_neighbor("down", self.targetSelectionPanel.getElements()[0])
-            self.targetSelectionPanel.getElements()[0].set_neighbor("up", self.selectExercisePanel.getElements()[0])
-            self.targetSelectionPanel.getElements()[1].set_neighbor("up", self.selectExercisePanel.getElements()[0]) # since there are 2 cols
         else:
             print("Invalid mode")
 
 
     def load_program(self):
-        self.table.load_data_program(self.manager.queryTool.get_program_table_data( self.selectProgram.getSelectedOption() ),manager=self.manager)
-        # Connect navigation between programsPanel and table
-        for programsPanel_elem in self.programsPanel.getElements():
-            programsPanel_elem.set_neighbor("right", self.table.elements_grid[1][0])  # First element in table
-        for row in self.table.elements_grid:
-            for elem in row:
-                if elem is not None:
-                    elem.set_neighbor("left", self.programsPanel.getElements()[0])
-        self.table.setNeighbors()
+        # Queried in the background, the stats show a placeholder until show_program()
+        programName = self.selectProgram.getSelectedOption()
+        self.programStatsValueDisplay1.set_value("   Loading...")
+        self.programStatsValueDisplay2.set_value("   Loading...")
+        self.query_async("program", lambda query: self.query_program(query, programName), self.show_program)
+
+    def show_program(self, program):
+        self.table.load_data_program(program["table_data"],manager=self.manager)
         # update chart
-        self.pieChart.update(self.manager.queryTool.get_program_target_distribution( self.selectProgram.getSelectedOption() ))
+        self.pieChart.update(program["distribution"])
         # update stats
-        distribution = self.manager.queryTool.get_program_target_distribution( self.selectProgram.getSelectedOption() )
-        dist_str=""
-        i = 1
-        for key in distribution.keys():
-            if i%4==0:
-                dist_str+=f"\n   {key[:3]}: {distribution[key]}"
-                i+=1
-            else:
-                dist_str+=f"   {key[:3]}: {distribution[key]}"
-                i+=1
-        stats_str = f"   Last 3 Weeks:   {self.manager.queryTool.get_program_session_count( self.selectProgram.getSelectedOption() )}\n   Last Year:          {self.manager.queryTool.get_program_session_count(self.selectProgram.getSelectedOption(),52)}"
+        dist_str, stats_str = self.program_stats_text(program)
         self.programStatsValueDisplay1.set_value(dist_str)
         self.programStatsValueDisplay2.set_value(stats_str)
 
@@ -210,8 +197,10 @@ class ProgramMenu(Menu):
         self.load_program_mode("exercises")
 
     def on_target_change(self):
-        self.selectExercise.updateOptions( self.manager.queryTool.get_exercise_names_by_target( self.targetSelectionPanel.active_target ) )
-        self.on_finished_excercise_selection()
+        # Exercises of the target are queried in the background, the image changes right away
+        target = self.targetSelectionPanel.active_target
+        self.statsPanel.show_loading()
+        self.query_async("target_exercises", lambda query: query.get_exercise_names_by_target(target), self.show_target_exercises)
         self.imagePanel.clear_elements() # Clear previous image
         group =  Target.get_muscle_group(self.targetSelectionPanel.active_target)
         #group = Exercises.get_group_for_muscle(self.targetSelectionPanel.active_target)
@@ -223,6 +212,10 @@ class ProgramMenu(Menu):
             self.imagePanel.add_element(self.image3)
         self.imagePanel.getElements()[0].updateSpecyficMuscleGroup( self.targetSelectionPanel.active_target ) 
 
+    def show_target_exercises(self, exerciseNames):
+        self.selectExercise.updateOptions( exerciseNames )
+        self.on_finished_excercise_selection()
+
     def on_finished_excercise_selection(self):
         self.statsPanel.queriedExercise = self.selectExercise.getSelectedOption()
         self.statsPanel.update()
@@ -9,6 +9,17 @@ from datetime import datetime
 from GUI.menus.FormYesNo import FormYesNo
 
 class SessionMenu(Menu):
+    keep_alive = True  # holds the session being entered until it's saved
+
+    @classmethod
+    def preload(cls, query):
+        programNames = query.get_all_program_names()
+        return {
+            "program_names": programNames,
+            "total_rows": len(query.get_program_exercises_names(programNames[0])),
+            "session": query.get_session_as_list(programNames[0]),
+        }
+
     def setup(self):
         """Setup panels, elements and actions"""
         screenWidth, screenHeight = pygame.display.get_surface().get_size() # Get screen size
@@ -20,7 +31,7 @@ class SessionMenu(Menu):
         self.sessionPanel = self.add_panel(Panel, x=0, y=0, width=screenWidth, height=screenHeight //8, layout_type="horizontal")
         # Create table panel
         #totalRows = len(self.database.get_exercises_in_program(self.database.get_all_program_names()[0]))
-        totalRows = len(self.manager.queryTool.get_program_exercises_names(self.manager.queryTool.get_all_program_names()[0]) )
+        totalRows = self.preloaded_or("total_rows", lambda: len(self.manager.queryTool.get_program_exercises_names(self.manager.queryTool.get_all_program_names()[0]) ))
         rowHeight = 100
         windowHeight = screenHeight - self.nav_bar.height - self.sessionPanel.height - 10
         table_y = self.nav_bar.y - windowHeight - 5
@@ -32,15 +43,14 @@ class SessionMenu(Menu):
         self.table.scroll_offset = self.table.max_offset
         
         # Add elements
-        programNames = self.manager.queryTool.get_all_program_names()
+        programNames = self.preloaded_or("program_names", self.manager.queryTool.get_all_program_names)
         self.selectProgram = SelectDropDown(options=programNames, width=screenWidth//4, height=50, manager=self.manager, layer=3)
         self.saveSessionButton = Button(text="Save Session", width=screenWidth//4, height=50, manager=self.manager, layer=1)
         self.sessionPanel.add_element(self.selectProgram)
         self.sessionPanel.add_element(self.saveSessionButton)
 
-        self.table.load_data_session(programNames[0],self.manager.queryTool.get_session_as_list(programNames[0]),manager=self.manager) # Load initial program data
-        
-        self.connectNeighbors()
+        session = self.preloaded_or("session", lambda: self.manager.queryTool.get_session_as_list(programNames[0]))
+        self.table.load_data_session(programNames[0],session,manager=self.manager) # Load initial program data
         
         # Set up actions
         self.setup_actions()
@@ -56,29 +66,11 @@ class SessionMenu(Menu):
         rowHeight = 100
         totalHeightOfTable = max(self.table.height, totalRows * rowHeight )
         self.table.changeDims(newTotalHeight=totalHeightOfTable)
-        self.connectNeighbors()
         #print(f"y={self.table.y}, height={self.table.height}, totalHeight={self.table.totalHeight}, lastRowCell y={self.table.getElements()[-1].y},last row cell height={self.table.getElements()[-1].height}")
         #when loading we are coming from top so ofsset 0
         self.table.scroll_offset = 0
         
 
-    def connectNeighbors(self):
-         # Connect neighbors within (can be done via panel or manualy)
-        self.sessionPanel.setNeighbors()
-        self.table.setNeighbors()
-
-        # Connect navigation between nav bar and table
-        for nav_btn in self.nav_bar.buttons:
-            nav_btn.set_neighbor("up", self.table.getSelectable(-1))  # last element
-        for elem in self.table.getElementsInRow(-1):
-            elem.set_neighbor("down", self.nav_bar.buttons[1])
-
-        # Connect navigation between table and sessionPanel
-        for sessionPanel in self.sessionPanel.getElements():
-            sessionPanel.set_neighbor("down", self.table.getSelectable(1))  # First slectable!!! element in table
-        for elem in self.table.getElementsInRow(0): # First non header row
-            elem.set_neighbor("up", self.selectProgram)
-
     def saveSession(self):
         bodyweight = self.manager.context["bodyweight"]
         #print(bodyweight)
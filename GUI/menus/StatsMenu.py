@@ -10,6 +10,14 @@ from GUI.style import StyleManager
 from GUI.menus.FormGetExerciseOptions import FormGetExerciseOptions
 
 class StatsMenu(Menu):
+    @classmethod
+    def preload(cls, query):
+        # The dropdown starts on "weight", plotted over the week form's initial 1 week
+        return {
+            "targets": query.get_all_targets(),
+            ("bodyweight_history", 1): query.get_bodyweight_history(1),
+        }
+
     def setup(self):
         """Setup panels, elements and actions"""
         # Plotter values
@@ -31,7 +39,7 @@ class StatsMenu(Menu):
         self.PlotterPanel = self.add_panel(Panel, x=self.screenWidth//5,y=0, width=self.screenWidth-self.screenWidth//5, height=self.screenHeight-self.nav_bar.height-self.queryTypePanel.height)
         
         # Add queryTypePanel elements
-        list_of_queries = self.manager.queryTool.get_all_targets()
+        list_of_queries = self.preloaded_or("targets", self.manager.queryTool.get_all_targets)
         list_of_queries.append("weight")
         
         self.query_btn = SelectDropDown(list_of_queries, width=200, height=25, manager=self.manager,drop_direction="up",layer=2)
@@ -63,23 +71,14 @@ class StatsMenu(Menu):
             y=0,
             width=self.PlotterPanel.width,
             height=self.PlotterPanel.height,
+            manager=self.manager,
             y_label="Amplitude",
             x_label="Date"
         )
         self.PlotterPanel.add_element(self.plotter)
         
-        # Connect navigation between nav bar and queryTypePanel
-        for nav_btn in self.nav_bar.buttons:
-            nav_btn.set_neighbor("up", self.query_btn)
-        for element in self.queryTypePanel.getElements():
-            element.set_neighbor("down", self.nav_bar.buttons[3])
         self.nav_bar.buttons[3].activate()
 
-        self.queryTypePanel.setNeighbors()
-
-        # Connect queryTypePanel and queryAxisPanel
-        # Dont do it here, since it will change based on QueryValueType, and will be set there dynamicly
-
         self.load_query_type() # This sets the data, and configures the buttons
         
         # Set up actions
@@ -106,13 +105,6 @@ class StatsMenu(Menu):
             self.Yaxis_reps_btn.selectable = False
             self.Yaxis_volume_btn.selectable = False
             self.Yaxis_weight_btn.activate()
-            # Redo neighbors
-            # Reconnect queryTypePanel and queryAxisPanel
-            for type_btn in self.queryTypePanel.getElements():
-                type_btn.set_neighbor("up", self.queryAxisPanel.getSelectableElements()[-1])
-            self.queryAxisPanel.getSelectableElements()[0].set_neighbor("down", self.queryTypePanel.getElements()[0])
-            #print(self.queryTypePanel.getElements()[0])
-
             
         elif selected_query in self.manager.queryTool.get_all_targets():
             # Form
@@ -143,14 +135,6 @@ class StatsMenu(Menu):
         # Activate Reps and Volume buttons
         self.Yaxis_reps_btn.selectable = True
         self.Yaxis_volume_btn.selectable = True
-        # Redo neighbors
-        # Reconnect queryTypePanel and queryAxisPanel
-        for type_btn in self.queryTypePanel.getElements():
-            type_btn.set_neighbor("up", self.queryAxisPanel.getSelectableElements()[-1])
-        self.queryAxisPanel.getSelectableElements()[-1].set_neighbor("down", self.queryTypePanel.getElements()[0])
-
-        self.queryTypePanel.setNeighbors()
-        self.queryAxisPanel.setNeighbors()
 
     def set_initial_focus_on_switch(self):
         # Set focus to the first nav bar button or any default element
@@ -159,17 +143,29 @@ class StatsMenu(Menu):
 
     def set_plotter_data(self):
         # Set plotter data, from the context of Menu make query to database and update x_vals and y_vals
-        if self.query == "weight":
-            self.y_vals, self.x_vals = self.manager.queryTool.get_bodyweight_history(self.week_input_form.getValue())
-            self.x_vals.reverse()
-            self.y_vals.reverse()
-            #print(f"Y values: {self.y_vals}, X values: {self.x_vals}")
+        # The query runs in the background, the plotter shows a placeholder until show_plotter_data()
+        query, axis, weeks = self.query, self.queryAxisY, self.week_input_form.getValue()
+        self.plotter.set_loading()
+        if query == "weight":
+            self.query_async("plot", lambda queryTool: queryTool.get_bodyweight_history(weeks),
+                             lambda history: self.show_plotter_data(history, None),
+                             preloaded_key=("bodyweight_history", weeks))
         else:
-            self.y_vals, self.x_vals = self.manager.queryTool.get_exercise_history(self.query, self.week_input_form.getValue())
-            self.y_vals = [entry[self.queryAxisY] for entry in self.y_vals]
-            self.x_vals.reverse()
-            self.y_vals.reverse()
-            #print(f"Y values: {self.y_vals}, X values: {self.x_vals}")
+            self.query_async("plot", lambda queryTool: queryTool.get_exercise_history(query, weeks),
+                             lambda history: self.show_plotter_data(history, axis))
+
+    def show_plotter_data(self, history, axis):
+        """
+        Parameters:
+            history (tuple): (values, dates) of the query, newest first
+            axis (str): Key of the values to plot for exercise histories, None for bodyweight
+        """
+        self.y_vals, self.x_vals = history
+        if axis is not None:
+            self.y_vals = [entry[axis] for entry in self.y_vals]
+        self.x_vals.reverse()
+        self.y_vals.reverse()
+        #print(f"Y values: {self.y_vals}, X values: {self.x_vals}")
         self.plotter.update_data(x_values=self.x_vals, y_values=self.y_vals)
 
     def weight_btn_press(self):
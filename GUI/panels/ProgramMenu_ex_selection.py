@@ -33,12 +33,10 @@ class TargetSelectionPanel(Table):
             self.add_element(btn, row, col)
             btn.on_press = self.on_button_press
 
-        self.setNeighbors()
         self.enforceElementsSize()
         # if last cell is empty forcfully shift [-1] to middle
         if len(target_muscles) % cols != 0:
             self.getElements()[-1].x = self.x + self.width//2 - self.getElements()[-1].width//2
-            self.getElements()[-2].set_neighbor("down", self.getElements()[-1])
 
     def on_button_press(self):
         #print(f"target selected: {self.manager.focus_manager.current_focus.text}")
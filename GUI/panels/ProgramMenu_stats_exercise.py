@@ -4,7 +4,11 @@ from GUI.elements.ValueDisplay import ValueDisplay
 from GUI.style import StyleManager
 
 class ExerciseStatsPanel(Table):
-    def __init__(self, x, y, width, height, queriedExercise, manager):
+    def __init__(self, x, y, width, height, queriedExercise, manager, stats=None):
+        """
+        Parameters:
+            stats (dict): query_stats() of queriedExercise if already queried (see ProgramMenu.preload)
+        """
         self.queriedExercise = queriedExercise
         cols = 2
         rows = 2
@@ -13,12 +17,14 @@ class ExerciseStatsPanel(Table):
 
         # Create ValueDisplay elements for stats
         # Retrive stats from database
-        lastPerformance = self.manager.queryTool.get_last_performance(self.queriedExercise)
-        peakPerformance = self.manager.queryTool.get_peak_performance(self.queriedExercise)
-        totalSets = self.manager.queryTool.get_total_sets_performed(self.queriedExercise)
-        volumeChange = self.manager.queryTool.get_volume_change(self.queriedExercise)
+        if stats is None:
+            stats = self.query_stats(self.manager.queryTool, self.queriedExercise)
+        lastPerformance = stats["last_performance"]
+        peakPerformance = stats["peak_performance"]
+        totalSets = stats["total_sets"]
+        volumeChange = stats["volume_change"]
 
-        prompt_color =  StyleManager.get_muscle_group_color( self.manager.queryTool.get_exercise_by_name( self.queriedExercise ).target )["bg_color"] 
+        prompt_color =  StyleManager.get_muscle_group_color( stats["target"] )["bg_color"] 
         self.lastPerformanceDisplay = ValueDisplay(prompt="Last Performance", value=f"date: {lastPerformance["date"]}\nsets: {lastPerformance["sets"]}\nreps: {lastPerformance["reps"]}\nweight: {lastPerformance["weight"]}",width=width//cols,height=height//rows, manager=self.manager, bg_color_prompt=prompt_color)
         self.add_element(self.lastPerformanceDisplay,0,0)
         self.peakPerformanceDisplay = ValueDisplay(prompt="Peak Performance", value=f"date: {peakPerformance["date"]}\nreps: {peakPerformance["reps"]}\nweight: {peakPerformance["weight"]}",width=width//cols,height=height//rows, manager=self.manager, bg_color_prompt=prompt_color)
@@ -27,13 +33,15 @@ class ExerciseStatsPanel(Table):
         self.add_element(self.totalSetsDisplay,0,1)
         volumeChangeString = ""
         arrowFlag = ""
-        if volumeChange < 0:
+        if volumeChange is None:
+            volumeChangeString = "No data available"
+        elif volumeChange < 0:
             volumeChangeString = f"{volumeChange}% decrease\nin last month"
             arrowFlag = "down"
         else:
             volumeChangeString = f"{volumeChange}% increase\nin last month"
             arrowFlag = "up"
-        self.volumeChangeDisplay = ValueDisplay(prompt="Volume Change", value=volumeChangeString,width=width//cols,height=height//rows,arrow_indicator=arrowFlag, manager=self.manager, bg_color_prompt=prompt_color)
+        self.volumeChangeDisplay =ValueDisplay(prompt="Volume Change", value=volumeChangeString,width=width//cols,height=height//rows,arrow_indicator=arrowFlag, manager=self.manager, bg_color_prompt=prompt_color)
         self.add_element(self.volumeChangeDisplay,1,1)
 
         # # Fill the grid with muscle buttons
@@ -50,17 +58,38 @@ class ExerciseStatsPanel(Table):
         #     self.add_element(btn, row, col)
         #     btn.on_press = self.on_button_press
 
-        self.setNeighbors()
         self.enforceElementsSize()
 
+    @staticmethod
+    def query_stats(query, exercise):
+        """All database values the panel shows for an exercise"""
+        return {
+            "last_performance": query.get_last_performance(exercise),
+            "peak_performance": query.get_peak_performance(exercise),
+            "total_sets": query.get_total_sets_performed(exercise),
+            "volume_change": query.get_volume_change(exercise),
+            "target": query.get_exercise_by_name(exercise).target,
+        }
+
     def update(self):
-        lastPerformance = self.manager.queryTool.get_last_performance(self.queriedExercise)
-        peakPerformance = self.manager.queryTool.get_peak_performance(self.queriedExercise)
-        totalSets = self.manager.queryTool.get_total_sets_performed(self.queriedExercise)
-        volumeChange = self.manager.queryTool.get_volume_change(self.queriedExercise)
+        # Queried in the background, placeholders until show_stats()
+        exercise = self.queriedExercise
+        self.show_loading()
+        self.manager.query_executor.submit((self, "stats"), lambda query: self.query_stats(query, exercise), self.show_stats)
+
+    def show_loading(self):
+        for element in self.getElements():
+            element.value = "Loading..."
+        self.volumeChangeDisplay.arrow_indicator = ""
+
+    def show_stats(self, stats):
+        lastPerformance = stats["last_performance"]
+        peakPerformance = stats["peak_performance"]
+        totalSets = stats["total_sets"]
+        volumeChange = stats["volume_change"]
 
         #print(self.queriedExercise)
-        prompt_color =  StyleManager.get_muscle_group_color( self.manager.queryTool.get_exercise_by_name( self.queriedExercise ).target )["bg_color"]
+        prompt_color =  StyleManager.get_muscle_group_color( stats["target"] )["bg_color"]
         for element in self.getElements():
             element.bg_color_prompt = prompt_color
         if lastPerformance is not None:
@@ -32,11 +32,6 @@ class NavigationBar(Panel):
         # Add clock to panel
         self.add_element(self.clock)
         
-        # Setup neighbors
-        for i in range(len(self.buttons)-1):
-            self.buttons[i].set_neighbor("right", self.buttons[i+1])
-            self.buttons[i+1].set_neighbor("left", self.buttons[i])
-        
         # Setup actions
         self.buttons[0].on_press = lambda: manager.switch_to("MainMenu")
         self.buttons[1].on_press = lambda: manager.switch_to("SessionMenu")
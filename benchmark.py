@@ -0,0 +1,209 @@
+import io
+import json
+import random
+import shutil
+import argparse
+import tempfile
+import contextlib
+import multiprocessing
+
+from GUI.InputScript import InputScript
+from GUI.InputRecorder import InputReplay
+from GUI.FrameTimings import percentile
+from workout_db_r.Database import Database
+from workout_db_r.Synthetic import generate_database
+
+# Frames between two scripted key presses (about 6 presses per second at 30 fps)
+KEY_GAP = 5
+# Boot: start loading the exercise module, enter it once loading is done (MainMenu from frame 301)
+BOOT = [(1, "return"), (300, "return")]
+BOOT_FRAMES = 301
+
+
+def _keys(start, keys, gap=KEY_GAP):
+    """Steps for keys pressed one after another from frame start"""
+    return [(start + i * gap, key) for i, key in enumerate(keys)]
+
+
+def _scenario(keys, menus, gap=KEY_GAP, tail=30, measure_from=BOOT_FRAMES, sessions_added=0):
+    """
+    Scenario that boots into MainMenu and then presses keys, measured after the boot.
+    menus are the menus it must visit (in order of their first visit) and sessions_added
+    the sessions it must save, run_scenario fails if the keys end up elsewhere.
+    """
+    steps = BOOT + _keys(BOOT_FRAMES + 4, keys, gap)
+    return {"script": InputScript(steps), "frames": steps[-1][0] + tail, "measure_from": measure_from,
+            "menus": menus, "sessions_added": sessions_added}
+
+
+def scenario_boot():
+    """MockLoadingMenu loads the exercise module, then MainMenu"""
+    return {"script": InputScript(BOOT), "frames": BOOT_FRAMES + 60, "measure_from": 0,
+            "menus": ["MockLoadingMenu", "MainMenu"], "sessions_added": 0}
+
+
+def scenario_session():
+    """
+    Log a 6-exercise session in SessionMenu (3 sets each, edited reps and weight) and save it.
+    Made for the synthetic database (every program has 6 exercises with 3 sets).
+    """
+    edit = ["return", "right", "return", "right", "return"]  # reps +1, weight +1 step
+    keys = ["right", "return", "up"]  # Session menu, up from the nav bar lands on the first set of the last row
+    for row in range(6):
+        # Snake through the 3 sets of every row, bottom row first (up keeps the column)
+        step = "right" if row % 2 == 0 else "left"
+        keys += edit + [step] + edit + [step] + edit + ["up"]
+    # Up from the first row lands on the program dropdown, Save Session is right of it, Yes has the focus
+    keys += ["right", "return", "return"]
+    return _scenario(keys, ["MockLoadingMenu", "MainMenu", "SessionMenu", "FormYesNo"], sessions_added=1)
+
+
+def scenario_program():
+    """Browse every target muscle in ProgramMenu's exercise mode"""
+    keys = ["right", "right", "return", "up", "right", "return"]  # Program menu, Excercises mode
+    # Targets are a 2 column grid, snake up from the last one
+    for step in ["up", "up", "right", "up", "left", "up", "right", "up", "left", "up", "right"]:
+        keys += [step, "return"]
+    return _scenario(keys, ["MockLoadingMenu", "MainMenu", "ProgramMenu"], gap=10)
+
+
+def scenario_stats():
+    """Cycle StatsMenu through every target query (first exercise of each) and back to bodyweight"""
+    keys = ["right", "right", "right", "return"]
+    # Dropdown starts at "weight" (last option), go up through the targets
+    # (up from the nav bar lands on the weeks button, the dropdown is left of it)
+    for _ in range(11):
+        keys += ["up", "left", "return", "up", "return", "return", "return"]
+    keys += ["up", "left", "return"] + ["down"] * 11 + ["return"]
+    return _scenario(keys, ["MockLoadingMenu", "MainMenu", "StatsMenu", "FormGetExerciseOptions"], gap=8)
+
+
+SCENARIOS = {
+    "boot": scenario_boot,
+    "session": scenario_session,
+    "program": scenario_program,
+    "stats": scenario_stats,
+}
+
+
+def peak_memory_mb():
+    """Peak resident memory of this process in MB (None where the resource module is missing)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_scenario(name, data_dir, script=None, frames=None, measure_from=0, seed=0):
+    """
+    Run one scenario headless on a copy of the database (scenarios may save sessions).
+    Meant to run in its own process, so the peak memory belongs to this scenario only.
+    A canned scenario raises RuntimeError if it didn't visit its menus or save its sessions,
+    the timings of a script that went astray would measure something else.
+
+    Returns:
+        dict with frame time percentiles (ms), peak memory (MB) and the visited menus
+    """
+    import main  # imported here so the parent process never initialises pygame
+
+    expected = None
+    if script is None:
+        expected = SCENARIOS[name]()
+        script, frames, measure_from = expected["script"], expected["frames"], expected["measure_from"]
+
+    work_dir = tempfile.mkdtemp(prefix="bench_db_")
+    try:
+        shutil.copytree(data_dir, work_dir, dirs_exist_ok=True)
+        sessions_before = len(Database(work_dir).get_all_sessions())
+        random.seed(seed)  # loading delays and console text
+        with contextlib.redirect_stdout(io.StringIO()):
+            timings = main.main(headless=True, frames=frames, input_script=script, data_dir=work_dir)
+        sessions_added = len(Database(work_dir).get_all_sessions()) - sessions_before
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    measured = [f for f in timings.frames if f["frame"] >= measure_from]
+    totals = sorted(f["total"] for f in measured)
+    menus = []
+    for f in timings.frames:
+        if not menus or menus[-1] != f["menu"]:
+            menus.append(f["menu"])
+    if expected is not None:
+        visited = list(dict.fromkeys(menus))
+        if visited != expected["menus"]:
+            raise RuntimeError(f"Scenario {name} visited {' > '.join(visited)}, "
+                               f"expected {' > '.join(expected['menus'])}")
+        if sessions_added != expected["sessions_added"]:
+            raise RuntimeError(f"Scenario {name} saved {sessions_added} sessions, "
+                               f"expected {expected['sessions_added']}")
+    return {
+        "scenario": name,
+        "frames": len(totals),
+        "mean": sum(totals) / len(totals),
+        "p50": percentile(totals, 50),
+        "p99": percentile(totals, 99),
+        "max": totals[-1],
+        "peak_rss_mb": peak_memory_mb(),
+        "menus": menus,
+    }
+
+
+def build_database(years, data_dir=None, seed=0):
+    """Generate the synthetic database, returns its folder"""
+    data_dir = data_dir or tempfile.mkdtemp(prefix=f"bench_{years}y_")
+    db = Database(data_dir)
+    generate_database(db, years=years, seed=seed)
+    return data_dir
+
+
+def format_results(results):
+    lines = [f"{'scenario':<10}{'frames':>7}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}{'peak MB':>9}  menus"]
+    for r in results:
+        memory = f"{r['peak_rss_mb']:9.1f}" if r["peak_rss_mb"] is not None else f"{'-':>9}"
+        lines.append(f"{r['scenario']:<10}{r['frames']:>7}{r['p50']:9.2f}{r['p99']:9.2f}{r['max']:9.2f}"
+                     f"{memory}  {' > '.join(dict.fromkeys(r['menus']))}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless benchmark scenarios on a synthetic database")
+    parser.add_argument("scenarios", nargs="*", default=list(SCENARIOS),
+                        help=f"Scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--years", type=int, default=5,
+                        help="Years of synthetic history (default 5, measured sizes are 1, 5 and 20)")
+    parser.add_argument("--data", default=None,
+                        help="Use this database folder instead of generating one")
+    parser.add_argument("--recording", default=None,
+                        help="Also run a .json recording made with main.py --record as a scenario")
+    parser.add_argument("--json", default=None, help="Write the results to this .json file")
+    args = parser.parse_args()
+
+    data_dir = args.data or build_database(args.years)
+    sessions = len(Database(data_dir).get_all_sessions())
+    print(f"Database: {data_dir} ({sessions} sessions)")
+
+    jobs = [(name, data_dir) for name in args.scenarios]
+    if args.recording is not None:
+        replay = InputReplay.load(args.recording)
+        # Replayed by animation time, headless frames advance it by 1/30 s
+        frames = max(replay.length, int(replay.duration * 30)) + 60
+        jobs.append(("recording", data_dir, replay, frames, 0))
+
+    # A fresh process per scenario: clean pygame/GL state and a peak memory of its own
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for job in jobs:
+        with context.Pool(1) as pool:
+            results.append(pool.apply(run_scenario, job))
+        print(format_results(results[-1:]).splitlines()[-1])
+
+    print()
+    print(format_results(results))
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump({"years": args.years, "sessions": sessions, "results": results}, f, indent=2)
+        print(f"Results written to {args.json}")
+    if args.data is None:
+        shutil.rmtree(data_dir, ignore_errors=True)
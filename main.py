@@ -1,5 +1,6 @@
+import os
+import argparse
 import pygame
-import numpy as np
 import moderngl
 from pygame.locals import DOUBLEBUF, OPENGL
 
@@ -8,28 +9,84 @@ from GUI.style import StyleManager
 from GUI.menus.MockLoadingMenu import MockLoadingMenu
 from GUI.Notifications import Notification
 from GUI.ScrollingTableVertical import ScrollingTableVertical
+from GUI.FrameScheduler import FrameScheduler
+from GUI.FrameClock import FrameClock
+from GUI.FrameTimings import FrameTimings
+from GUI.InputScript import InputScript
+from GUI.InputRecorder import InputRecorder, InputReplay
+from GUI.ProfilerOverlay import ProfilerOverlay
+from GUI.Distortions.PostProcess import PostProcessPipeline, FusedPostProcess, create_standalone_context
 
 from workout_db_r.Database import Database
 from workout_db_r.Query import Query
 
-def main():
+# Run all post-processing in one generated shader pass instead of four
+FUSED_POST_PROCESSING = False
+# Share of the frame budget the post-processing passes may take on the GPU before
+# the pipeline drops to a cheaper quality tier
+POST_PROCESS_BUDGET = 0.5
+
+def main(headless=False, frames=None, input_script=None, timings_path=None, trace_path=None,
+         record_path=None, data_dir=None):
+    """
+    Run the app.
+
+    Parameters:
+        headless (bool): No window, SDL dummy video driver and a standalone moderngl context.
+            Frames are rendered back to back with a fixed frame delta (no event waiting)
+        frames (int): Stop after this many frames (None runs until the window is closed)
+        input_script (InputScript|InputReplay): Scripted or recorded key presses to inject
+        timings_path (str): Write per-frame timings (render2d, upload, gpu, flip...) to .csv/.json
+        trace_path (str): Write a Chrome trace (sections and element renders of every frame) to .json
+        record_path (str): Record the key events reaching the menus to this .json file (see --input)
+        data_dir (str): Database folder to use instead of workout_db_r/data
+
+    Returns:
+        FrameTimings of the run (only filled in headless or recording runs)
+    """
     # Init database and query tool passed to manager
-    db = Database() 
+    db = Database(data_dir)
     query = Query(db)
 
+    if headless:
+        # Must be set before pygame.init()
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
 
     # Initialize pygame with OpenGL support
     pygame.init()
     screen_size = (800, 480)
-    pygame.display.set_mode(screen_size, DOUBLEBUF | OPENGL)
+    if headless:
+        pygame.display.set_mode(screen_size)
+    else:
+        pygame.display.set_mode(screen_size, DOUBLEBUF | OPENGL)
     pygame.display.set_caption("Modular Activity Tracker")
-    clock = pygame.time.Clock()
+    # Full frame rate only while something animates, otherwise sleep until input arrives
+    scheduler = FrameScheduler(active_fps=30, idle_timeout=1.0, animate_effects=False)
+    # Fixed-timestep animation time shared by menus and elements
+    frame_clock = FrameClock(step=1/60, max_steps=5)
+
+    # Per-frame stage timings (always on in headless mode, otherwise while the F3 overlay is shown)
+    # Headless runs end after a set number of frames, so they keep all of them
+    recording = timings_path is not None or trace_path is not None
+    timings = FrameTimings(
+        enabled=headless or recording,
+        max_frames=None if headless or recording else 600,
+        trace=trace_path is not None
+    )
+    overlay = ProfilerOverlay(timings)
 
     # === Setup moderngl context and shaders ===
-    ctx = moderngl.create_context()
-
-    # Create offscreen GUI surface
-    gui_surface = pygame.Surface(screen_size)
+    if headless:
+        ctx = create_standalone_context()
+        # Final image goes into an offscreen framebuffer instead of the window
+        output = ctx.framebuffer(color_attachments=[ctx.texture(screen_size, 3)])
+    else:
+        ctx = moderngl.create_context()
+        output = ctx.screen
+
+    # Create offscreen GUI surface (with alpha so a GPU scrolled table can leave a hole for its content)
+    gui_surface = pygame.Surface(screen_size, pygame.SRCALPHA)
     # Seperate framebuffer for 3D elements
     tex_3d = ctx.texture(screen_size, components=4)  # RGBA
     tex_3d.repeat_x = False
@@ -37,66 +94,34 @@ def main():
     depth_3d = ctx.depth_renderbuffer(screen_size)
     fbo_3d = ctx.framebuffer(color_attachments=[tex_3d], depth_attachment=depth_3d)
 
-    # Load shaders from files
-    with open("GUI/Distortions/distortion.vert") as f:
-        vertex_shader = f.read()
-    with open("GUI/Distortions/lighting.frag") as f:
-        lighting_frag = f.read()
-    with open("GUI/Distortions/distortion.frag") as f:
-        distortion_frag = f.read()
-    with open("GUI/Distortions/barrel.frag") as f:
-        barrel_frag = f.read()
-
-    # Create shader programs for each pass
-    
-    prog_lighting   = ctx.program(vertex_shader=vertex_shader, fragment_shader=lighting_frag)
-    prog_distortion = ctx.program(vertex_shader=vertex_shader, fragment_shader=distortion_frag)
-    prog_barrel     = ctx.program(vertex_shader=vertex_shader, fragment_shader=barrel_frag)
-    
-    # Initialize some default uniform values
-    prog_distortion['time'] = 0.0
-    prog_distortion['intensity'] = 0.2
-    prog_lighting['time'] = 0.0
-
-    # Fullscreen quad
-    vertices = np.array([
-        -1.0,  1.0, 0.0, 1.0,
-        -1.0, -1.0, 0.0, 0.0,
-         1.0,  1.0, 1.0, 1.0,
-         1.0, -1.0, 1.0, 0.0
-    ], dtype='f4')
-    vbo = ctx.buffer(vertices.tobytes())
-
-    vao_lighting   = ctx.simple_vertex_array(prog_lighting,   vbo, 'in_vert', 'in_uv')
-    vao_distortion = ctx.simple_vertex_array(prog_distortion, vbo, 'in_vert', 'in_uv')
-    vao_barrel     = ctx.simple_vertex_array(prog_barrel,     vbo, 'in_vert', 'in_uv')
-
     # Texture for GUI input
-    texture_gui = ctx.texture(screen_size, 3)
+    texture_gui = ctx.texture(screen_size, 4)
     texture_gui.repeat_x = False
     texture_gui.repeat_y = False
 
-    # Composite pass (combining 3d framebuffer with pygame screen in gpu)
-    with open("GUI\\ThreeDee\\shaders\\composite.vert") as f:
-        composite_vert = f.read()
-    with open("GUI\\ThreeDee\\shaders\\composite.frag") as f:
-        composite_frag = f.read()
-    prog_composite = ctx.program(vertex_shader=composite_vert, fragment_shader=composite_frag)
-    vao_composite = ctx.simple_vertex_array(prog_composite, vbo, 'in_vert', 'in_uv')
-
-    # Create intermediate framebuffers for passes
-    tex_pass1 = ctx.texture(screen_size, 3)
-    tex_pass2 = ctx.texture(screen_size, 3)
-    tex_pass3 = ctx.texture(screen_size, 3)
-    fbo_pass1 = ctx.framebuffer(color_attachments=[tex_pass1])
-    fbo_pass2 = ctx.framebuffer(color_attachments=[tex_pass2])
-    fbo_pass3 = ctx.framebuffer(color_attachments=[tex_pass3])
+    # Post-processing: composite (GUI + 3D) -> distortion -> lighting -> barrel
+    # The fused path runs all of it in one generated shader, without intermediate framebuffers
+    if FUSED_POST_PROCESSING:
+        post_process = FusedPostProcess(ctx, screen_size)
+    else:
+        # Headless runs keep one tier so timings stay comparable between runs
+        post_process = PostProcessPipeline(
+            ctx, screen_size, tier="high",
+            budget_ms=scheduler.frame_budget * 1000 * POST_PROCESS_BUDGET,
+            auto_tier=not headless
+        )
+    post_uniforms = {'time': 0.0, 'intensity': 0.2, 'scroll_bg': tuple(c / 255 for c in StyleManager.DARK.bg_color)}
 
     # Setup notification system
     notification = Notification(font_size=24, display_time=2.5)
 
     # Create menu manager
-    manager = MenuManager(gui_surface,query,notification,ctx,fbo_3d,tex_3d)
+    # Lazily built menus are dropped (least recently used first) past 32 MB of surfaces
+    manager = MenuManager(gui_surface,query,notification,ctx,fbo_3d,tex_3d,frame_clock,timings,menu_memory_budget=32 * 1024 * 1024)
+    recorder = None
+    if record_path is not None:
+        recorder = InputRecorder(manager)
+        recorder.attach()
 
     # Instantiate all menus (Rest will be done in Moule Loading Menu)
     loading_menu = MockLoadingMenu(gui_surface,manager)
@@ -109,16 +134,29 @@ def main():
     manager.switch_to("LoadingMenu")
     # Main game loop
     running = True
+    frame = 0
     while running:
-
-        current_time = pygame.time.get_ticks() / 1000.0
-        last_time = current_time
-        delta_time = current_time - last_time
-        
-        # Handle events
-        for event in pygame.event.get():
+        # Handle events (blocks while nothing on screen is animating)
+        if headless:
+            events = pygame.event.get()
+        else:
+            # Frames keep coming while queries run, their results are delivered by the frame loop
+            animating = scheduler.is_animating(manager.current_menu, notification) or overlay.is_animating() or manager.query_executor.busy()
+            wake_at = manager.current_menu.next_redraw_time() if hasattr(manager.current_menu, "next_redraw_time") else None
+            events = scheduler.wait_events(animating, wake_at)
+            if not animating:
+                # Animations started by this input begin now, not when the wait began
+                frame_clock.skip_wait()
+        if input_script is not None:
+            events += input_script.events_for(frame, frame_clock.time)
+        # Frame work starts here, time spent waiting for events isn't counted
+        timings.begin_frame(type(manager.current_menu).__name__)
+
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            if overlay.handle_event(event):
+                continue
             
             # Handle menu navigation keys globally
             if event.type == pygame.KEYDOWN:
@@ -127,60 +165,57 @@ def main():
                     pass
             
             # Pass all events to menu manager
-            manager.handle_event(event)
-
-        # Id menu has update() perform it
-        if hasattr(manager.current_menu,"update"):
-            manager.current_menu.update(delta_time)
+            with timings.section("handle_event"):
+                manager.handle_event(event)
+
+        # Advance animation time (runs fixed-step subscribers), then per-frame menu update
+        with timings.section("update"):
+            # Headless runs use a fixed delta so results don't depend on how fast frames render
+            frame_clock.tick(scheduler.frame_budget if headless else None)
+            current_time = frame_clock.time
+            # Results of queries that finished since the last frame go to their menus
+            manager.query_executor.drain()
+            if hasattr(manager.current_menu,"update"):
+                manager.current_menu.update(frame_clock.delta_time)
+            # Quiet frames build the menu the user likely opens next
+            manager.idle_frame(len(events) > 0)
 
         # === Draw GUI to offscreen surface ===
-        gui_surface.fill(StyleManager.DARK.bg_color)
-        if manager.current_menu:
-            manager.current_menu.render2d(gui_surface)
-        notification.render(gui_surface)
+        with timings.section("render2d"):
+            gui_surface.fill(StyleManager.DARK.bg_color)
+            if manager.current_menu:
+                manager.current_menu.render2d(gui_surface)
+            notification.render(gui_surface)
+        with timings.section("overlay"):
+            overlay.render(gui_surface)
 
         # === Convert surface to texture ===
-        gui_rgb = pygame.surfarray.pixels3d(gui_surface).copy().swapaxes(0, 1)
-        texture_gui.write(gui_rgb.tobytes())
-
-        # === Render 3D into fbo_3d ===
-        if manager.current_menu:
-            manager.current_menu.render3d()
-
-        # === Composite GUI and 3D into first post-process texture ===
-        fbo_pass1.use()
-        ctx.viewport = (0, 0, screen_size[0], screen_size[1])
-        ctx.clear()
-        texture_gui.use(0)
-        tex_3d.use(1)
-        prog_composite['tex_gui'] = 0
-        prog_composite['tex_3d'] = 1
-        display3d_elem = manager.current_menu.get_display3d_element()
-        if display3d_elem is not None:
-            prog_composite['elem_pos'].value = (
+        # Flipped upload (bottom row first) matches GL texture space, no shader pass needed to flip it
+        with timings.section("upload"):
+            texture_gui.write(pygame.image.tobytes(gui_surface, "RGBA", True))
+
+        # === Render 3D into fbo_3d (only menus with a Display3D, looked up once per menu) ===
+        has_3d = manager.current_menu is not None and manager.current_menu.has_3d_content()
+        if has_3d:
+            with timings.section("render3d"):
+                manager.current_menu.render3d()
+
+        # === Post-processing uniforms ===
+        post_uniforms['time'] = current_time
+        # A scrolling table drawn on the GPU, scrolling only moves a uv offset
+        scroll_layer = manager.current_menu.get_scroll_layer() if manager.current_menu else None
+        if scroll_layer is not None:
+            post_uniforms.update(scroll_layer.scroll_uniforms())
+        if has_3d:
+            display3d_elem = manager.current_menu.get_display3d_element()
+            post_uniforms['elem_pos'] = (
                 display3d_elem.x / screen_size[0],
                 display3d_elem.y / screen_size[1]
             )
-            prog_composite['elem_size'].value = (
+            post_uniforms['elem_size'] = (
                 display3d_elem.width / screen_size[0],
                 display3d_elem.height / screen_size[1]
             )
-        vao_composite.render(moderngl.TRIANGLE_STRIP)
-
-        
-
-        # === Pass 1: Distortions ===
-        fbo_pass2.use()
-        ctx.clear()
-        tex_pass1.use(0)
-        prog_distortion['time'].value = current_time
-        vao_distortion.render(moderngl.TRIANGLE_STRIP)
-
-        # === Pass 2: Lighting (now after distortion) ===
-        fbo_pass3.use()
-        ctx.clear()
-        tex_pass2.use(0)
-        prog_lighting['time'].value = current_time
 
         if manager.focus_manager.current_focus:                
             fx, fy = manager.focus_manager.current_focus.x, manager.focus_manager.current_focus.y
@@ -188,36 +223,91 @@ def main():
             if isinstance(manager.focus_manager.current_focus.parent_panel, ScrollingTableVertical):
                 fy = fy - manager.focus_manager.current_focus.parent_panel.scroll_offset
             fw, fh = manager.focus_manager.current_focus.width, manager.focus_manager.current_focus.height
-            prog_lighting['focus_pos'].value = (fx / screen_size[0], fy / screen_size[1])
-            prog_lighting['focus_size'].value = (fw / screen_size[0], fh / screen_size[1])
+            post_uniforms['focus_pos'] = (fx / screen_size[0], fy / screen_size[1])
+            post_uniforms['focus_size'] = (fw / screen_size[0], fh / screen_size[1])
 
             # NEW: parent panel bounds
             px = manager.focus_manager.current_focus.parent_panel.x
             py = manager.focus_manager.current_focus.parent_panel.y
             pw = manager.focus_manager.current_focus.parent_panel.width
             ph = manager.focus_manager.current_focus.parent_panel.height
-            prog_lighting['clip_pos'].value  = (px / screen_size[0], py / screen_size[1])
-            prog_lighting['clip_size'].value = (pw / screen_size[0], ph / screen_size[1])
+            post_uniforms['clip_pos']  = (px / screen_size[0], py / screen_size[1])
+            post_uniforms['clip_size'] = (pw / screen_size[0], ph / screen_size[1])
         else:
-            prog_lighting['focus_size'].value = (0.0, 0.0)
-            prog_lighting['clip_size'].value  = (0.0, 0.0)
-
-        vao_lighting.render(moderngl.TRIANGLE_STRIP)
-
-        bg = StyleManager.DARK.bg_color
-        bg_normalized = (bg[0]/255.0, bg[1]/255.0, bg[2]/255.0)
-
-        # === Pass 3: CRT barrel distortion ===
-        ctx.screen.use()
-        ctx.clear()
-        tex_pass3.use(0)
-        vao_barrel.render(moderngl.TRIANGLE_STRIP)
+            post_uniforms['focus_size'] = (0.0, 0.0)
+            post_uniforms['clip_size']  = (0.0, 0.0)
+
+        # === Composite, distortion, lighting and CRT barrel into the window ===
+        # Without 3D content the composite pass is skipped and tex_3d is never touched
+        with timings.section("gpu"):
+            post_process.render(output, texture_gui, tex_3d if has_3d else None, post_uniforms,
+                                scroll_layer.content_texture if scroll_layer is not None else None)
+            if timings.enabled:
+                ctx.finish()  # wait for the GPU so the section holds the real pass time
+        # Per-pass GPU times from timer queries (these belong to the previous frame)
+        for name, ms in getattr(post_process, "last_timings", {}).items():
+            timings.add(f"gpu_{name}", ms)
 
         # === Swap buffers ===
-        pygame.display.flip()
-        clock.tick(12)
-
+        with timings.section("flip"):
+            pygame.display.flip()
+        if not headless:
+            scheduler.end_frame()
+        timings.end_frame()
+
+        frame += 1
+        if frames is not None and frame >= frames:
+            running = False
+
+    manager.query_executor.shutdown()
+    if recording and not headless:
+        print(scheduler.format_report())
+    if (headless or recording) and hasattr(post_process, "format_report"):
+        print(post_process.format_report())
+    if headless or recording:
+        print(timings.format_summary())
+    if timings_path is not None:
+        timings.dump(timings_path)
+        print(f"Frame timings written to {timings_path}")
+    if trace_path is not None:
+        timings.export_trace(trace_path)
+        print(f"Trace written to {trace_path}")
+    if recorder is not None:
+        recorder.save(record_path)
+        print(f"Input recorded to {record_path} ({len(recorder.events)} events)")
     pygame.quit()
+    return timings
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Modular Activity Tracker")
+    parser.add_argument("--headless", action="store_true",
+                        help="Render offscreen without a window (SDL dummy driver, standalone GL context)")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="Number of frames to run (default: until closed, 600 when headless)")
+    parser.add_argument("--input", default=None,
+                        help="Scripted input: a file or inline steps like \"1:return,240:right\", "
+                             "or a .json recording made with --record")
+    parser.add_argument("--timings", default=None,
+                        help="Write per-frame timings to this .csv or .json file")
+    parser.add_argument("--trace", default=None,
+                        help="Write a Chrome trace (chrome://tracing, Perfetto) to this .json file")
+    parser.add_argument("--record", default=None,
+                        help="Record key input to this .json file, replay it with --input")
+    parser.add_argument("--replay-by", choices=("time", "frame"), default="time",
+                        help="Match recorded events by animation time (default) or by frame number")
+    parser.add_argument("--data", default=None,
+                        help="Database folder (default: workout_db_r/data)")
+    args = parser.parse_args()
+
+    script = None
+    if args.input is not None and args.input.endswith(".json"):
+        script = InputReplay.load(args.input, by=args.replay_by)
+    elif args.input is not None:
+        script = InputScript.load(args.input) if os.path.isfile(args.input) else InputScript.parse(args.input)
+    frames = args.frames
+    if frames is None and args.headless:
+        frames = 600
+
+    main(headless=args.headless, frames=frames, input_script=script,
+         timings_path=args.timings, trace_path=args.trace,
+         record_path=args.record, data_dir=args.data)
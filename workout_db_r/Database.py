@@ -1,6 +1,7 @@
 import pickle
 import os
 import json
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
@@ -9,16 +10,28 @@ from workout_db_r.Program import Program
 from workout_db_r.Session import Session
 
 class Database:
-    """Handles storage and retrieval of fitness data using pickle"""
+    """
+    Handles storage and retrieval of fitness data using pickle.
+
+    Queries run on worker threads (GUI/QueryExecutor.py) while the main thread adds data,
+    so changes are copy-on-write: add_*/delete_* build a new dict (and session list) and
+    swap it in, never change one in place. A reader iterating exercises, programs or
+    sessions keeps the snapshot it started with, it can't see a dict change size under it.
+    """
     
-    def __init__(self):
-        self.data_dir = Path(__file__).parent / "data"
-        self.data_dir.mkdir(exist_ok=True)  # Create data directory if it doesn't exist
+    def __init__(self, data_dir=None):
+        """
+        Parameters:
+        - data_dir (str|Path): Folder with the pickle files (default: workout_db_r/data)
+        """
+        self.data_dir = Path(data_dir) if data_dir is not None else Path(__file__).parent / "data"
+        self.data_dir.mkdir(parents=True, exist_ok=True)  # Create data directory if it doesn't exist
         
         # Initialize empty databases
         self.exercises: Dict[str, Exercise] = {}
         self.programs: Dict[str, Program] = {}
         self.sessions: Dict[str, List[Session]] = {}  # Key: date, Value: list of sessions
+        self._batching = False  # True inside batch(), files are written once at the end
         
         # Load existing data
         self.load_all()
@@ -35,8 +48,25 @@ class Database:
         self.programs = self._load_from_file("programs.pickle", {})
         self.sessions = self._load_from_file("sessions.pickle", {})
     
+    @contextmanager
+    def batch(self):
+        """
+        Group many changes into one save. Inside the with-block add_*/delete_* only change
+        the data in memory, all pickle files are written once when the block ends.
+        (Every add_session() rewrites the whole sessions file otherwise)
+        Nothing is written if the block raises.
+        """
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+        self.save_all()
+
     def _save_to_file(self, filename: str, data):
         """Save data to a pickle file"""
+        if self._batching:
+            return
         with open(self.data_dir / filename, 'wb') as f:
             pickle.dump(data, f)
     
@@ -51,7 +81,7 @@ class Database:
     # Exercise operations
     def add_exercise(self, exercise: Exercise):
         """Add or update an exercise"""
-        self.exercises[exercise.name] = exercise
+        self.exercises = {**self.exercises, exercise.name: exercise}
         self._save_to_file("exercises.pickle", self.exercises)
     
     def get_exercise(self, name: str) -> Exercise:
@@ -61,13 +91,15 @@ class Database:
     def delete_exercise(self, name: str):
         """Delete an exercise by name"""
         if name in self.exercises:
-            del self.exercises[name]
+            exercises = dict(self.exercises)
+            del exercises[name]
+            self.exercises = exercises
             self._save_to_file("exercises.pickle", self.exercises)
     
     # Program operations
     def add_program(self, program: Program):
         """Add or update a program"""
-        self.programs[program.name] = program
+        self.programs = {**self.programs, program.name: program}
         self._save_to_file("programs.pickle", self.programs)
     
     def get_program(self, name: str) -> Program:
@@ -77,15 +109,15 @@ class Database:
     def delete_program(self, name: str):
         """Delete a program by name"""
         if name in self.programs:
-            del self.programs[name]
+            programs = dict(self.programs)
+            del programs[name]
+            self.programs = programs
             self._save_to_file("programs.pickle", self.programs)
     
     # Session operations
     def add_session(self, session: Session):
         """Add a session to the database"""
-        if session.date not in self.sessions:
-            self.sessions[session.date] = []
-        self.sessions[session.date].append(session)
+        self.sessions = {**self.sessions, session.date: self.sessions.get(session.date, []) + [session]}
         self._save_to_file("sessions.pickle", self.sessions)
     
     def get_sessions_by_date(self, date: str) -> List[Session]:
@@ -99,9 +131,11 @@ class Database:
     def delete_session(self, date: str, index: int):
         """Delete a session by date and index"""
         if date in self.sessions and 0 <= index < len(self.sessions[date]):
-            del self.sessions[date][index]
-            if not self.sessions[date]:  # Remove date key if no sessions left
-                del self.sessions[date]
+            sessions = dict(self.sessions)
+            sessions[date] = sessions[date][:index] + sessions[date][index + 1:]
+            if not sessions[date]:  # Remove date key if no sessions left
+                del sessions[date]
+            self.sessions = sessions
             self._save_to_file("sessions.pickle", self.sessions)
 
     # JSON func
@@ -20,7 +20,12 @@ class Query:
     def get_exercise_by_name(self, name: str) -> Optional[Exercise]:
         """Get a specific exercise by name"""
         return self.db.exercises.get(name)
-    
+
+    def get_exercises_by_names(self, names: List[str]) -> Dict[str, Optional[Exercise]]:
+        """Get many exercises by name at once, None for names that don't exist"""
+        exercises = self.db.exercises
+        return {name: exercises.get(name) for name in names}
+
     def get_exercises_by_target(self, target: str) -> List[dict]:
         """
         Get exercises that target a specific muscle or group
@@ -144,6 +149,25 @@ class Query:
             return [exercise.name for exercise, _ in program.exercises]
         return []
 
+    def get_program_exercise_details(self, program_name: str) -> Dict[str, Tuple[Exercise, Tuple[int, int]]]:
+        """
+        All exercises of a program with their rep ranges in one pass, for looking up
+        every row of a table (get_exercise_rep_range scans the program for each one)
+        Args:
+            program_name: Name of the program to query
+        Returns:
+            {lowercase exercise name: (Exercise, (min_reps, max_reps))},
+            empty if the program doesn't exist
+        """
+        program = self.get_program_by_name(program_name)
+        if not program:
+            return {}
+        details = {}
+        for exercise, rep_range in program.exercises:
+            # First one wins, like get_exercise_rep_range
+            details.setdefault(exercise.name.lower(), (exercise, rep_range))
+        return details
+
     
     def get_program_table_data(self, program_name: str) -> List[List]:
         """
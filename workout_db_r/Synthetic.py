@@ -0,0 +1,199 @@
+import random
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from workout_db_r.Exercise import Exercise
+from workout_db_r.Program import Program
+from workout_db_r.Session import Session
+from workout_db_r.Target import Target
+
+# name: (target, bodyweight, weight_inc, starting weight, rep range)
+# Ordered push / pull / legs, so 3 programs of 6 exercises split it into those days
+DEFAULT_EXERCISES = {
+    "Bench Press": ("Chest", False, 2.5, 50.0, (6, 10)),
+    "Incline Bench Press": ("Chest", False, 2.5, 40.0, (8, 12)),
+    "Overhead Press": ("Shoulders", False, 2.5, 30.0, (6, 10)),
+    "Lateral Raise": ("Shoulders", False, 1.0, 6.0, (12, 15)),
+    "Tricep Pushdown": ("Triceps", False, 1.25, 20.0, (10, 14)),
+    "Chest Dip": ("Chest", True, 0.0, 0.0, (8, 15)),
+    "Deadlift": ("Back", False, 5.0, 80.0, (3, 6)),
+    "Lat Pulldown": ("Back", False, 2.5, 45.0, (8, 12)),
+    "Seated Row": ("Back", False, 2.5, 40.0, (8, 12)),
+    "Bicep Curl": ("Biceps", False, 1.0, 10.0, (10, 14)),
+    "Hammer Curl": ("Biceps", False, 1.0, 10.0, (10, 14)),
+    "Wrist Curl": ("Forearms", False, 1.0, 8.0, (12, 20)),
+    "Squat": ("Quads", False, 5.0, 60.0, (5, 8)),
+    "Leg Press": ("Quads", False, 5.0, 100.0, (8, 12)),
+    "Romanian Deadlift": ("Hamstrings", False, 2.5, 50.0, (6, 10)),
+    "Hip Thrust": ("Glutes", False, 2.5, 60.0, (8, 12)),
+    "Calf Raise": ("Calves", False, 2.5, 40.0, (12, 20)),
+    "Sit Up": ("Abs", True, 0.0, 0.0, (15, 25)),
+}
+
+PROGRAM_NAMES = ["Push", "Pull", "Legs"]
+
+# Sizes used to measure loading, queries and plots at scale
+PRESETS = {
+    "1y": {"years": 1},
+    "5y": {"years": 5},
+    "20y": {"years": 20},
+}
+
+
+def build_exercises(count=len(DEFAULT_EXERCISES)):
+    """
+    Exercise catalog with count entries, spread over Target.MUSCLES.
+
+    Fewer than the default catalog takes its exercises muscle by muscle (round robin),
+    more adds numbered variations of every muscle.
+
+    Returns:
+        {name: (target, bodyweight, weight_inc, starting weight, rep range)}
+    """
+    if count == len(DEFAULT_EXERCISES):
+        return dict(DEFAULT_EXERCISES)
+    by_muscle = {muscle: [name for name, spec in DEFAULT_EXERCISES.items() if spec[0] == muscle]
+                 for muscle in Target.MUSCLES}
+    variations = {muscle: 0 for muscle in Target.MUSCLES}
+    catalog = {}
+    while len(catalog) < count:
+        for muscle in Target.MUSCLES:
+            if len(catalog) >= count:
+                break
+            if by_muscle[muscle]:
+                name = by_muscle[muscle].pop(0)
+                catalog[name] = DEFAULT_EXERCISES[name]
+            else:
+                variations[muscle] += 1
+                catalog[f"{muscle} Variation {variations[muscle]}"] = (muscle, False, 1.25, 20.0, (8, 12))
+    return catalog
+
+
+def generate_database(db, years=5, exercises=len(DEFAULT_EXERCISES), programs=3, exercises_per_program=6,
+                      sessions_per_week=3, sets=3, attendance=0.9, progression=0.6, deload_weeks=8,
+                      bodyweight=75.0, bodyweight_drift=0.5, end_date=None, seed=0):
+    """
+    Fill a database with a realistic synthetic training history (for measuring at scale).
+
+    Programs are trained in rotation on fixed weekdays. Every exercise uses double
+    progression: reps go up towards the top of the rep range (harder the further the
+    weight is above its start), then the weight goes up by weight_inc and reps start
+    over. Every deload_weeks comes a lighter week (90% of the working weight, no
+    progression). Bodyweight drifts by bodyweight_drift kg per year with daily noise.
+
+    Only the public add_exercise/add_program/add_session methods are used, so any
+    Database backend works. Backends with batch() get all writes in one save.
+    Meant for an empty database, existing data with the same names is overwritten.
+
+    Parameters:
+        db (Database): Database to write into
+        years (float): Length of the history
+        exercises (int): Number of exercises, spread over Target.MUSCLES
+        programs (int): Number of programs
+        exercises_per_program (int): Exercises in every program
+        sessions_per_week (int): Training days per week (1-7)
+        sets (int): Sets per exercise
+        attendance (float): Chance that a planned session happens (0-1)
+        progression (float): Chance to add a rep per session at the starting weight (0-1)
+        deload_weeks (int): Weeks between deload weeks (0 = never)
+        bodyweight (float): Bodyweight at the start of the history
+        bodyweight_drift (float): Bodyweight change per year in kg
+        end_date (datetime): Last day of the history (default: today, so "last N weeks" queries hit data)
+        seed (int): Random seed, the same arguments always give the same database
+
+    Returns:
+        Number of generated sessions
+    """
+    rng = random.Random(seed)
+    end_date = end_date or datetime.now()
+    catalog = build_exercises(exercises)
+    names = list(catalog)
+
+    with db.batch() if hasattr(db, "batch") else nullcontext():
+        exercise_objects = {}
+        for name, (target, is_bodyweight, inc, _, _) in catalog.items():
+            exercise_objects[name] = Exercise(name, target, is_bodyweight, inc)
+            db.add_exercise(exercise_objects[name])
+
+        program_objects = []
+        per_program = min(exercises_per_program, len(names))
+        for p in range(programs):
+            program = Program(PROGRAM_NAMES[p] if p < len(PROGRAM_NAMES) else f"Program {p + 1}")
+            for j in range(per_program):
+                name = names[(p * per_program + j) % len(names)]
+                program.add_exercise(exercise_objects[name], catalog[name][4])
+            db.add_program(program)
+            program_objects.append(program)
+
+        # Working weight and reps per exercise, progressed session by session
+        weights = {name: spec[3] for name, spec in catalog.items()}
+        reps = {name: spec[4][0] for name, spec in catalog.items()}
+        training_days = sorted(rng.sample(range(7), min(7, sessions_per_week)))
+
+        start_date = end_date - timedelta(days=int(years * 365))
+        day = start_date
+        count = 0
+        while day <= end_date:
+            elapsed = (day - start_date).days
+            deload = deload_weeks and elapsed // 7 % deload_weeks == deload_weeks - 1
+
+            if day.weekday() in training_days and rng.random() < attendance:
+                program = program_objects[count % len(program_objects)]
+                logged_bodyweight = round(bodyweight + bodyweight_drift * elapsed / 365 + rng.gauss(0, 0.4), 1)
+                session = Session(day.strftime("%d-%m-%Y"), logged_bodyweight, program)
+                for exercise, (min_reps, max_reps) in program.exercises:
+                    name = exercise.name
+                    session.add_exercise(exercise)
+                    weight = 0 if exercise.bodyweight else weights[name]
+                    if deload:
+                        weight = _round_to(weight * 0.9, exercise.weight_inc)
+                    for s in range(sets):
+                        # Fatigue: later sets lose a rep now and then
+                        session.add_set_to_exercise(name, weight, max(1, reps[name] - rng.randint(0, s)))
+
+                    if deload:
+                        continue
+                    if reps[name] >= max_reps and not exercise.bodyweight:
+                        weights[name] += exercise.weight_inc or 1.25
+                        reps[name] = min_reps
+                    else:
+                        # Diminishing returns, the heavier compared to the start the slower
+                        start = catalog[name][3]
+                        chance = progression if exercise.bodyweight else progression * (start / weights[name]) ** 2
+                        if rng.random() < chance:
+                            reps[name] = min(max_reps, reps[name] + 1)
+                db.add_session(session)
+                count += 1
+            day += timedelta(days=1)
+
+    return count
+
+
+def _round_to(value, step):
+    if not step:
+        return round(value, 2)
+    return round(round(value / step) * step, 2)
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    import argparse
+    from workout_db_r.Database import Database
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic workout database")
+    parser.add_argument("folder", help="Database folder to write (should be empty)")
+    parser.add_argument("--preset", choices=PRESETS, default="5y")
+    parser.add_argument("--exercises", type=int, default=len(DEFAULT_EXERCISES))
+    parser.add_argument("--programs", type=int, default=3)
+    parser.add_argument("--sessions-per-week", type=int, default=3)
+    parser.add_argument("--sets", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    db = Database(args.folder)
+    count = generate_database(db, exercises=args.exercises, programs=args.programs,
+                              sessions_per_week=args.sessions_per_week, sets=args.sets,
+                              seed=args.seed, **PRESETS[args.preset])
+    print(f"{count} sessions, {len(db.exercises)} exercises, {len(db.programs)} programs "
+          f"written to {db.data_dir} in {time.perf_counter() - start:.2f} s")